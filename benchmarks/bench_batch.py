@@ -0,0 +1,79 @@
+"""Benchmark the batch methods of BlockchainAPIs against a local stand-in server.
+
+We get the reserves of many pairs:
+- "sequential": one call to `reserves` after another, like a loop in a trading bot
+- "reserves_batch": a single call to `reserves_batch`, the requests are made concurrently
+
+The stand-in server waits `--latency` ms before answering each request to simulate
+the network and the processing time of the API. One pair out of ten doesn't exist, this
+way we verify that its exception is returned at its position without failing the batch.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_batch --pairs 500 --latency 2
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Tuple
+
+from benchmarks.mock_api import MISSING_TOKEN_PREFIX, MockAPIServer
+from input.BlockchainAPIs import BlockchainAPIs
+from input.exceptions import PairNotFoundException
+from input.utils import SessionConfig
+
+
+def get_pairs(count: int) -> List[Tuple[str, str, str, str | None]]:
+    ret = []
+    for i in range(count):
+        token0 = f"{MISSING_TOKEN_PREFIX}{i:036x}" if i % 10 == 9 else f"0x{i:040x}"
+        ret.append(("ethereum", token0, f"0x{i + 1:040x}", "uniswapv2_ethereum"))
+    return ret
+
+
+async def run(server: MockAPIServer, pair_count: int, max_concurrency: int, latency: float):
+    pairs = get_pairs(pair_count)
+    async with BlockchainAPIs(session_config=SessionConfig(base_url=server.url)) as blockchain_apis:
+        start = time.perf_counter()
+        sequential = []
+        for pair in pairs:
+            try:
+                sequential.append(await blockchain_apis.reserves(*pair))
+            except PairNotFoundException as e:
+                sequential.append(e)
+        sequential_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = await blockchain_apis.reserves_batch(pairs, max_concurrency)
+        batch_duration = time.perf_counter() - start
+
+    # The batch returns the same results in the same order
+    assert len(batch) == len(sequential)
+    for sequential_result, batch_result in zip(sequential, batch):
+        if isinstance(sequential_result, Exception):
+            assert isinstance(batch_result, PairNotFoundException)
+        else:
+            assert batch_result == sequential_result
+    errors = sum(isinstance(result, Exception) for result in batch)
+
+    print(f"{pair_count} pairs ({errors} not found), latency: {latency}ms")
+    print(f"sequential:     {sequential_duration * 1000:.1f}ms ({pair_count / sequential_duration:.0f} pairs/s)")
+    print(f"reserves_batch: {batch_duration * 1000:.1f}ms ({pair_count / batch_duration:.0f} pairs/s), "
+          f"max_concurrency: {max_concurrency}, speedup: {sequential_duration / batch_duration:.1f}x")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the batch methods of BlockchainAPIs")
+    parser.add_argument("--pairs", type=int, default=500, help="The amount of pairs of the batch")
+    parser.add_argument("--latency", type=float, default=2, help="The latency of the stand-in server in ms")
+    parser.add_argument("--max-concurrency", type=int, default=50, help="The max_concurrency given to the batch")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with MockAPIServer(latency=args.latency / 1000) as server:
+        asyncio.run(run(server, args.pairs, args.max_concurrency, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark the ResponseCache of the SDK against a local stand-in server.
+
+A trading bot gets the decimals of the tokens of each trade before converting the amounts
+with `get_token_decimal_form`. We get the decimals of `--calls` tokens picked among
+`--tokens` different tokens:
+- "no cache": each call is a request to the API
+- "cache": the decimals are requested once per token and then taken from the cache
+- "cache, concurrent": all of the calls are made at the same time on a new cache, the
+  identical requests are deduplicated
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_cache --calls 2000 --tokens 50 --latency 2
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Tuple
+
+from benchmarks.mock_api import MockAPIServer
+from input.BlockchainAPIs import BlockchainAPIs
+from input.BlockchainAPIsSync import BlockchainAPIsSync
+from input.utils import ResponseCache
+from input.utils import SessionConfig
+
+
+def get_tokens(calls: int, tokens: int) -> List[Tuple[str, str]]:
+    return [("ethereum", f"0x{i % tokens:040x}") for i in range(calls)]
+
+
+async def run_async(server: MockAPIServer, calls: List[Tuple[str, str]], cache: ResponseCache | None, concurrent: bool) -> float:
+    async with BlockchainAPIs(cache=cache, session_config=SessionConfig(base_url=server.url)) as blockchain_apis:
+        start = time.perf_counter()
+        if concurrent:
+            results = await asyncio.gather(*(blockchain_apis.decimals(*call) for call in calls))
+        else:
+            results = [await blockchain_apis.decimals(*call) for call in calls]
+        duration = time.perf_counter() - start
+    assert results == [18] * len(calls)
+    return duration
+
+
+def run_sync(server: MockAPIServer, calls: List[Tuple[str, str]], cache: ResponseCache | None) -> float:
+    with BlockchainAPIsSync(cache=cache) as blockchain_apis:
+        blockchain_apis._base_url = server.url
+        start = time.perf_counter()
+        results = [blockchain_apis.decimals(*call) for call in calls]
+        duration = time.perf_counter() - start
+    assert results == [18] * len(calls)
+    return duration
+
+
+def print_result(name: str, call_count: int, duration: float, server_requests: int, cache: ResponseCache | None):
+    stats = "" if cache is None else f", cache: {cache.get_stats()}"
+    print(f"{name:<26} {duration * 1000:8.1f}ms ({call_count / duration:.0f} calls/s), "
+          f"{server_requests} requests to the server{stats}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the ResponseCache of the SDK")
+    parser.add_argument("--calls", type=int, default=2000, help="The amount of calls to decimals")
+    parser.add_argument("--tokens", type=int, default=50, help="The amount of different tokens")
+    parser.add_argument("--latency", type=float, default=2, help="The latency of the stand-in server in ms")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    calls = get_tokens(args.calls, args.tokens)
+    print(f"{args.calls} calls to decimals on {args.tokens} tokens, latency: {args.latency}ms")
+    with MockAPIServer(latency=args.latency / 1000) as server:
+        for name, cache, concurrent in (("async, no cache", None, False),
+                                        ("async, cache", ResponseCache(), False),
+                                        ("async, cache, concurrent", ResponseCache(), True)):
+            request_count = server.request_count
+            duration = asyncio.run(run_async(server, calls, cache, concurrent))
+            print_result(name, len(calls), duration, server.request_count - request_count, cache)
+        for name, cache in (("sync, no cache", None), ("sync, cache", ResponseCache())):
+            request_count = server.request_count
+            duration = run_sync(server, calls, cache)
+            print_result(name, len(calls), duration, server.request_count - request_count, cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Microbenchmark of the columnar result mode of the SDK.
+
+For analytics, the reserves are converted to arrays. We compare:
+- "models then arrays": build the list of Reserve, then one array per field from the models
+- "columnar": `to_columns`, used by `reserves(..., columnar=True)`, builds the arrays
+  directly from the json response
+
+The reserves contain amounts bigger than 64 bits, we verify that they keep their exact value.
+The arrays are numpy arrays when numpy is installed, the "without numpy" results use
+the array module and lists.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_columnar --rows 10000
+"""
+import argparse
+import timeit
+from typing import Any, Dict, List
+
+from input.models import Reserve
+from input.utils import RESERVE_COLUMNS, to_columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def get_rows(count: int) -> List[Dict[str, Any]]:
+    return [{"blockchain": "ethereum", "exchange": "uniswapv2_ethereum", "token0": f"0x{i:040x}",
+             "token1": f"0x{i + 1:040x}", "reserve0": 10 ** 24 + i, "reserve1": 117592619550992960 + i}
+            for i in range(count)]
+
+
+def models_then_arrays(rows: List[Dict[str, Any]], use_numpy: bool) -> Dict[str, Any]:
+    """What a caller does without the columnar mode"""
+    reserves = [
+        Reserve(
+            blockchain=r["blockchain"],
+            exchange=r["exchange"],
+            token0=r["token0"],
+            token1=r["token1"],
+            reserve0=r["reserve0"],
+            reserve1=r["reserve1"]
+        )
+        for r in rows
+    ]
+    return to_columns([{name: getattr(reserve, name) for name in RESERVE_COLUMNS} for reserve in reserves],
+                      RESERVE_COLUMNS, use_numpy)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Microbenchmark of the columnar result mode of the SDK")
+    parser.add_argument("--rows", type=int, default=10000, help="The amount of reserves of the response")
+    parser.add_argument("--number", type=int, default=10, help="The amount of calls of each measure")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rows = get_rows(args.rows)
+    modes = [False] if numpy is None else [True, False]
+    print(f"{args.rows} reserves")
+    for use_numpy in modes:
+        columns = to_columns(rows, RESERVE_COLUMNS, use_numpy)
+        # The amounts keep their exact value
+        assert list(columns["reserve0"]) == [row["reserve0"] for row in rows]
+        assert all(type(value) is int for value in columns["reserve0"])
+        for name, function in (("models then arrays", lambda: models_then_arrays(rows, use_numpy)),
+                               ("columnar", lambda: to_columns(rows, RESERVE_COLUMNS, use_numpy))):
+            duration = min(timeit.repeat(function, number=args.number, repeat=5)) / args.number
+            print(f"{'numpy' if use_numpy else 'without numpy':<14} {name:<20} {duration * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
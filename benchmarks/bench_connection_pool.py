@@ -0,0 +1,93 @@
+"""Benchmark the connection pool of BlockchainAPIs against a local stand-in server.
+
+A bot often creates one BlockchainAPIs instance per strategy (or per API key). Each
+instance has its own session, so each one opens its own connections to the API.
+With a shared session (SessionConfig().create_session() given to each instance),
+the instances reuse the same kept alive connections.
+
+`--instances` instances each send `--requests` concurrent reserves requests, with
+their own sessions, then with one shared session. The amount of connections opened
+and the requests that waited for a free connection are printed for each scenario,
+and for a shared session with a small `--small-limit` connector limit.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_connection_pool --instances 20 --requests 50 --latency 2
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from benchmarks.mock_api import MockAPIServer
+from input.BlockchainAPIs import BlockchainAPIs
+from input.utils import PoolMetrics, SessionConfig
+
+
+async def _send_requests(blockchain_apis: BlockchainAPIs, requests: int, rounds: int):
+    for _ in range(rounds):
+        await asyncio.gather(*(blockchain_apis.reserves("ethereum", f"0x{i:040x}", f"0x{i + 1:040x}")
+                               for i in range(requests)))
+
+
+async def run_own_sessions(server: MockAPIServer, instances: int, requests: int, rounds: int) -> Dict[str, float]:
+    all_blockchain_apis: List[BlockchainAPIs] = [BlockchainAPIs(session_config=SessionConfig(base_url=server.url))
+                                                 for _ in range(instances)]
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(_send_requests(blockchain_apis, requests, rounds) for blockchain_apis in all_blockchain_apis))
+        duration = time.perf_counter() - start
+        stats = [blockchain_apis.get_stats() for blockchain_apis in all_blockchain_apis]
+    finally:
+        for blockchain_apis in all_blockchain_apis:
+            await blockchain_apis.close()
+    return {
+        "duration": duration,
+        "created": sum(stat["pool_created"] for stat in stats),
+        "queued": sum(stat["pool_queued"] for stat in stats)
+    }
+
+
+async def run_shared_session(server: MockAPIServer, instances: int, requests: int, rounds: int, limit: int) -> Dict[str, float]:
+    pool_metrics = PoolMetrics()
+    async with SessionConfig(base_url=server.url, limit=limit).create_session(pool_metrics) as session:
+        all_blockchain_apis = [BlockchainAPIs(session=session) for _ in range(instances)]
+        start = time.perf_counter()
+        await asyncio.gather(*(_send_requests(blockchain_apis, requests, rounds) for blockchain_apis in all_blockchain_apis))
+        duration = time.perf_counter() - start
+        # The instances don't close the shared session
+        for blockchain_apis in all_blockchain_apis:
+            await blockchain_apis.close()
+        assert not session.closed
+    return {"duration": duration, "created": pool_metrics.created, "queued": pool_metrics.queued}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the connection pool of BlockchainAPIs")
+    parser.add_argument("--instances", type=int, default=20, help="The amount of BlockchainAPIs instances")
+    parser.add_argument("--requests", type=int, default=50, help="The amount of concurrent requests of each instance")
+    parser.add_argument("--rounds", type=int, default=3, help="The amount of times that each instance sends its requests")
+    parser.add_argument("--small-limit", type=int, default=20, help="The connector limit of the last scenario")
+    parser.add_argument("--latency", type=float, default=2, help="The latency of the stand-in server in ms")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"{args.instances} instances x {args.rounds} rounds of {args.requests} concurrent requests, "
+          f"latency: {args.latency}ms")
+    with MockAPIServer(latency=args.latency / 1000) as server:
+        scenarios = (
+            ("own sessions", lambda: run_own_sessions(server, args.instances, args.requests, args.rounds)),
+            ("shared session", lambda: run_shared_session(server, args.instances, args.requests, args.rounds,
+                                                          SessionConfig.limit)),
+            (f"shared, limit={args.small_limit}", lambda: run_shared_session(server, args.instances, args.requests,
+                                                                           args.rounds, args.small_limit))
+        )
+        for name, run in scenarios:
+            result = asyncio.run(run())
+            print(f"{name:<20} {result['duration'] * 1000:8.1f}ms, {result['created']} connections opened, "
+                  f"{result['queued']} requests queued")
+
+
+if __name__ == "__main__":
+    main()
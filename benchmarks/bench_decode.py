@@ -0,0 +1,67 @@
+"""Microbenchmark of the decoding of the paginated responses of the SDK.
+
+We decode a page of pairs and of tokens (in the format of the API) and build its models:
+- the json decoders: the json module, and the default decoder of the SDK (orjson or
+  ujson if one of them is installed)
+- the models: built eagerly (a list of Pair) or lazily (a LazySequence), when the whole
+  page is used and when only its first 10 elements are used
+
+No server is needed, the content of the responses comes from the stand-in server.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_decode --page-size 1000
+"""
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+from benchmarks import mock_api
+from input.BlockchainAPIs import BlockchainAPIs
+from input.utils import get_default_json_loads, to_pair, to_token
+
+
+def measure(function: Callable[[], Any], number: int) -> float:
+    """Get the best time of a call to the function in µs"""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1_000_000
+
+
+def bench_page(name: str, content: bytes, build: Callable[[Dict[str, Any]], Any], number: int):
+    default_loads = get_default_json_loads()
+    # The decoders give the same result
+    assert default_loads(content) == json.loads(content)
+    raw = json.loads(content)["data"]
+    eager = BlockchainAPIs._get_models
+    eager_apis, lazy_apis = object.__new__(BlockchainAPIs), object.__new__(BlockchainAPIs)
+    eager_apis._lazy_models, lazy_apis._lazy_models = False, True
+    assert eager(lazy_apis, raw, build) == eager(eager_apis, raw, build)
+
+    results = {
+        "json.loads": measure(lambda: json.loads(content), number),
+        "default loads": measure(lambda: default_loads(content), number),
+        "eager models": measure(lambda: eager(eager_apis, raw, build), number),
+        "lazy models, all": measure(lambda: list(eager(lazy_apis, raw, build)), number),
+        "lazy models, first 10": measure(lambda: eager(lazy_apis, raw, build)[:10], number),
+    }
+    print(f"{name} ({len(raw)} elements, {len(content)} bytes)")
+    for step, duration in results.items():
+        print(f"    {step:<22} {duration:10.1f}µs")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Microbenchmark of the decoding of the paginated responses of the SDK")
+    parser.add_argument("--page-size", type=int, default=1000, help="The amount of elements of each page")
+    parser.add_argument("--number", type=int, default=20, help="The amount of calls of each measure")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    mock_api.PAGE_SIZE = args.page_size
+    for name, path, build in (("pairs", "/v0/exchanges/pairs", to_pair), ("tokens", "/v0/tokens/", to_token)):
+        _, content = mock_api._get_response(path, {"page": "1"})
+        bench_page(name, json.dumps(content).encode(), build, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark the memory used by the parsed project (the intermediate representation).
+
+A synthetic SDK is generated and parsed (see `generate_sdk.py`), then the same project
+is built three times from its JSONL IR and the memory kept by each one is measured
+with tracemalloc:
+- plain: dataclasses with a `__dict__` per instance and a copy of each string, like
+  the IR before it used slots
+- slots: the dataclasses of the IR (with `__slots__`), without interning the strings
+- slots + interned: `read_project_ir`, which also interns the types and the names
+  of the attributes and parameters (what the parsers do)
+
+Usage (from the root of the repository):
+python -m benchmarks.bench_ir_memory --size 10000
+"""
+import argparse
+from dataclasses import fields, make_dataclass
+import gc
+import io
+import os
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from benchmarks.generate_sdk import generate_sdk
+from src.dataclasses.Attribute import Attribute
+from src.dataclasses.ExceptionModel import ExceptionModel
+from src.dataclasses.Model import Model
+from src.dataclasses.ModuleInit import ModuleInit
+from src.dataclasses.Project import Project
+from src.dataclasses.main_class.MainClass import MainClass
+from src.dataclasses.main_class.MainClassMethod import MainClassMethod
+from src.dataclasses.main_class.MethodException import MethodException
+from src.dataclasses.main_class.MethodParameter import MethodParameter
+from src.ir.ProjectIR import iter_ir_records, read_project_ir, write_project_ir
+from src.parser.ProjectParser import ProjectParser
+
+
+NESTED_CLASSES = {
+    Project: {"main_classes": MainClass, "init_doc": ModuleInit, "models": Model, "exceptions": ExceptionModel},
+    MainClass: {"methods": MainClassMethod},
+    MainClassMethod: {"parameters": MethodParameter, "exceptions": MethodException},
+    Model: {"attributes": Attribute},
+    ExceptionModel: {"attributes": Attribute}
+}
+"""For each dataclass, the dataclass of the elements of its list (or dict) fields
+"""
+
+PLAIN_CLASSES = {cls: make_dataclass(cls.__name__, [f.name for f in fields(cls)])
+                 for cls in (Project, MainClass, MainClassMethod, MethodParameter, MethodException,
+                             Model, ExceptionModel, Attribute, ModuleInit)}
+"""The same dataclasses without slots
+"""
+
+
+def build(cls: type, data: Dict[str, Any], get_class: Callable[[type], type]) -> Any:
+    """Build a dataclass and its nested dataclasses from its dictionary, without interning
+
+    :param cls: The dataclass of the IR
+    :type cls: type
+    :param data: The dictionary created by `dataclasses.asdict`
+    :type data: Dict[str, Any]
+    :param get_class: Give the class that is built for a dataclass of the IR
+    :type get_class: Callable[[type], type]
+    :return: The built instance
+    :rtype: Any
+    """
+    kwargs = dict(data)
+    for name, nested_cls in NESTED_CLASSES.get(cls, {}).items():
+        value = data[name]
+        if isinstance(value, dict):
+            kwargs[name] = {key: build(nested_cls, element, get_class) for key, element in value.items()}
+        else:
+            kwargs[name] = [build(nested_cls, element, get_class) for element in value]
+    return get_class(cls)(**kwargs)
+
+
+def get_project_data(ir: str) -> Dict[str, Any]:
+    """Group the records of the IR into the dictionary of the project, like `dataclasses.asdict`
+
+    :param ir: The JSONL IR of the project
+    :type ir: str
+    :return: The dictionary of the project
+    :rtype: Dict[str, Any]
+    """
+    # Each string of the decoded json is a new object, like the strings created by the parsers
+    project_data: Dict[str, Any] = {"main_classes": [], "init_doc": {}, "models": [], "exceptions": []}
+    for record in iter_ir_records(io.StringIO(ir)):
+        match record["kind"]:
+            case "main_class":
+                project_data["main_classes"].append({**record["entity"], "methods": []})
+            case "method":
+                project_data["main_classes"][-1]["methods"].append(record["entity"])
+            case "init":
+                project_data["init_doc"][record["module"]] = record["entity"]
+            case "model" | "exception":
+                project_data[f"{record['kind']}s"].append(record["entity"])
+    return project_data
+
+
+def measure(ir: str, load_project: Callable[[str], Any]) -> int:
+    """Measure the memory kept by a project built from the IR
+
+    :param ir: The JSONL IR of the project
+    :type ir: str
+    :param load_project: Build the project from the IR
+    :type load_project: Callable[[str], Any]
+    :return: The amount of bytes allocated by the project (and its strings)
+    :rtype: int
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    project = load_project(ir)
+    gc.collect()
+    ret = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del project
+    return ret
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the memory used by the parsed project")
+    parser.add_argument("--size", type=int, default=10000, help="The amount of methods, models and exceptions of the SDK")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sdk_path = os.path.join(tmp_dir, "sdk")
+        generate_sdk(sdk_path, args.size)
+        project = ProjectParser().parse_project(sdk_path)
+    attribute_count = sum(len(model.attributes) for model in project.models + project.exceptions)
+    parameter_count = sum(len(method.parameters) for main_class in project.main_classes for method in main_class.methods)
+    f = io.StringIO()
+    write_project_ir(project, f)
+    ir = f.getvalue()
+    del project
+
+    print(f"size: {args.size}, {attribute_count} attributes, {parameter_count} parameters")
+    scenarios = (
+        ("plain", lambda ir: build(Project, get_project_data(ir), PLAIN_CLASSES.__getitem__)),
+        ("slots", lambda ir: build(Project, get_project_data(ir), lambda cls: cls)),
+        ("slots + interned", lambda ir: read_project_ir(io.StringIO(ir)))
+    )
+    plain_size = None
+    for name, load_project in scenarios:
+        size = measure(ir, load_project)
+        plain_size = size if plain_size is None else plain_size
+        print(f"{name:<18} {size / 1024 / 1024:8.2f}MB ({size / plain_size:.0%} of plain)")
+
+
+if __name__ == "__main__":
+    main()
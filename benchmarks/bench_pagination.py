@@ -0,0 +1,68 @@
+"""Benchmark the pagination iterators of BlockchainAPIs against a local stand-in server.
+
+We get all of the tokens:
+- "page by page": one call to `tokens` after another until the last page
+- "iter_tokens": the iterator that fetches the next pages concurrently
+
+The stand-in server waits `--latency` ms before answering each request to simulate
+the network and the processing time of the API. We also measure the time before the
+first token, the iterator gives the tokens of a page as soon as it arrives.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_pagination --latency 20 --prefetch 8
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks import mock_api
+from benchmarks.mock_api import MockAPIServer
+from input.BlockchainAPIs import BlockchainAPIs
+from input.utils import SessionConfig
+
+
+async def run(server: MockAPIServer, prefetch: int, latency: float):
+    async with BlockchainAPIs(session_config=SessionConfig(base_url=server.url)) as blockchain_apis:
+        start = time.perf_counter()
+        page_by_page = []
+        page = await blockchain_apis.tokens(page=1)
+        page_by_page.extend(page.data)
+        for page_number in range(2, page.total_pages + 1):
+            page_by_page.extend((await blockchain_apis.tokens(page=page_number)).data)
+        page_by_page_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_token_duration = None
+        iterated = []
+        async for token in blockchain_apis.iter_tokens(prefetch=prefetch):
+            if first_token_duration is None:
+                first_token_duration = time.perf_counter() - start
+            iterated.append(token)
+        iterator_duration = time.perf_counter() - start
+
+    # The iterator gives the same tokens in the same order
+    assert iterated == page_by_page
+
+    print(f"{len(iterated)} tokens in {mock_api.TOTAL_PAGES} pages, latency: {latency}ms")
+    print(f"page by page: {page_by_page_duration * 1000:.1f}ms")
+    print(f"iter_tokens:  {iterator_duration * 1000:.1f}ms (first token after {first_token_duration * 1000:.1f}ms), "
+          f"prefetch: {prefetch}, speedup: {page_by_page_duration / iterator_duration:.1f}x")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the pagination iterators of BlockchainAPIs")
+    parser.add_argument("--pages", type=int, default=174, help="The amount of pages returned by the stand-in server")
+    parser.add_argument("--latency", type=float, default=20, help="The latency of the stand-in server in ms")
+    parser.add_argument("--prefetch", type=int, default=8, help="The prefetch given to the iterator")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    mock_api.TOTAL_PAGES = args.pages
+    with MockAPIServer(latency=args.latency / 1000) as server:
+        asyncio.run(run(server, args.prefetch, args.latency))
+
+
+if __name__ == "__main__":
+    main()
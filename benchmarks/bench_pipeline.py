@@ -0,0 +1,194 @@
+"""Benchmark the parse -> write pipeline on synthetic SDKs.
+
+For each size, a synthetic SDK is generated (see `generate_sdk.py`) and we time:
+- Each FileParser subclass on the files that it parses
+- `ProjectParser.parse_project` on the whole SDK
+- `Writer.write` of the parsed project
+
+Each size is measured inside of its own process so that the peak RSS of a size
+is not hidden by the peak RSS of a bigger one. The results are written to a JSON
+file that can be compared between two commits.
+
+Usage (from the root of the repository):
+python -m benchmarks.bench_pipeline --sizes 10 100 1000 10000 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+try:
+    import resource
+except ImportError:
+    # The resource module is not available on Windows
+    resource = None
+
+from benchmarks.generate_sdk import generate_sdk
+from src.parser.EntityExtractor import EntityExtractor
+from src.parser.ExceptionParser import ExceptionParser
+from src.parser.InitParser import InitParser
+from src.parser.MainClassParser import MainClassParser
+from src.parser.ModelParser import ModelParser
+from src.parser.ProjectParser import ProjectParser
+from src.writer.Writer import Writer
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+"""The default amount of methods, models and exceptions of the generated SDKs
+"""
+
+
+def get_peak_rss_kb() -> int | None:
+    """Get the peak resident set size of the current process
+
+    :return: The peak RSS in KB, or None if it can't be measured on this platform
+    :rtype: int | None
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KB on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure(function: Callable[[], Any], file_count: int, repeat: int) -> Dict[str, Any]:
+    """Call the given function `repeat` times and keep the best wall time
+
+    :param function: The function that we measure
+    :type function: Callable[[], Any]
+    :param file_count: The amount of files (or pages) handled by one call
+    :type file_count: int
+    :param repeat: The amount of calls
+    :type repeat: int
+    :return: The wall time, the files/sec and the peak RSS after the calls
+    :rtype: Dict[str, Any]
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return {
+        "files": file_count,
+        "wall_time_s": round(best, 6),
+        "files_per_s": round(file_count / best, 1) if best > 0 else None,
+        "peak_rss_kb": get_peak_rss_kb()
+    }
+
+
+def list_python_files(folder: str) -> List[str]:
+    return sorted(os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".py") and f != "__init__.py")
+
+
+def run_size(size: int, work_dir: str, repeat: int) -> Dict[str, Any]:
+    """Generate a synthetic SDK of the given size and measure each step of the pipeline
+
+    :param size: The amount of methods, models and exceptions
+    :type size: int
+    :param work_dir: The folder in which the SDK and the documentation are written
+    :type work_dir: str
+    :param repeat: The amount of times that each step is measured
+    :type repeat: int
+    :return: The measures of each step
+    :rtype: Dict[str, Any]
+    """
+    sdk_folder = os.path.join(work_dir, f"sdk-{size}")
+    generate_sdk(sdk_folder, size)
+    main_files = list_python_files(sdk_folder)
+    model_files = list_python_files(os.path.join(sdk_folder, "models"))
+    exception_files = list_python_files(os.path.join(sdk_folder, "exceptions"))
+    init_files = [os.path.join(sdk_folder, "models", "__init__.py"), os.path.join(sdk_folder, "exceptions", "__init__.py")]
+
+    ret = {"size": size, "steps": {}}
+    for parser, files in ((MainClassParser(), main_files),
+                          (ModelParser(), model_files),
+                          (ExceptionParser(), exception_files),
+                          (InitParser(), init_files),
+                          (EntityExtractor(), main_files + model_files + exception_files)):
+        ret["steps"][type(parser).__name__] = measure(lambda: [parser.parse_file(f) for f in files], len(files), repeat)
+
+    file_count = len(main_files) + len(model_files) + len(exception_files) + len(init_files)
+    project_parser = ProjectParser()
+    ret["steps"]["ProjectParser.parse_project"] = measure(lambda: project_parser.parse_project(sdk_folder), file_count, repeat)
+
+    project = project_parser.parse_project(sdk_folder)
+    dest_folders = []
+
+    def write():
+        dest_folder = os.path.join(work_dir, f"dest-{size}-{len(dest_folders)}")
+        dest_folders.append(dest_folder)
+        return Writer(dest_folder).write(project)
+
+    page_count = len(write())
+    ret["steps"]["Writer.write"] = measure(write, page_count, repeat)
+    ret["peak_rss_kb"] = get_peak_rss_kb()
+    return ret
+
+
+def run_size_in_subprocess(size: int, work_dir: str, repeat: int) -> Dict[str, Any]:
+    output = subprocess.run([sys.executable, "-m", "benchmarks.bench_pipeline",
+                             "--run-size", str(size),
+                             "--work-dir", work_dir,
+                             "--repeat", str(repeat)],
+                            check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def get_commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the parse -> write pipeline on synthetic SDKs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="The amount of methods, models and exceptions of each generated SDK")
+    parser.add_argument("--repeat", type=int, default=3, help="The amount of times that each step is measured, the best time is kept")
+    parser.add_argument("--work-dir", help="The folder in which the SDKs and the documentation are generated. "
+                                           "A temporary folder is used by default")
+    parser.add_argument("--output", default="bench.json", help="The JSON file in which the results are written")
+    parser.add_argument("--run-size", type=int, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.run_size is not None:
+        # Inside of the subprocess of a size
+        print(json.dumps(run_size(args.run_size, args.work_dir, args.repeat)))
+        return
+
+    work_dir = tempfile.mkdtemp(prefix="sphinxusaurus-bench-", dir=args.work_dir)
+    try:
+        results = []
+        for size in args.sizes:
+            result = run_size_in_subprocess(size, work_dir, args.repeat)
+            results.append(result)
+            steps = ", ".join(f"{name}: {step['wall_time_s'] * 1000:.1f}ms" for name, step in result["steps"].items())
+            print(f"size {size}: {steps}, peak RSS: {result['peak_rss_kb']}KB")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "commit": get_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results
+        }, f, indent=4)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
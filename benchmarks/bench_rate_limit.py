@@ -0,0 +1,67 @@
+"""Benchmark the rate limiter and the backoff of BlockchainAPIs against a rate limited stand-in server.
+
+A trading bot asks for `--quotes` quotes concurrently to a server that accepts `--server-rate`
+requests per second:
+- "no limiter, no retry": the requests above the limit fail with a TooManyRequestsException
+- "no limiter, backoff": the rejected requests are retried after a jittered exponential backoff
+- "limiter": the client keeps under the limit of the server, the requests wait in the limiter
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_rate_limit --quotes 600 --server-rate 200
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.mock_api import MockAPIServer
+from input.BlockchainAPIs import BlockchainAPIs
+from input.exceptions import TooManyRequestsException
+from input.utils import SessionConfig
+
+
+async def run(server: MockAPIServer, quotes: int, rate_limit: float | None, max_rate_limit_retries: int):
+    # Each scenario uses its own API key, this way the limiters are not shared
+    async with BlockchainAPIs(api_key=f"bench-{rate_limit}-{max_rate_limit_retries}", rate_limit=rate_limit,
+                              max_rate_limit_retries=max_rate_limit_retries,
+                              session_config=SessionConfig(base_url=server.url)) as blockchain_apis:
+        # Wait for the bucket of the server to be full again after the previous scenario
+        await asyncio.sleep(1)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(blockchain_apis.amount_out("ethereum", f"0x{i:040x}", f"0x{i + 1:040x}", 10 ** 18)
+                                         for i in range(quotes)), return_exceptions=True)
+        duration = time.perf_counter() - start
+        stats = blockchain_apis.get_stats()
+    failed = sum(isinstance(result, TooManyRequestsException) for result in results)
+    return duration, failed, stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the rate limiter and the backoff of BlockchainAPIs")
+    parser.add_argument("--quotes", type=int, default=600, help="The amount of quotes asked concurrently")
+    parser.add_argument("--server-rate", type=float, default=200, help="The rate limit of the stand-in server in requests/s")
+    parser.add_argument("--latency", type=float, default=2, help="The latency of the stand-in server in ms")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"{args.quotes} concurrent quotes, server limit: {args.server_rate} requests/s, latency: {args.latency}ms")
+    with MockAPIServer(latency=args.latency / 1000, rate_limit=args.server_rate) as server:
+        # The client limit is a bit under the limit of the server
+        for name, rate_limit, retries in (("no limiter, no retry", None, 0),
+                                          ("no limiter, backoff", None, 10),
+                                          ("limiter", args.server_rate * 0.95, 3)):
+            request_count, rate_limited_count = server.request_count, server.rate_limited_count
+            duration, failed, stats = asyncio.run(run(server, args.quotes, rate_limit, retries))
+            wait = ""
+            if rate_limit is not None:
+                wait = (f", waited: {stats['rate_limiter_waited']}, mean wait: "
+                        f"{stats['rate_limiter_total_wait_ms'] / max(stats['rate_limiter_acquired'], 1):.1f}ms, "
+                        f"max wait: {stats['rate_limiter_max_wait_ms']:.1f}ms")
+            print(f"{name:<22} {duration * 1000:8.1f}ms, failed: {failed}, "
+                  f"requests: {server.request_count - request_count} "
+                  f"(rejected: {server.rate_limited_count - rate_limited_count}), retries: {stats['rate_limit_retries']}{wait}")
+
+
+if __name__ == "__main__":
+    main()
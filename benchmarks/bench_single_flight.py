@@ -0,0 +1,67 @@
+"""Benchmark the coalescing of the identical requests of BlockchainAPIs against a local stand-in server.
+
+Many coroutines of a trading bot ask for the same amount_out quotes at the same moment:
+`--coroutines` coroutines each ask for the `--quotes` same quotes concurrently. Without
+coalescing, each coroutine sends its own requests. With it, only one request per quote is
+sent and the other coroutines share its response.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_single_flight --coroutines 50 --quotes 10 --latency 2
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.mock_api import MockAPIServer
+from input.BlockchainAPIs import BlockchainAPIs
+from input.utils import SessionConfig
+
+
+class _NoSingleFlight:
+    """Make each call, like before the coalescing of the requests"""
+
+    calls = 0
+    deduplicated = 0
+
+    async def do_async(self, key, call):
+        return await call()
+
+
+async def run(server: MockAPIServer, coroutines: int, quotes: int, coalesce: bool) -> float:
+    async with BlockchainAPIs(session_config=SessionConfig(base_url=server.url)) as blockchain_apis:
+        if not coalesce:
+            blockchain_apis._single_flight = _NoSingleFlight()
+
+        async def get_quotes():
+            return [await blockchain_apis.amount_out("ethereum", f"0x{i:040x}", f"0x{i + 1:040x}", 10 ** 18)
+                    for i in range(quotes)]
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(get_quotes() for _ in range(coroutines)))
+        duration = time.perf_counter() - start
+        stats = blockchain_apis.get_stats()
+    assert all(result == results[0] for result in results)
+    return duration, stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the coalescing of the identical requests of BlockchainAPIs")
+    parser.add_argument("--coroutines", type=int, default=50, help="The amount of coroutines that ask for the quotes")
+    parser.add_argument("--quotes", type=int, default=10, help="The amount of quotes asked by each coroutine")
+    parser.add_argument("--latency", type=float, default=2, help="The latency of the stand-in server in ms")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"{args.coroutines} coroutines x {args.quotes} identical quotes, latency: {args.latency}ms")
+    with MockAPIServer(latency=args.latency / 1000) as server:
+        for name, coalesce in (("without coalescing", False), ("with coalescing", True)):
+            request_count = server.request_count
+            duration, stats = asyncio.run(run(server, args.coroutines, args.quotes, coalesce))
+            print(f"{name:<20} {duration * 1000:8.1f}ms, {server.request_count - request_count} requests to the server, "
+                  f"deduplicated: {stats['deduplicated_requests']}")
+
+
+if __name__ == "__main__":
+    main()
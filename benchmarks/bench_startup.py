@@ -0,0 +1,122 @@
+"""Benchmark the startup time of the command line.
+
+The entry point only imports argparse and the choices of its options, the parsers and
+the writer (with docstring_parser, ast, the process pool and the dataclasses) are
+imported by the subcommand that uses them. This benchmark keeps it that way.
+
+`python -X importtime -c "import main"` is run `--runs` times in a new interpreter,
+the median cumulative import time of main is compared to `--budget` (in ms) and the
+modules that must not be imported at startup are looked for in its output. The wall
+time of `main.py --help` is printed next to the one of an empty interpreter.
+
+The exit code is 1 when the budget is exceeded or when a heavy module is imported,
+this way it can run in CI.
+
+Usage (from the root of the repository):
+python -m benchmarks.bench_startup --runs 20 --budget 15
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+
+HEAVY_MODULES = (
+    "docstring_parser",
+    "concurrent.futures.process",
+    "src.parser.ProjectParser",
+    "src.writer.Writer",
+    "src.dataclasses.Project",
+)
+"""The modules that are only imported by a subcommand, not by the entry point
+"""
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """Parse the output of `-X importtime`
+
+    :param output: The standard error of the interpreter
+    :type output: str
+    :return: For each imported module, its cumulative import time in microseconds
+    :rtype: Dict[str, int]
+    """
+    ret = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is not None:
+            ret[match.group(4)] = int(match.group(2))
+    return ret
+
+
+def measure_import(runs: int) -> Tuple[List[float], Dict[str, int]]:
+    """Import main in a new interpreter `runs` times
+
+    :param runs: The amount of interpreters started
+    :type runs: int
+    :return: The cumulative import time of main of each run in ms, and the modules
+             imported by the last run
+    :rtype: Tuple[List[float], Dict[str, int]]
+    """
+    times = []
+    modules = {}
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                                   capture_output=True, text=True, check=True)
+        modules = parse_importtime(completed.stderr)
+        times.append(modules["main"] / 1000)
+    return times, modules
+
+
+def measure_wall(command: List[str], runs: int) -> float:
+    """Get the median wall time of a command
+
+    :param command: The command, started `runs` times
+    :type command: List[str]
+    :param runs: The amount of runs
+    :type runs: int
+    :return: The median wall time in ms
+    :rtype: float
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the startup time of the command line")
+    parser.add_argument("--runs", type=int, default=20, help="The amount of interpreters started for each measure")
+    parser.add_argument("--budget", type=float, default=15, help="The maximum median import time of main in ms")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    import_times, modules = measure_import(args.runs)
+    median_import = statistics.median(import_times)
+    print(f"import main: median {median_import:.2f}ms, min {min(import_times):.2f}ms, "
+          f"max {max(import_times):.2f}ms ({args.runs} runs, budget {args.budget:.2f}ms)")
+
+    empty_wall = measure_wall([sys.executable, "-c", "pass"], args.runs)
+    help_wall = measure_wall([sys.executable, "main.py", "--help"], args.runs)
+    print(f"python -c pass: {empty_wall:.1f}ms, main.py --help: {help_wall:.1f}ms "
+          f"(+{help_wall - empty_wall:.1f}ms)")
+
+    heavy_modules = [name for name in HEAVY_MODULES if name in modules]
+    for name in heavy_modules:
+        print(f"Error: {name} is imported at startup ({modules[name] / 1000:.2f}ms)")
+    if median_import > args.budget:
+        print("Error: the import time of main is above the budget")
+    if heavy_modules or median_import > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the per-call latency of BlockchainAPIsSync against a local stand-in server.
+
+We compare:
+- "per-call connection": a new connection for each call, like `requests.get`
+- "pooled session": the session of BlockchainAPIsSync that keeps the connection alive
+
+The stand-in server uses plain HTTP, so the saving measured here only includes the TCP
+handshake. Against the real API, each new connection also needs a TLS handshake and
+the saving is bigger.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_sync_client --calls 2000
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import requests
+
+from benchmarks.mock_api import MockAPIServer
+from input.BlockchainAPIsSync import BlockchainAPIsSync
+
+
+def measure_calls(call: Callable[[], object], calls: int) -> Dict[str, float]:
+    """Call the given function `calls` times and get the latency of the calls
+
+    :param call: The function that makes one API call
+    :type call: Callable[[], object]
+    :param calls: The amount of calls
+    :type calls: int
+    :return: The mean, median and 99th percentile latencies in ms and the calls/sec
+    :rtype: Dict[str, float]
+    """
+    # Warm up (first connection, imports...)
+    call()
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        call_start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    duration = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "mean_ms": round(statistics.fmean(latencies), 4),
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 4),
+        "calls_per_s": round(calls / duration, 1)
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the pooled session of BlockchainAPIsSync")
+    parser.add_argument("--calls", type=int, default=2000, help="The amount of calls of each scenario")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = {}
+    with MockAPIServer() as server:
+        url = f"{server.url}/v0/blockchains/"
+        headers = {"accept": "application/json"}
+        results["per-call connection"] = measure_calls(lambda: requests.get(url, headers=headers).json(), args.calls)
+
+        with BlockchainAPIsSync() as blockchain_apis:
+            blockchain_apis._base_url = server.url
+            results["pooled session"] = measure_calls(blockchain_apis.blockchains, args.calls)
+
+    for name, result in results.items():
+        print(f"{name:<22} mean: {result['mean_ms']:.3f}ms, p50: {result['p50_ms']:.3f}ms, "
+              f"p99: {result['p99_ms']:.3f}ms, {result['calls_per_s']} calls/s")
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark of the batch conversions of the amounts of tokens of the SDK.
+
+Before measuring, we verify with random inputs (a property check) that the batch
+functions give exactly the same results as the scalar ones, or raise the same
+exceptions: random amounts and decimals, shared or per-item decimals, amounts that
+end with zeros, negative amounts, invalid strings and numpy arrays when numpy is installed.
+
+Then we convert `--amounts` amounts (and back) one by one with the scalar functions
+and at once with the batch functions.
+
+Usage (from the root of the repository, with the dependencies of the SDK installed):
+python -m benchmarks.bench_token_amounts --amounts 20000 --checks 2000
+"""
+import argparse
+import random
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from input.utils import (get_token_decimal_form, get_token_decimal_forms, get_token_unsigned_form,
+                         get_token_unsigned_forms)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def get_random_amount(rng: random.Random) -> int:
+    amount = rng.randrange(10 ** rng.randint(0, 40))
+    if rng.random() < 0.2:
+        # Amounts with trailing zeros, like 2500000000000000000
+        amount *= 10 ** rng.randint(1, 20)
+    return amount
+
+
+def get_random_decimal_string(rng: random.Random) -> str:
+    choice = rng.random()
+    if choice < 0.05:
+        # Invalid amounts
+        return rng.choice(["", ".", "1.2.3", "abc", "1e5", " 2.5", "-0.5", "2.", ".5", "1..0"])
+    integer_part = str(rng.randrange(10 ** rng.randint(1, 30)))
+    if choice < 0.3:
+        return integer_part
+    return integer_part + "." + "".join(rng.choice("0123456789") for _ in range(rng.randint(0, 30)))
+
+
+def get_outcome(function: Callable[[], Any]) -> Any:
+    """Get the result of the function, or the type of its exception"""
+    try:
+        return function()
+    except Exception as e:
+        return type(e)
+
+
+def check_equivalence(checks: int, seed: int):
+    """Verify that the batch functions give the same results as the scalar ones"""
+    rng = random.Random(seed)
+    for _ in range(checks):
+        size = rng.randint(0, 20)
+        shared_decimals = rng.randint(0, 30)
+        decimals = shared_decimals if rng.random() < 0.5 else [rng.randint(0, 30) for _ in range(size)]
+        per_item = decimals if isinstance(decimals, list) else [decimals] * size
+
+        amounts = [get_random_amount(rng) for _ in range(size)]
+        if rng.random() < 0.05 and size > 0:
+            amounts[rng.randrange(size)] *= -1
+        scalar = [get_token_decimal_form(amount, d) for amount, d in zip(amounts, per_item)]
+        assert get_token_decimal_forms(amounts, decimals) == scalar, (amounts, decimals)
+        if numpy is not None:
+            assert get_token_decimal_forms(numpy.array(amounts, dtype=object), decimals) == scalar
+
+        strings = [get_random_decimal_string(rng) for _ in range(size)]
+        expected = [get_outcome(lambda: get_token_unsigned_form(amount, d)) for amount, d in zip(strings, per_item)]
+        errors = [outcome for outcome in expected if isinstance(outcome, type)]
+        batch = get_outcome(lambda: get_token_unsigned_forms(strings, decimals))
+        # The batch raises the exception of the first invalid amount
+        assert batch == (errors[0] if errors else expected), (strings, decimals, batch, expected)
+
+        # The round trip gives back the same amounts
+        if min(amounts, default=0) >= 0:
+            assert get_token_unsigned_forms(get_token_decimal_forms(amounts, decimals), decimals) == amounts
+
+
+def measure(scalar: Callable[[], List[Any]], batch: Callable[[], List[Any]], number: int) -> Tuple[float, float]:
+    """Get the best time of the scalar and of the batch conversions, they are measured one
+    after the other to be affected in the same way by the noise of the machine"""
+    scalar_durations, batch_durations = [], []
+    for _ in range(15):
+        scalar_durations.append(timeit.timeit(scalar, number=number) / number)
+        batch_durations.append(timeit.timeit(batch, number=number) / number)
+    return min(scalar_durations), min(batch_durations)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark of the batch conversions of the amounts of tokens")
+    parser.add_argument("--amounts", type=int, default=20000, help="The amount of amounts converted")
+    parser.add_argument("--checks", type=int, default=2000, help="The amount of random batches of the property check")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random inputs")
+    parser.add_argument("--number", type=int, default=2, help="The amount of calls of each measure")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    check_equivalence(args.checks, args.seed)
+    print(f"property check: {args.checks} random batches give the same results as the scalar functions")
+
+    rng = random.Random(args.seed)
+    # Amounts of up to a billion tokens with 18 decimals
+    amounts = [rng.randrange(10 ** rng.randint(1, 27)) for _ in range(args.amounts)]
+    decimals = [rng.choice([6, 8, 18]) for _ in range(args.amounts)]
+    strings = get_token_decimal_forms(amounts, 18)
+    for name, scalar, batch in (
+        ("decimal form, shared decimals",
+         lambda: [get_token_decimal_form(amount, 18) for amount in amounts],
+         lambda: get_token_decimal_forms(amounts, 18)),
+        ("decimal form, per-item decimals",
+         lambda: [get_token_decimal_form(amount, d) for amount, d in zip(amounts, decimals)],
+         lambda: get_token_decimal_forms(amounts, decimals)),
+        ("unsigned form, shared decimals",
+         lambda: [get_token_unsigned_form(amount, 18) for amount in strings],
+         lambda: get_token_unsigned_forms(strings, 18)),
+    ):
+        scalar_duration, batch_duration = measure(scalar, batch, args.number)
+        print(f"{name:<32} scalar: {scalar_duration * 1000:7.2f}ms, batch: {batch_duration * 1000:7.2f}ms, "
+              f"speedup: {scalar_duration / batch_duration:.2f}x ({args.amounts} amounts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Generate synthetic SDKs in the BlockchainAPIs docstring format.
+
+The generated SDK has the same layout as the `input/` folder:
+- The main classes at the root of the folder
+- The models inside of `models/`
+- The exceptions inside of `exceptions/`
+
+Usage:
+python -m benchmarks.generate_sdk --size 1000 --dest /tmp/sdk-1000
+"""
+import argparse
+import os
+
+
+METHODS_PER_CLASS = 100
+"""The amount of methods inside of each generated main class
+"""
+
+MAIN_CLASS_HEADER = '''from typing import Any, Dict, List
+
+
+class {class_name}:
+    """Synthetic SDK number {class_index}
+
+    This class is generated by the benchmarks, it contains {method_count} methods
+    that are documented like the methods of BlockchainAPIs.
+    """
+
+    def __init__(self, api_key: str | None = None):
+        """Creates a {class_name} instance that allow you to make API calls.
+
+        :param api_key: Your API key, defaults to None
+        :type api_key: str | None, optional
+        """
+        self._api_key = api_key
+
+    async def close(self):
+        """Close the async session object.
+        """
+'''
+
+METHOD_TEMPLATE = '''
+    async def method_{index}(self, blockchain: str, page: int = 1, exchange: str | None = None) -> {return_type}:
+        """Get the data number {index} of the given blockchain.
+
+        The data number {index} is returned page by page. The amount of pages is
+        available inside of the response.
+
+        :raises {exception_name}: When the data number {index} is not available
+
+        :param blockchain: The id of the blockchain
+        :type blockchain: str
+        :example blockchain: ethereum
+        :param page: The page that you want to get, defaults to 1
+        :type page: int, Optional
+        :example page: 1
+        :param exchange: The id of the exchange, defaults to None
+        :type exchange: str, Optional
+        :example exchange: uniswapv2_ethereum
+        :return: The data number {index}
+
+
+        Example response:
+        ```json
+        [
+            {{
+                "blockchain": "ethereum",
+                "exchange": "uniswapv2_ethereum",
+                "value": {index}
+            }}
+        ]
+        ```
+        :rtype: {return_type}
+        """
+        params = {{"blockchain": blockchain, "page": page}}
+        if exchange is not None:
+            params["exchange"] = exchange
+        return await self._do_request("/v0/data/{index}", params)
+'''
+
+MODEL_TEMPLATE = '''from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(slots=True, frozen=True)
+class {model_name}:
+    """The {model_name} model"""
+
+    blockchain: str
+    """The id of the blockchain
+
+    Example: ethereum
+    """
+
+    exchange: str
+    """The id of the exchange
+
+    Example: uniswapv2_ethereum
+    """
+
+    value: int
+    """The value of the data
+
+    Example: 1000000000000000000
+    """
+{list_attribute}'''
+
+LIST_ATTRIBUTE_TEMPLATE = '''
+    data: List[{model_name}]
+    """The list of {model_name}
+
+    Example:
+    [
+        {{
+            "blockchain": "ethereum",
+            "exchange": "uniswapv2_ethereum",
+            "value": 1000000000000000000
+        }}
+    ]
+    """
+'''
+
+EXCEPTION_TEMPLATE = '''class {exception_name}(Exception):
+    """
+    Thrown when the data number {index} is not available.
+
+    To avoid getting this error, check that the blockchain supports it.
+    """
+
+    status_code: int
+    """The error code returned by the call to the API
+    
+    For example: 422
+    """
+
+    detail: str
+    """Some details about the error that occured
+    
+    For example:
+    Data {index} not found in blockchain ethereum
+    """
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+'''
+
+INIT_TEMPLATE = '''"""
+Contains the {module_name} of the synthetic SDK.
+
+They are generated by the benchmarks.
+"""
+'''
+
+
+def get_model_name(index: int) -> str:
+    return f"DataModel{index}"
+
+
+def get_exception_name(index: int) -> str:
+    return f"DataNotFound{index}Exception"
+
+
+def _write_file(path: str, content: str):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def generate_sdk(dest: str, size: int):
+    """Generate a synthetic SDK with `size` methods, models and exceptions.
+
+    Every 10th model has a `List[...]` attribute that links to the previous model,
+    and every method returns a list of models, this way the generated pages contain
+    links like the pages of the real SDK.
+
+    :param dest: The folder in which the SDK is generated, it must not exist
+    :type dest: str
+    :param size: The amount of methods, of models and of exceptions
+    :type size: int
+    """
+    os.makedirs(dest)
+    models_folder = os.path.join(dest, "models")
+    exceptions_folder = os.path.join(dest, "exceptions")
+    os.makedirs(models_folder)
+    os.makedirs(exceptions_folder)
+
+    for class_index, start in enumerate(range(0, size, METHODS_PER_CLASS)):
+        class_name = f"SyntheticAPIs{class_index}"
+        indexes = range(start, min(start + METHODS_PER_CLASS, size))
+        content = [MAIN_CLASS_HEADER.format(class_name=class_name, class_index=class_index, method_count=len(indexes))]
+        for index in indexes:
+            return_type = f"List[{get_model_name(index)}]"
+            content.append(METHOD_TEMPLATE.format(index=index, return_type=return_type, exception_name=get_exception_name(index)))
+        _write_file(os.path.join(dest, f"{class_name}.py"), "".join(content))
+
+    for index in range(size):
+        model_name = get_model_name(index)
+        list_attribute = ""
+        if index % 10 == 9:
+            list_attribute = LIST_ATTRIBUTE_TEMPLATE.format(model_name=get_model_name(index - 1))
+        _write_file(os.path.join(models_folder, f"{model_name}.py"),
+                    MODEL_TEMPLATE.format(model_name=model_name, list_attribute=list_attribute))
+
+        exception_name = get_exception_name(index)
+        _write_file(os.path.join(exceptions_folder, f"{exception_name}.py"),
+                    EXCEPTION_TEMPLATE.format(exception_name=exception_name, index=index))
+
+    _write_file(os.path.join(models_folder, "__init__.py"), INIT_TEMPLATE.format(module_name="models"))
+    _write_file(os.path.join(exceptions_folder, "__init__.py"), INIT_TEMPLATE.format(module_name="exceptions"))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate a synthetic SDK to benchmark Sphinxusaurus")
+    parser.add_argument("--size", type=int, required=True, help="The amount of methods, models and exceptions")
+    parser.add_argument("--dest", required=True, help="The folder in which the SDK is generated, it must not exist")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    generate_sdk(args.dest, args.size)
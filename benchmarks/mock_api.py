@@ -0,0 +1,220 @@
+"""A local stand-in for the Blockchain APIs server, used by the benchmarks of the SDK.
+
+It answers the endpoints used by `BlockchainAPIs` and `BlockchainAPIsSync` with
+fixed data in the same format as the real API. It uses HTTP/1.1, this way the
+clients can keep their connections alive like with the real server.
+
+To get an error response, use a token whose address starts with "0xdead", the
+server then answers with a PairNotFoundException. When the server is created with a
+rate limit, the requests above it are answered with a TooManyRequestsException.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+MISSING_TOKEN_PREFIX = "0xdead"
+"""The prefix of the token addresses for which the server returns an error"""
+
+PAGE_SIZE = 100
+"""The amount of elements inside of each page of the paginated endpoints"""
+
+TOTAL_PAGES = 5
+"""The amount of pages of the paginated endpoints"""
+
+
+def get_address(index: int) -> str:
+    """Get the address of the token with the given index, it looks like a real address"""
+    return "0x" + hashlib.sha1(index.to_bytes(8, "little")).hexdigest()
+
+
+def _get_pair_entry(params: Dict[str, str], index: int = 0) -> Dict[str, Any]:
+    return {
+        "blockchain": params.get("blockchain", "ethereum"),
+        "exchange": params.get("exchange", "uniswapv2_ethereum"),
+        "token0": params.get("token0", get_address(index)),
+        "token1": params.get("token1", get_address(index + 1)),
+        "fee": 300
+    }
+
+
+def _get_page(params: Dict[str, str], get_entry) -> Tuple[int, Any]:
+    page = int(params.get("page", "1"))
+    if page < 1 or page > TOTAL_PAGES:
+        return 422, {"detail": {"error_type": "InvalidPageException", "detail": f"Page {page} does not exist"}}
+    start = (page - 1) * PAGE_SIZE
+    return 200, {
+        "page": page,
+        "total_pages": TOTAL_PAGES,
+        "data": [get_entry(params, start + i) for i in range(PAGE_SIZE)]
+    }
+
+
+def _get_response(path: str, params: Dict[str, str]) -> Tuple[int, Any]:
+    """Get the status code and the json content of the response to a request
+
+    :param path: The path of the request
+    :type path: str
+    :param params: The query parameters of the request
+    :type params: Dict[str, str]
+    :return: The status code and the content of the response
+    :rtype: Tuple[int, Any]
+    """
+    for token_param in ("token0", "token1", "tokenIn", "tokenOut", "token"):
+        if params.get(token_param, "").startswith(MISSING_TOKEN_PREFIX):
+            return 422, {"detail": {"error_type": "PairNotFoundException", "detail": f"Token {params[token_param]} not found"}}
+
+    match path:
+        case "/v0/blockchains/":
+            return 200, [{"blockchain": "ethereum", "name": "Ethereum", "chain_id": 1, "explorer": "https://etherscan.io/"}]
+        case "/v0/exchanges/":
+            return _get_page(params, lambda p, i: {"exchange": f"exchange_{i}", "blockchain": p.get("blockchain", "ethereum"),
+                                                   "name": f"Exchange {i}", "url": "https://app.uniswap.org/"})
+        case "/v0/exchanges/info":
+            return 200, {"exchange": params.get("exchange"), "blockchain": "ethereum",
+                         "name": "Uniswap V2", "url": "https://app.uniswap.org/"}
+        case "/v0/exchanges/pairs":
+            return _get_page(params, _get_pair_entry)
+        case "/v0/tokens/":
+            return _get_page(params, lambda p, i: {"blockchain": p.get("blockchain", "ethereum"), "address": get_address(i),
+                                                   "decimals": 18, "market_cap": 112266645.61161652 / (i + 1)})
+        case "/v0/exchanges/pairs/reserves":
+            entry = _get_pair_entry(params)
+            del entry["fee"]
+            return 200, [{**entry, "reserve0": 11100509297299255000, "reserve1": 117592619550992960}]
+        case "/v0/exchanges/pairs/amountOut":
+            return 200, [{"blockchain": params.get("blockchain"), "exchange": params.get("exchange", "uniswapv2_ethereum"),
+                          "tokenIn": params.get("tokenIn"), "tokenOut": params.get("tokenOut"),
+                          "amountIn": int(params.get("amountIn", "0")), "amountOut": 11088529}]
+        case "/v0/exchanges/pairs/amountIn":
+            return 200, [{"blockchain": params.get("blockchain"), "exchange": params.get("exchange", "uniswapv2_ethereum"),
+                          "tokenIn": params.get("tokenIn"), "tokenOut": params.get("tokenOut"),
+                          "amountIn": 1000000000000000000, "amountOut": int(params.get("amountOut", "0"))}]
+        case "/v0/tokens/info":
+            return 200, {"blockchain": params.get("blockchain"), "address": params.get("token"),
+                         "decimals": 18, "market_cap": 112266645.61161652}
+        case "/v0/tokens/decimals":
+            return 200, 18
+    return 404, {"detail": {"error_type": "NotFound", "detail": f"Unknown path: {path}"}}
+
+
+class _MockAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, without it each response
+    # on a kept alive connection waits for the delayed ACK of the client
+    disable_nagle_algorithm = True
+    server: "_MockHTTPServer"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        with self.server.lock:
+            self.server.request_count += 1
+            is_rate_limited = not self.server.take_token()
+            if is_rate_limited:
+                self.server.rate_limited_count += 1
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        if is_rate_limited:
+            status, content = 429, {"detail": {"error_type": "TooManyRequestsException", "detail": "Too many requests"}}
+        else:
+            status, content = _get_response(url.path, params)
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        # Don't print each request
+        pass
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, latency: float, rate_limit: float | None):
+        super().__init__(("127.0.0.1", 0), _MockAPIHandler)
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.lock = threading.Lock()
+        # Token bucket of the rate limit, it allows bursts of one second of requests
+        self._tokens = rate_limit or 0.0
+        self._updated_at = time.monotonic()
+
+    def take_token(self) -> bool:
+        """Take a token of the rate limit, must be called with the lock
+
+        :return: `False` if the request is above the rate limit, `True` otherwise
+        :rtype: bool
+        """
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._updated_at) * self.rate_limit)
+        self._updated_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class MockAPIServer:
+    """Run the stand-in server inside of a background thread.
+
+    For example:
+    with MockAPIServer(latency=0.001) as server:
+        client._base_url = server.url
+    """
+
+    def __init__(self, latency: float = 0.0, rate_limit: float | None = None):
+        """Create the server, it is started by `start` or by the with statement
+
+        :param latency: The amount of seconds that the server waits before answering
+                        each request, it simulates the processing time of the API, defaults to 0
+        :type latency: float, optional
+        :param rate_limit: The maximum amount of requests per second, the requests above it
+                           get a TooManyRequestsException, there is no limit by default, defaults to None
+        :type rate_limit: float | None, optional
+        """
+        self._server = _MockHTTPServer(latency, rate_limit)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """The base url of the server, for example: http://127.0.0.1:8000"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        """The amount of requests received by the server"""
+        return self._server.request_count
+
+    @property
+    def rate_limited_count(self) -> int:
+        """The amount of requests that were rejected because of the rate limit"""
+        return self._server.rate_limited_count
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockAPIServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
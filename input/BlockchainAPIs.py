@@ -1,4 +1,8 @@
-from typing import Any, Dict, List
+import asyncio
+import json
+from collections import deque
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
 
 from aiohttp import ClientSession
 
@@ -22,6 +26,32 @@ from .exceptions import TooManyRequestsException
 from .exceptions import UnauthorizedException
 from .exceptions import UnknownBlockchainAPIsException
 
+from .utils import ResponseCache
+from .utils import SingleFlight
+from .utils import get_request_key
+from .utils import RateLimiter
+from .utils import get_backoff_delay
+from .utils import get_rate_limiter
+from .utils import JsonLoads
+from .utils import LazySequence
+from .utils import get_default_json_loads
+from .utils import EXACT_INTEGER_PATHS
+from .utils import AMOUNT_COLUMNS
+from .utils import PAIR_COLUMNS
+from .utils import RESERVE_COLUMNS
+from .utils import TOKEN_COLUMNS
+from .utils import to_columns
+from .utils import get_token_decimal_form
+from .utils import get_token_decimal_forms
+from .utils import get_token_unsigned_form
+from .utils import get_token_unsigned_forms
+from .utils import to_exchange
+from .utils import to_pair
+from .utils import to_token
+from .utils import PoolMetrics
+from .utils import SessionConfig
+from .utils import get_connector_stats
+
 
 class BlockchainAPIs:
     """High-frequency DEX API
@@ -47,7 +77,8 @@ class BlockchainAPIs:
     _session: ClientSession
     """The session that is used by async operation.
     
-    This session must be closed at the end of your program or usage of the API.
+    This session must be closed at the end of your program or usage of the API
+    (when it was given to the instance, it is closed by its owner instead).
     
     It can be closed with:
     await blockchain_apis_instance.close()
@@ -55,7 +86,7 @@ class BlockchainAPIs:
     (replace blockchain_apis_instance with your instance of BlockchainAPIs)
     """
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, cache: ResponseCache | None = None, rate_limit: float | None = None, max_rate_limit_retries: int = 3, json_loads: JsonLoads | None = None, lazy_models: bool = False, session_config: SessionConfig | None = None, session: ClientSession | None = None):
         """Creates a BlockchainAPIs async instance that allow you to make API calls.
 
         The client works without an API key, but for better performance, we advise you
@@ -63,22 +94,56 @@ class BlockchainAPIs:
 
         :param api_key: Your API key, defaults to None
         :type api_key: str | None, optional
+        :param cache: The cache of the responses of the endpoints that almost never change (blockchains, exchanges, token decimals...), for example ResponseCache(), nothing is cached by default, defaults to None
+        :type cache: ResponseCache | None, optional
+        :param rate_limit: The maximum amount of requests per second sent to the API, shared by all of the instances that use the same API key, there is no limit by default, defaults to None
+        :type rate_limit: float | None, optional
+        :param max_rate_limit_retries: The amount of times that a request is retried (after a jittered exponential backoff) when the API answers with a TooManyRequestsException, defaults to 3
+        :type max_rate_limit_retries: int, optional
+        :param json_loads: The function that decodes the json content of the responses (bytes), defaults to orjson or ujson if one of them is installed and to the json module otherwise. The responses with amounts of tokens (reserves, amount_out and amount_in) are always decoded with the json module to keep their exact value
+        :type json_loads: JsonLoads | None, optional
+        :param lazy_models: If True, the data of the pages (Exchanges, Pairs and Tokens) is a LazySequence that builds each model only when it is accessed, it is faster when you only use a part of the page, defaults to False
+        :type lazy_models: bool, optional
+        :param session_config: The configuration of the HTTP session (server url, connection pool, timeouts...), for example SessionConfig(limit=200), defaults to SessionConfig()
+        :type session_config: SessionConfig | None, optional
+        :param session: An existing session, it allows many instances to share the same connection pool and it is not closed by the instance. The requests are sent to the paths of the endpoints (for example /v0/exchanges/), so the session must be created with the url of the API as base url, for example with SessionConfig().create_session(), defaults to None
+        :type session: ClientSession | None, optional
+        :raises ValueError: When both session_config and session are given
         """
         self._api_key = api_key
+        self._cache = cache
+        self._single_flight = SingleFlight()
+        self._rate_limiter: RateLimiter | None = None if rate_limit is None else get_rate_limiter(api_key, rate_limit)
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._rate_limit_retries = 0
+        self._json_loads = json_loads if json_loads is not None else get_default_json_loads()
+        self._lazy_models = lazy_models
         self._headers = {
             "accept": "application/json"
         }
         if api_key is not None:
             self._headers["api-key"] = api_key
-        self._session = ClientSession("https://api.blockchainapis.io")
+        self._pool_metrics: PoolMetrics | None = None
+        if session is not None:
+            if session_config is not None:
+                raise ValueError("session_config can't be used with a session, the session is already configured")
+            self._session = session
+            self._owns_session = False
+        else:
+            self._pool_metrics = PoolMetrics()
+            self._session = (session_config or SessionConfig()).create_session(self._pool_metrics)
+            self._owns_session = True
 
     async def close(self):
         """Close the async session object.
         
         You must call this method at the end of your program or when you have finished
         working with BlockchainAPIs.
+
+        When the session was given to the instance, it is not closed, its owner closes it.
         """
-        await self._session.close()
+        if self._owns_session:
+            await self._session.close()
 
     async def __aenter__(self):
         """Called when you use `async with`.
@@ -99,8 +164,122 @@ class BlockchainAPIs:
         """
         await self.close()
 
+    def get_stats(self) -> Dict[str, int | float]:
+        """Get the counters of the requests made by the instance
+
+        The identical requests that are made at the same time (for example the same
+        amount_out quote asked by many coroutines) are only sent once to the API,
+        deduplicated_requests is the amount of requests that were not sent thanks to it.
+        rate_limit_retries is the amount of requests that were retried after a
+        TooManyRequestsException.
+
+        When the instance has a cache, its counters are also given. When the instance has
+        a rate limit, the metrics of the waits for the limiter are given (the limiter is
+        shared by the instances that use the same API key).
+
+        The pool_ counters describe the connection pool of the session: its limit and the
+        connections in use and idle at the moment. When the instance created its session,
+        the connections created, reused and the requests queued waiting for a free
+        connection are also given (many queued requests mean that the limit is too low).
+
+        :return: The counters of the requests: requests is the amount of requests sent to the API
+
+
+        Example response:
+        ```json
+        {
+            "requests": 1250,
+            "deduplicated_requests": 310,
+            "rate_limit_retries": 2,
+            "cache_hits": 4820,
+            "cache_misses": 62,
+            "cache_deduplicated": 12,
+            "cache_size": 62,
+            "rate_limiter_acquired": 1252,
+            "rate_limiter_waited": 841,
+            "rate_limiter_total_wait_ms": 20480.5,
+            "rate_limiter_max_wait_ms": 98.2,
+            "pool_limit": 100,
+            "pool_in_use": 12,
+            "pool_idle": 88,
+            "pool_created": 100,
+            "pool_reused": 1150,
+            "pool_queued": 35,
+            "pool_queue_wait_ms": 120.8
+        }
+        ```
+        :rtype: Dict[str, int | float]
+        """
+        ret = {
+            "requests": self._single_flight.calls,
+            "deduplicated_requests": self._single_flight.deduplicated,
+            "rate_limit_retries": self._rate_limit_retries
+        }
+        if self._cache is not None:
+            for key, value in self._cache.get_stats().items():
+                ret[f"cache_{key}"] = value
+            # The cache misses are also sent to the API
+            ret["requests"] += ret["cache_misses"]
+        if self._rate_limiter is not None:
+            # The limiter is shared with the other instances that use the same API key
+            for key, value in self._rate_limiter.get_stats().items():
+                ret[f"rate_limiter_{key}"] = value
+        for key, value in get_connector_stats(self._session).items():
+            ret[f"pool_{key}"] = value
+        if self._pool_metrics is not None:
+            for key, value in self._pool_metrics.get_stats().items():
+                ret[f"pool_{key}"] = value
+        return ret
+
     async def _do_request(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        """Make raw API request (that return the json result).
+        """Make a raw API request (that return the json result).
+
+        When the instance has a cache and the path is cached, the response is taken from
+        the cache if it is still valid. Otherwise, the request is made by `_send_request`: the
+        identical requests (same path and parameters) that are made at the same time
+        share the same response.
+
+        :param path: The path of the request
+        :type path: str
+        :param params: The optional query parameters of the request, defaults to None
+        :type params: Dict[str, Any] | None, optional
+        :return: The json-formated result
+        :rtype: Dict[str, Any]
+        """
+        if self._cache is not None and self._cache.is_cached(path):
+            return await self._cache.get_async(path, params, partial(self._send_request, path, params))
+        return await self._single_flight.do_async(get_request_key(path, params), partial(self._send_request, path, params))
+
+    async def _send_request(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Send the request with `_fetch` once the rate limiter allows it.
+
+        When the API answers with a TooManyRequestsException, the request is retried
+        after a jittered exponential backoff, up to max_rate_limit_retries times.
+
+        :raises TooManyRequestsException: When the request is still rejected after all of the retries
+
+        :param path: The path of the request
+        :type path: str
+        :param params: The optional query parameters of the request, defaults to None
+        :type params: Dict[str, Any] | None, optional
+        :return: The json-formated result
+        :rtype: Dict[str, Any]
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            try:
+                return await self._fetch(path, params)
+            except TooManyRequestsException:
+                if attempt >= self._max_rate_limit_retries:
+                    raise
+            await asyncio.sleep(get_backoff_delay(attempt))
+            attempt += 1
+            self._rate_limit_retries += 1
+
+    async def _fetch(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Send the API request without using the cache (and return the json result).
         
         This method additionaly adds the user API key to the request if it is present.
 
@@ -120,9 +299,11 @@ class BlockchainAPIs:
         :return: The json-formated result
         :rtype: Dict[str, None]
         """
+        # The amounts of tokens must keep their exact value, see EXACT_INTEGER_PATHS
+        loads = json.loads if path in EXACT_INTEGER_PATHS else self._json_loads
         async with self._session.get(path, params=params, headers=self._headers) as response:
             if response.status != 200:
-                error_data = await response.json()
+                error_data = loads(await response.read())
                 error_type = error_data["detail"]["error_type"]
                 match error_type:
                     case "BlockchainNotSupportedException":
@@ -142,7 +323,72 @@ class BlockchainAPIs:
                     case _:
                         raise UnknownBlockchainAPIsException(response.status, f"Unkwnown Exception type: {error_type}.\nGot this exception while handling:\n{error_data} with status code: {response.status}")
 
-            return await response.json()
+            return loads(await response.read())
+
+    async def _gather_bounded(self, calls: List[Callable[[], Awaitable[Any]]], max_concurrency: int) -> List[Any]:
+        """Run the given calls concurrently, with at most max_concurrency calls at the same time.
+
+        :param calls: The calls to run, each call returns a coroutine
+        :type calls: List[Callable[[], Awaitable[Any]]]
+        :param max_concurrency: The maximum amount of calls that run at the same time
+        :type max_concurrency: int
+        :return: The result of each call in the same order as the calls, or the exception
+                 that was raised by the call
+        :rtype: List[Any]
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                try:
+                    return await call()
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*(run(call) for call in calls))
+
+    async def _iter_pages(self, get_page: Callable[[int], Awaitable[Any]], prefetch: int) -> AsyncIterator[Any]:
+        """Iterate over all of the pages of a paginated endpoint.
+
+        The first page gives the total amount of pages, the next pages are then fetched
+        concurrently with at most prefetch pages requested in advance. The pages are given
+        in order.
+
+        :param get_page: The method that returns the page with the given number, for example `self.pairs`
+        :type get_page: Callable[[int], Awaitable[Any]]
+        :param prefetch: The maximum amount of pages that are fetched in advance
+        :type prefetch: int
+        :return: An async iterator over the pages (Exchanges, Pairs or Tokens)
+        :rtype: AsyncIterator[Any]
+        """
+        first_page = await get_page(page=1)
+        yield first_page
+        next_page = 2
+        pending = deque()
+        try:
+            while next_page <= first_page.total_pages or len(pending) > 0:
+                while next_page <= first_page.total_pages and len(pending) < max(prefetch, 1):
+                    pending.append(asyncio.ensure_future(get_page(page=next_page)))
+                    next_page += 1
+                yield await pending.popleft()
+        finally:
+            # The iteration was stopped before the end, we don't need the prefetched pages
+            for task in pending:
+                task.cancel()
+
+    def _get_models(self, raw: List[Dict[str, Any]], build: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        """Build the models of the data of a page
+
+        :param raw: The json elements of the page
+        :type raw: List[Dict[str, Any]]
+        :param build: The function that builds the model of a json element, for example `to_pair`
+        :type build: Callable[[Dict[str, Any]], Any]
+        :return: The list of the models, or a LazySequence if the instance uses lazy models
+        :rtype: List[Any]
+        """
+        if self._lazy_models:
+            return LazySequence(raw, build)
+        return [build(d) for d in raw]
 
     async def blockchains(self) -> List[Blockchain]:
         """Get the list of blockchains supported by the API
@@ -230,17 +476,42 @@ class BlockchainAPIs:
         return Exchanges(
             page=ret["page"],
             total_pages=ret["total_pages"],
-            data=[
-                Exchange(
-                    exchange=d["exchange"],
-                    blockchain=d["blockchain"],
-                    name=d["name"],
-                    url=d["url"]
-                )
-                for d in ret["data"]
-            ]
+            data=self._get_models(ret["data"], to_exchange)
         )
 
+    async def iter_exchanges(self, blockchain: str | None = None, prefetch: int = 4) -> AsyncIterator[Exchange]:
+        """Iterate over all of the exchanges, page after page.
+
+        The first page is fetched to know the total amount of pages, then the next pages are
+        fetched concurrently, with at most prefetch pages requested in advance. The exchanges are
+        given as soon as their page arrives and in the same order as with exchanges, only the pages
+        of the prefetch window are kept in memory.
+
+        :raises BlockchainNotSupportedException: When an invalid blockchain id is given
+        :param blockchain: The blockchain from which you want to get the exchanges, defaults to None
+        :type blockchain: str, Optional
+        :example blockchain: ethereum
+        :param prefetch: The maximum amount of pages that are fetched in advance, defaults to 4
+        :type prefetch: int, Optional
+        :example prefetch: 4
+        :return: An async iterator over each exchange supported by the API.
+
+
+        Example response:
+        ```json
+        {
+            "exchange": "lydia_finance_avalanche",
+            "blockchain": "avalanche",
+            "name": "Lydia Finance",
+            "url": "https://exchange.lydia.finance/#/swap"
+        }
+        ```
+        :rtype: AsyncIterator[Exchange]
+        """
+        async for page in self._iter_pages(partial(self.exchanges, blockchain=blockchain), prefetch):
+            for exchange in page.data:
+                yield exchange
+
     async def info(self, exchange: str) -> Exchange:
         """Get informations on a specific exchange
 
@@ -281,7 +552,7 @@ class BlockchainAPIs:
             url=ret["url"]
         )
 
-    async def pairs(self, page: int = 1, blockchain: str | None = None, exchange: str | None = None) -> Pairs:
+    async def pairs(self, page: int = 1, blockchain: str | None = None, exchange: str | None = None, columnar: bool = False) -> Pairs:
         """Get the list of pairs supported by the API
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -297,6 +568,9 @@ class BlockchainAPIs:
         :param exchange: The exchange from which you want to get the pairs, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, the data of the page is a dict of columns (numpy arrays if numpy is installed) instead of a list of models, it is faster for analytics, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of pairs supported by the API. It returns token addresses,
         blockchain, exchange and the fee that the pair has.
         
@@ -339,19 +613,48 @@ class BlockchainAPIs:
         return Pairs(
             page=ret["page"],
             total_pages=ret["total_pages"],
-            data=[
-                Pair(
-                    blockchain=d["blockchain"],
-                    exchange=d["exchange"],
-                    token0=d["token0"],
-                    token1=d["token1"],
-                    fee=d["fee"]
-                )
-                for d in ret["data"]
-            ]
+            data=to_columns(ret["data"], PAIR_COLUMNS) if columnar else self._get_models(ret["data"], to_pair)
         )
 
-    async def reserves(self, blockchain: str, token0: str, token1: str, exchange: str | None = None) -> List[Reserve]:
+    async def iter_pairs(self, blockchain: str | None = None, exchange: str | None = None, prefetch: int = 4) -> AsyncIterator[Pair]:
+        """Iterate over all of the pairs, page after page.
+
+        The first page is fetched to know the total amount of pages, then the next pages are
+        fetched concurrently, with at most prefetch pages requested in advance. The pairs are
+        given as soon as their page arrives and in the same order as with pairs, only the pages
+        of the prefetch window are kept in memory.
+
+        :raises BlockchainNotSupportedException: When an invalid blockchain id is given
+        :raises ExchangeNotSupportedException: When an invalid Exchange id is given
+        :param blockchain: The blockchain from which you want to get the pairs, defaults to None
+        :type blockchain: str, Optional
+        :example blockchain: ethereum
+        :param exchange: The exchange from which you want to get the pairs, defaults to None
+        :type exchange: str, Optional
+        :example exchange: uniswapv2_ethereum
+        :param prefetch: The maximum amount of pages that are fetched in advance, defaults to 4
+        :type prefetch: int, Optional
+        :example prefetch: 4
+        :return: An async iterator over each pair supported by the API.
+
+
+        Example response:
+        ```json
+        {
+            "blockchain": "ethereum",
+            "exchange": "uniswapv2_ethereum",
+            "token0": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            "token1": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+            "fee": 300
+        }
+        ```
+        :rtype: AsyncIterator[Pair]
+        """
+        async for page in self._iter_pages(partial(self.pairs, blockchain=blockchain, exchange=exchange), prefetch):
+            for pair in page.data:
+                yield pair
+
+    async def reserves(self, blockchain: str, token0: str, token1: str, exchange: str | None = None, columnar: bool = False) -> List[Reserve] | Dict[str, Any]:
         """Get the liquidity inside of the reserve of two tokens.
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -370,6 +673,9 @@ class BlockchainAPIs:
         :param exchange: The id of the exchange from which you want to get the reserve, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, a dict with one column per field (numpy arrays if numpy is installed, arrays or lists otherwise) is returned instead of the list of Reserve, the amounts keep their exact value, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of all of the reserve for the given pair, blockchain and exchange.
         Can return an empty list if the given pair was not found.
 
@@ -388,7 +694,7 @@ class BlockchainAPIs:
 
         ]
         ```
-        :rtype: List[Reserve]
+        :rtype: List[Reserve] | Dict[str, Any]
         """
         params = {}
         params["blockchain"] = blockchain
@@ -397,6 +703,8 @@ class BlockchainAPIs:
         params["token0"] = token0
         params["token1"] = token1
         ret = await self._do_request("/v0/exchanges/pairs/reserves", params)
+        if columnar:
+            return to_columns(ret, RESERVE_COLUMNS)
         return [
             Reserve(
                 blockchain=r["blockchain"],
@@ -409,7 +717,42 @@ class BlockchainAPIs:
             for r in ret
         ]
 
-    async def amount_out(self, blockchain: str, tokenIn: str, tokenOut: str, amountIn: int, exchange: str | None = None) -> List[AmountOut]:
+    async def reserves_batch(self, pairs: List[Tuple[str, str, str, str | None]], max_concurrency: int = 50) -> List[List[Reserve] | Exception]:
+        """Get the reserves of many pairs at once.
+
+        The requests are made concurrently over the session of the instance, with at most
+        max_concurrency requests in flight at the same time. If the request of a pair fails,
+        its exception is returned at its position instead of failing the whole batch.
+
+        :param pairs: The pairs, each pair is a tuple of (blockchain, token0, token1, exchange), the exchange can be None
+        :type pairs: List[Tuple[str, str, str, str | None]]
+        :example pairs: [("ethereum", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "uniswapv2_ethereum")]
+        :param max_concurrency: The maximum amount of requests that are made at the same time, defaults to 50
+        :type max_concurrency: int, Optional
+        :example max_concurrency: 50
+        :return: The reserves of each pair, in the same order as the given pairs. For a pair that failed, the exception that was raised (for example a PairNotFoundException).
+
+
+        Example response:
+        ```json
+        [
+            [
+                {
+                    "blockchain": "ethereum",
+                    "exchange": "uniswapv2_ethereum",
+                    "token0": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+                    "token1": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                    "reserve0": 11100509297299255000,
+                    "reserve1": 117592619550992960
+                }
+            ]
+        ]
+        ```
+        :rtype: List[List[Reserve] | Exception]
+        """
+        return await self._gather_bounded([partial(self.reserves, *pair) for pair in pairs], max_concurrency)
+
+    async def amount_out(self, blockchain: str, tokenIn: str, tokenOut: str, amountIn: int, exchange: str | None = None, columnar: bool = False) -> List[AmountOut] | Dict[str, Any]:
         """Get the amount of tokenOut that you will get after selling amountIn tokenIn
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -431,6 +774,9 @@ class BlockchainAPIs:
         :param exchange: The exchange on which you want to do the trade, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, a dict with one column per field (numpy arrays if numpy is installed, arrays or lists otherwise) is returned instead of the list of AmountOut, the amounts keep their exact value, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of the amount out that you will get on all of the exchanges. It can return an empty list if the given pair was not found for the given parameters.
 
 
@@ -448,7 +794,7 @@ class BlockchainAPIs:
 
         ]
         ```
-        :rtype: List[AmountOut]
+        :rtype: List[AmountOut] | Dict[str, Any]
         """
         params = {}
         params["blockchain"] = blockchain
@@ -458,6 +804,8 @@ class BlockchainAPIs:
         if exchange is not None:
             params["exchange"] = exchange
         ret = await self._do_request("/v0/exchanges/pairs/amountOut", params)
+        if columnar:
+            return to_columns(ret, AMOUNT_COLUMNS)
         return [
             AmountOut(
                 blockchain=r["blockchain"],
@@ -470,7 +818,42 @@ class BlockchainAPIs:
             for r in ret
         ]
 
-    async def amount_in(self, blockchain: str, tokenIn: str, tokenOut: str, amountOut: int, exchange: str | None = None) -> List[AmountIn]:
+    async def amount_out_batch(self, trades: List[Tuple[str, str, str, int, str | None]], max_concurrency: int = 50) -> List[List[AmountOut] | Exception]:
+        """Get the amount of tokenOut that you will get for many trades at once.
+
+        The requests are made concurrently over the session of the instance, with at most
+        max_concurrency requests in flight at the same time. If the request of a trade fails,
+        its exception is returned at its position instead of failing the whole batch.
+
+        :param trades: The trades, each trade is a tuple of (blockchain, tokenIn, tokenOut, amountIn, exchange), the exchange can be None
+        :type trades: List[Tuple[str, str, str, int, str | None]]
+        :example trades: [("ethereum", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", 1000000000000000000, None)]
+        :param max_concurrency: The maximum amount of requests that are made at the same time, defaults to 50
+        :type max_concurrency: int, Optional
+        :example max_concurrency: 50
+        :return: The amounts out of each trade, in the same order as the given trades. For a trade that failed, the exception that was raised (for example a PairNotFoundException).
+
+
+        Example response:
+        ```json
+        [
+            [
+                {
+                    "blockchain": "ethereum",
+                    "exchange": "uniswapv2_ethereum",
+                    "tokenIn": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+                    "tokenOut": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                    "amountIn": 1000000000000000000,
+                    "amountOut": 1845325659
+                }
+            ]
+        ]
+        ```
+        :rtype: List[List[AmountOut] | Exception]
+        """
+        return await self._gather_bounded([partial(self.amount_out, *trade) for trade in trades], max_concurrency)
+
+    async def amount_in(self, blockchain: str, tokenIn: str, tokenOut: str, amountOut: int, exchange: str | None = None, columnar: bool = False) -> List[AmountIn] | Dict[str, Any]:
         """Get the amount of tokenIn that you need to sell in order to get amountOut tokenOut
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -492,6 +875,9 @@ class BlockchainAPIs:
         :param exchange: The exchange on which you want to do the trade, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, a dict with one column per field (numpy arrays if numpy is installed, arrays or lists otherwise) is returned instead of the list of AmountIn, the amounts keep their exact value, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of amount in that you will get on all of the exchanges. It can return an empty list if the given pair was not found.
 
 
@@ -509,7 +895,7 @@ class BlockchainAPIs:
 
         ]
         ```
-        :rtype: List[AmountIn]
+        :rtype: List[AmountIn] | Dict[str, Any]
         """
         params = {}
         params["blockchain"] = blockchain
@@ -519,6 +905,8 @@ class BlockchainAPIs:
         if exchange is not None:
             params["exchange"] = exchange
         ret = await self._do_request("/v0/exchanges/pairs/amountIn", params)
+        if columnar:
+            return to_columns(ret, AMOUNT_COLUMNS)
         return [
             AmountIn(
                 blockchain=r["blockchain"],
@@ -531,7 +919,7 @@ class BlockchainAPIs:
             for r in ret
         ]
 
-    async def tokens(self, page: int = 1, blockchain: str | None = None) -> Tokens:
+    async def tokens(self, page: int = 1, blockchain: str | None = None, columnar: bool = False) -> Tokens:
         """Get the list of supported tokens
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -543,6 +931,9 @@ class BlockchainAPIs:
         :param blockchain: The blockchain on which you want to get the tokens, defaults to None
         :type blockchain: str, Optional
         :example blockchain: ethereum
+        :param columnar: If True, the data of the page is a dict of columns (numpy arrays if numpy is installed) instead of a list of models, it is faster for analytics, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of supported tokens ordered by market cap in a descending order.
         
         The market capitalization is in dollars, it can be null if the liquidity available for the given token is lower than 1000$.
@@ -614,17 +1005,42 @@ class BlockchainAPIs:
         return Tokens(
             page=ret["page"],
             total_pages=ret["total_pages"],
-            data=[
-                Token(
-                    blockchain=d["blockchain"],
-                    address=d["address"],
-                    decimals=d["decimals"],
-                    market_cap=d["market_cap"]
-                )
-                for d in ret["data"]
-            ]
+            data=to_columns(ret["data"], TOKEN_COLUMNS) if columnar else self._get_models(ret["data"], to_token)
         )
 
+    async def iter_tokens(self, blockchain: str | None = None, prefetch: int = 4) -> AsyncIterator[Token]:
+        """Iterate over all of the tokens, page after page.
+
+        The first page is fetched to know the total amount of pages, then the next pages are
+        fetched concurrently, with at most prefetch pages requested in advance. The tokens are
+        given as soon as their page arrives and in the same order as with tokens, only the pages
+        of the prefetch window are kept in memory.
+
+        :raises BlockchainNotSupportedException: When an invalid blockchain id is given
+        :param blockchain: The blockchain on which you want to get the tokens, defaults to None
+        :type blockchain: str, Optional
+        :example blockchain: ethereum
+        :param prefetch: The maximum amount of pages that are fetched in advance, defaults to 4
+        :type prefetch: int, Optional
+        :example prefetch: 4
+        :return: An async iterator over each supported token, ordered by market cap in a descending order.
+
+
+        Example response:
+        ```json
+        {
+            "blockchain": "avalanche",
+            "address": "0x130966628846BFd36ff31a822705796e8cb8C18D",
+            "decimals": 18,
+            "market_cap": 112266645.61161652
+        }
+        ```
+        :rtype: AsyncIterator[Token]
+        """
+        async for page in self._iter_pages(partial(self.tokens, blockchain=blockchain), prefetch):
+            for token in page.data:
+                yield token
+
     async def info(self, blockchain: str, token: str) -> Token:
         """Get information on a specific token
 
@@ -719,22 +1135,32 @@ class BlockchainAPIs:
         ```
         :rtype: str
         """
-        str_amount = str(amount)
-
-        # special case when decimals is 0
-        if decimals == 0:
-            return str_amount
-
-        # Check if the string length is less than the decimals
-        if len(str_amount) <= decimals:
-            # Add leading zeros to the string
-            str_amount = '0' * (decimals - len(str_amount) + 1) + str_amount
-            
-        # Insert the decimal point at the correct position
-        str_amount = str_amount[:-decimals] + "." + str_amount[-decimals:]
-        
-        str_amount = str_amount.rstrip('0').rstrip('.') if '.' in str_amount else str_amount
-        return str_amount
+        return get_token_decimal_form(amount, decimals)
+
+    def get_token_decimal_forms(self, amounts: List[int], decimals: int | List[int]) -> List[str]:
+        """Convert many tokens from their unsigned integer form to their decimal form.
+
+        It gives exactly the same results as get_token_decimal_form called on each amount,
+        and it is faster when the amounts share the same decimals (for example to display
+        the balances of a token on a dashboard).
+
+        :param amounts: The integer amounts that you want to convert, it can also be a numpy array
+        :type amounts: List[int]
+        :example amounts: [2500000000000000000, 1000000000000]
+        :param decimals: The amount of decimals of the token, shared by all of the amounts, or a
+                         list with the decimals of each amount. You can use the [decimals](/docs/python-sdk/blockchain-apis/decimals)
+                         method in order to get the amount of decimals.
+        :type decimals: int | List[int]
+        :example decimals: 18
+        :return: The given amounts in a decimal form, in the same order.
+
+        Example response:
+        ```json
+        ["2.5", "0.000001"]
+        ```
+        :rtype: List[str]
+        """
+        return get_token_decimal_forms(amounts, decimals)
 
     def get_token_unsigned_form(self, amount: str, decimals: int) -> int:
         """Convert a token from his decimal form back to his unsigned integer form (this
@@ -760,21 +1186,29 @@ class BlockchainAPIs:
         ```
         :rtype: int
         """
-        split = amount.split('.')
-        if len(split) >= 2:
-            integer_part, fractional_part = split
-        else:
-            integer_part, fractional_part = split[0], ""
+        return get_token_unsigned_form(amount, decimals)
 
-        # Check if the fractional part has less digits than the decimal places
-        if len(fractional_part) < decimals:
-            # Append zeros to the end of the fractional part
-            fractional_part += '0' * (decimals - len(fractional_part))
-        else:
-            # Trim the fractional part to the number of decimal places
-            fractional_part = fractional_part[:decimals]
+    def get_token_unsigned_forms(self, amounts: List[str], decimals: int | List[int]) -> List[int]:
+        """Convert many tokens from their decimal form back to their unsigned integer form (this
+        method does the reverse of get_token_decimal_forms)
+
+        It gives exactly the same results (and raises the same exceptions) as
+        get_token_unsigned_form called on each amount.
 
-        # Combine the integer and fractional parts and convert to an integer
-        integer_token_amount = int(integer_part + fractional_part)
+        :param amounts: The amounts in str format that you want to convert, it can also be a numpy array
+        :type amounts: List[str]
+        :example amounts: ["2.5", "0.000001"]
+        :param decimals: The amount of decimals of the token, shared by all of the amounts, or a
+                         list with the decimals of each amount. You can use the [decimals](/docs/python-sdk/blockchain-apis/decimals)
+                         method in order to get the amount of decimals.
+        :type decimals: int | List[int]
+        :example decimals: 18
+        :return: The amounts converted to unsigned integers, in the same order.
 
-        return integer_token_amount
+        Example response:
+        ```json
+        [2500000000000000000, 1000000000000]
+        ```
+        :rtype: List[int]
+        """
+        return get_token_unsigned_forms(amounts, decimals)
@@ -1,8 +1,14 @@
+import json
 import requests
+import time
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List
 from urllib.parse import urljoin
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from .models import Blockchain
 from .models import Exchanges
 from .models import Exchange
@@ -23,6 +29,29 @@ from .exceptions import TooManyRequestsException
 from .exceptions import UnauthorizedException
 from .exceptions import UnknownBlockchainAPIsException
 
+from .utils import ResponseCache
+from .utils import SingleFlight
+from .utils import get_request_key
+from .utils import RateLimiter
+from .utils import get_backoff_delay
+from .utils import get_rate_limiter
+from .utils import JsonLoads
+from .utils import LazySequence
+from .utils import get_default_json_loads
+from .utils import EXACT_INTEGER_PATHS
+from .utils import AMOUNT_COLUMNS
+from .utils import PAIR_COLUMNS
+from .utils import RESERVE_COLUMNS
+from .utils import TOKEN_COLUMNS
+from .utils import to_columns
+from .utils import get_token_decimal_form
+from .utils import get_token_decimal_forms
+from .utils import get_token_unsigned_form
+from .utils import get_token_unsigned_forms
+from .utils import to_exchange
+from .utils import to_pair
+from .utils import to_token
+
 
 class BlockchainAPIsSync:
     """High-frequency DEX API
@@ -44,8 +73,20 @@ class BlockchainAPIsSync:
     [Discord community](https://discord.gg/GphRMJXmS5) where our team and fellow developers are
     eager to help you make the most of our powerful API.
     """
+
+    _session: requests.Session
+    """The session that is used by the sync operations.
+    
+    It keeps the connections to the API open between two calls, this way we
+    don't open a new TCP and TLS connection for each request.
+    
+    It can be closed with:
+    blockchain_apis_instance.close()
+    
+    (replace blockchain_apis_instance with your instance of BlockchainAPIsSync)
+    """
     
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, pool_size: int = 10, max_retries: int = 3, cache: ResponseCache | None = None, rate_limit: float | None = None, max_rate_limit_retries: int = 3, json_loads: JsonLoads | None = None, lazy_models: bool = False):
         """Creates a BlockchainAPIsSync sync instance that allow you to make API calls
         in a synchronous way.
 
@@ -54,20 +95,177 @@ class BlockchainAPIsSync:
 
         :param api_key: Your API key, defaults to None
         :type api_key: str | None, optional
+        :param pool_size: The maximum amount of connections to the API that are kept open, increase it if you share the instance between many threads, defaults to 10
+        :type pool_size: int, optional
+        :param max_retries: The amount of times that a request is retried when the connection fails or when the API is unavailable (502, 503 or 504), defaults to 3
+        :type max_retries: int, optional
+        :param cache: The cache of the responses of the endpoints that almost never change (blockchains, exchanges, token decimals...), for example ResponseCache(), nothing is cached by default, defaults to None
+        :type cache: ResponseCache | None, optional
+        :param rate_limit: The maximum amount of requests per second sent to the API, shared by all of the instances that use the same API key, there is no limit by default, defaults to None
+        :type rate_limit: float | None, optional
+        :param max_rate_limit_retries: The amount of times that a request is retried (after a jittered exponential backoff) when the API answers with a TooManyRequestsException, defaults to 3
+        :type max_rate_limit_retries: int, optional
+        :param json_loads: The function that decodes the json content of the responses (bytes), defaults to orjson or ujson if one of them is installed and to the json module otherwise. The responses with amounts of tokens (reserves, amount_out and amount_in) are always decoded with the json module to keep their exact value
+        :type json_loads: JsonLoads | None, optional
+        :param lazy_models: If True, the data of the pages (Exchanges, Pairs and Tokens) is a LazySequence that builds each model only when it is accessed, it is faster when you only use a part of the page, defaults to False
+        :type lazy_models: bool, optional
         """
+        self._cache = cache
+        self._single_flight = SingleFlight()
+        self._rate_limiter: RateLimiter | None = None if rate_limit is None else get_rate_limiter(api_key, rate_limit)
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._rate_limit_retries = 0
+        self._json_loads = json_loads if json_loads is not None else get_default_json_loads()
+        self._lazy_models = lazy_models
         self._headers = {
             "accept": "application/json"
         }
         if api_key is not None:
             self._headers["api-key"] = api_key
         self._base_url = "https://api.blockchainapis.io"
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET",),
+            # The errors returned by the API are handled by _do_request
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self):
+        """Close the session object and the connections that it keeps open.
+        
+        You should call this method at the end of your program or when you have finished
+        working with BlockchainAPIsSync.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        """Called when you use `with`.
+        
+        For example:
+        with BlockchainAPIsSync() as blockchain_apis:
+            # do some stuff
+            pass
+
+        :return: self
+        :rtype: self
+        """
+        return self
+
+    def __exit__(self, *_):
+        """Called at the end of the `with` statement in order
+        to free the resources used by the API instance.
+        """
+        self.close()
+
+    def get_stats(self) -> Dict[str, int | float]:
+        """Get the counters of the requests made by the instance
+
+        When many threads share the instance, the identical requests that they make at the
+        same time (for example the same amount_out quote asked by each worker thread of a
+        pool) are only sent once to the API, deduplicated_requests is the amount of requests
+        that were not sent thanks to it. rate_limit_retries is the amount of requests that
+        were retried after a TooManyRequestsException.
+
+        When the instance has a cache, its counters are also given. When the instance has
+        a rate limit, the metrics of the waits for the limiter are given (the limiter is
+        shared by the instances that use the same API key).
 
+        :return: The counters of the requests: requests is the amount of requests sent to the API
+
+
+        Example response:
+        ```json
+        {
+            "requests": 1250,
+            "deduplicated_requests": 310,
+            "rate_limit_retries": 2,
+            "cache_hits": 4820,
+            "cache_misses": 62,
+            "cache_deduplicated": 12,
+            "cache_size": 62,
+            "rate_limiter_acquired": 1252,
+            "rate_limiter_waited": 841,
+            "rate_limiter_total_wait_ms": 20480.5,
+            "rate_limiter_max_wait_ms": 98.2
+        }
+        ```
+        :rtype: Dict[str, int | float]
+        """
+        ret = {
+            "requests": self._single_flight.calls,
+            "deduplicated_requests": self._single_flight.deduplicated,
+            "rate_limit_retries": self._rate_limit_retries
+        }
+        if self._cache is not None:
+            for key, value in self._cache.get_stats().items():
+                ret[f"cache_{key}"] = value
+            # The cache misses are also sent to the API
+            ret["requests"] += ret["cache_misses"]
+        if self._rate_limiter is not None:
+            # The limiter is shared with the other instances that use the same API key
+            for key, value in self._rate_limiter.get_stats().items():
+                ret[f"rate_limiter_{key}"] = value
+        return ret
 
     def _do_request(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """Make a raw API request (that return the json result).
+
+        When the instance has a cache and the path is cached, the response is taken from
+        the cache if it is still valid. Otherwise, the request is made by `_send_request`: the
+        identical requests (same path and parameters) that are made at the same time
+        share the same response.
+
+        :param path: The path of the request
+        :type path: str
+        :param params: The optional query parameters of the request, defaults to None
+        :type params: Dict[str, Any] | None, optional
+        :return: The json-formated result
+        :rtype: Dict[str, Any]
+        """
+        if self._cache is not None and self._cache.is_cached(path):
+            return self._cache.get(path, params, partial(self._send_request, path, params))
+        return self._single_flight.do(get_request_key(path, params), partial(self._send_request, path, params))
+
+    def _send_request(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Send the request with `_fetch` once the rate limiter allows it.
+
+        When the API answers with a TooManyRequestsException, the request is retried
+        after a jittered exponential backoff, up to max_rate_limit_retries times.
+
+        :raises TooManyRequestsException: When the request is still rejected after all of the retries
+
+        :param path: The path of the request
+        :type path: str
+        :param params: The optional query parameters of the request, defaults to None
+        :type params: Dict[str, Any] | None, optional
+        :return: The json-formated result
+        :rtype: Dict[str, Any]
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                return self._fetch(path, params)
+            except TooManyRequestsException:
+                if attempt >= self._max_rate_limit_retries:
+                    raise
+            time.sleep(get_backoff_delay(attempt))
+            attempt += 1
+            self._rate_limit_retries += 1
+
+    def _fetch(self, path: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Send the API request without using the cache (and return the json result).
         
-        It makes the request in a synchronous way and you don't need to close the
-        BlockchainAPIs instance.
+        It makes the request in a synchronous way with the pooled session of the
+        instance, the connection to the API is reused between the calls.
 
         :raises BlockchainNotSupportedException: Thrown when an Invalid blockchain id is put during a call to the API.
         :raises ExchangeNotSupportedException: Thrown when an Invalid exchange id is given during a call to the API.
@@ -85,10 +283,12 @@ class BlockchainAPIsSync:
         :return: The json-formated result
         :rtype: Dict[str, Any]
         """
+        # The amounts of tokens must keep their exact value, see EXACT_INTEGER_PATHS
+        loads = json.loads if path in EXACT_INTEGER_PATHS else self._json_loads
         url = urljoin(self._base_url, path)
-        response = requests.get(url, params=params, headers=self._headers)
+        response = self._session.get(url, params=params)
         if response.status_code != 200:
-            error_data = response.json()
+            error_data = loads(response.content)
             error_type = error_data["detail"]["error_type"]
             match error_type:
                 case "BlockchainNotSupportedException":
@@ -108,7 +308,21 @@ class BlockchainAPIsSync:
                 case _:
                     raise UnknownBlockchainAPIsException(response.status, f"Unkwnown Exception type: {error_type}.\nGot this exception while handling:\n{error_data} with status code: {response.status}")
 
-        return response.json()
+        return loads(response.content)
+
+    def _get_models(self, raw: List[Dict[str, Any]], build: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        """Build the models of the data of a page
+
+        :param raw: The json elements of the page
+        :type raw: List[Dict[str, Any]]
+        :param build: The function that builds the model of a json element, for example `to_pair`
+        :type build: Callable[[Dict[str, Any]], Any]
+        :return: The list of the models, or a LazySequence if the instance uses lazy models
+        :rtype: List[Any]
+        """
+        if self._lazy_models:
+            return LazySequence(raw, build)
+        return [build(d) for d in raw]
 
     def blockchains(self) -> List[Blockchain]:
         """Get the list of blockchains supported by the API
@@ -196,15 +410,7 @@ class BlockchainAPIsSync:
         return Exchanges(
             page=ret["page"],
             total_pages=ret["total_pages"],
-            data=[
-                Exchange(
-                    exchange=d["exchange"],
-                    blockchain=d["blockchain"],
-                    name=d["name"],
-                    url=d["url"]
-                )
-                for d in ret["data"]
-            ]
+            data=self._get_models(ret["data"], to_exchange)
         )
 
     def info(self, exchange: str) -> Exchange:
@@ -247,7 +453,7 @@ class BlockchainAPIsSync:
             url=ret["url"]
         )
 
-    def pairs(self, page: int = 1, blockchain: str | None = None, exchange: str | None = None) -> Pairs:
+    def pairs(self, page: int = 1, blockchain: str | None = None, exchange: str | None = None, columnar: bool = False) -> Pairs:
         """Get the list of pairs supported by the API
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -263,6 +469,9 @@ class BlockchainAPIsSync:
         :param exchange: The exchange from which you want to get the pairs, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, the data of the page is a dict of columns (numpy arrays if numpy is installed) instead of a list of models, it is faster for analytics, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of pairs supported by the API. It returns token addresses,
         blockchain, exchange and the fee that the pair has.
         
@@ -305,19 +514,10 @@ class BlockchainAPIsSync:
         return Pairs(
             page=ret["page"],
             total_pages=ret["total_pages"],
-            data=[
-                Pair(
-                    blockchain=d["blockchain"],
-                    exchange=d["exchange"],
-                    token0=d["token0"],
-                    token1=d["token1"],
-                    fee=d["fee"]
-                )
-                for d in ret["data"]
-            ]
+            data=to_columns(ret["data"], PAIR_COLUMNS) if columnar else self._get_models(ret["data"], to_pair)
         )
 
-    def reserves(self, blockchain: str, token0: str, token1: str, exchange: str | None = None) -> List[Reserve]:
+    def reserves(self, blockchain: str, token0: str, token1: str, exchange: str | None = None, columnar: bool = False) -> List[Reserve] | Dict[str, Any]:
         """Get the liquidity inside of the reserve of two tokens.
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -336,6 +536,9 @@ class BlockchainAPIsSync:
         :param exchange: The id of the exchange from which you want to get the reserve, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, a dict with one column per field (numpy arrays if numpy is installed, arrays or lists otherwise) is returned instead of the list of Reserve, the amounts keep their exact value, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of all of the reserve for the given pair, blockchain and exchange.
         Can return an empty list if the given pair was not found.
 
@@ -354,7 +557,7 @@ class BlockchainAPIsSync:
 
         ]
         ```
-        :rtype: List[Reserve]
+        :rtype: List[Reserve] | Dict[str, Any]
         """
         params = {}
         params["blockchain"] = blockchain
@@ -363,6 +566,8 @@ class BlockchainAPIsSync:
         params["token0"] = token0
         params["token1"] = token1
         ret = self._do_request("/v0/exchanges/pairs/reserves", params)
+        if columnar:
+            return to_columns(ret, RESERVE_COLUMNS)
         return [
             Reserve(
                 blockchain=r["blockchain"],
@@ -375,7 +580,7 @@ class BlockchainAPIsSync:
             for r in ret
         ]
 
-    def amount_out(self, blockchain: str, tokenIn: str, tokenOut: str, amountIn: int, exchange: str | None = None) -> List[AmountOut]:
+    def amount_out(self, blockchain: str, tokenIn: str, tokenOut: str, amountIn: int, exchange: str | None = None, columnar: bool = False) -> List[AmountOut] | Dict[str, Any]:
         """Get the amount of tokenOut that you will get after selling amountIn tokenIn
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -397,6 +602,9 @@ class BlockchainAPIsSync:
         :param exchange: The exchange on which you want to do the trade, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, a dict with one column per field (numpy arrays if numpy is installed, arrays or lists otherwise) is returned instead of the list of AmountOut, the amounts keep their exact value, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of the amount out that you will get on all of the exchanges. It can return an empty list if the given pair was not found for the given parameters.
 
 
@@ -414,7 +622,7 @@ class BlockchainAPIsSync:
 
         ]
         ```
-        :rtype: List[AmountOut]
+        :rtype: List[AmountOut] | Dict[str, Any]
         """
         params = {}
         params["blockchain"] = blockchain
@@ -424,6 +632,8 @@ class BlockchainAPIsSync:
         if exchange is not None:
             params["exchange"] = exchange
         ret = self._do_request("/v0/exchanges/pairs/amountOut", params)
+        if columnar:
+            return to_columns(ret, AMOUNT_COLUMNS)
         return [
             AmountOut(
                 blockchain=r["blockchain"],
@@ -436,7 +646,7 @@ class BlockchainAPIsSync:
             for r in ret
         ]
 
-    def amount_in(self, blockchain: str, tokenIn: str, tokenOut: str, amountOut: int, exchange: str | None = None) -> List[AmountIn]:
+    def amount_in(self, blockchain: str, tokenIn: str, tokenOut: str, amountOut: int, exchange: str | None = None, columnar: bool = False) -> List[AmountIn] | Dict[str, Any]:
         """Get the amount of tokenIn that you need to sell in order to get amountOut tokenOut
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -458,6 +668,9 @@ class BlockchainAPIsSync:
         :param exchange: The exchange on which you want to do the trade, defaults to None
         :type exchange: str, Optional
         :example exchange: uniswapv2_ethereum
+        :param columnar: If True, a dict with one column per field (numpy arrays if numpy is installed, arrays or lists otherwise) is returned instead of the list of AmountIn, the amounts keep their exact value, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of amount in that you will get on all of the exchanges. It can return an empty list if the given pair was not found.
 
 
@@ -475,7 +688,7 @@ class BlockchainAPIsSync:
 
         ]
         ```
-        :rtype: List[AmountIn]
+        :rtype: List[AmountIn] | Dict[str, Any]
         """
         params = {}
         params["blockchain"] = blockchain
@@ -485,6 +698,8 @@ class BlockchainAPIsSync:
         if exchange is not None:
             params["exchange"] = exchange
         ret = self._do_request("/v0/exchanges/pairs/amountIn", params)
+        if columnar:
+            return to_columns(ret, AMOUNT_COLUMNS)
         return [
             AmountIn(
                 blockchain=r["blockchain"],
@@ -497,7 +712,7 @@ class BlockchainAPIsSync:
             for r in ret
         ]
 
-    def tokens(self, page: int = 1, blockchain: str | None = None) -> Tokens:
+    def tokens(self, page: int = 1, blockchain: str | None = None, columnar: bool = False) -> Tokens:
         """Get the list of supported tokens
 
         :raises BlockchainNotSupportedException: When an invalid blockchain id is given
@@ -509,6 +724,9 @@ class BlockchainAPIsSync:
         :param blockchain: The blockchain on which you want to get the tokens, defaults to None
         :type blockchain: str, Optional
         :example blockchain: ethereum
+        :param columnar: If True, the data of the page is a dict of columns (numpy arrays if numpy is installed) instead of a list of models, it is faster for analytics, defaults to False
+        :type columnar: bool, Optional
+        :example columnar: False
         :return: The list of supported tokens ordered by market cap in a descending order.
         
         The market capitalization is in dollars, it can be null if the liquidity available for the given token is lower than 1000$.
@@ -580,15 +798,7 @@ class BlockchainAPIsSync:
         return Tokens(
             page=ret["page"],
             total_pages=ret["total_pages"],
-            data=[
-                Token(
-                    blockchain=d["blockchain"],
-                    address=d["address"],
-                    decimals=d["decimals"],
-                    market_cap=d["market_cap"]
-                )
-                for d in ret["data"]
-            ]
+            data=to_columns(ret["data"], TOKEN_COLUMNS) if columnar else self._get_models(ret["data"], to_token)
         )
 
     def info(self, blockchain: str, token: str) -> Token:
@@ -685,22 +895,32 @@ class BlockchainAPIsSync:
         ```
         :rtype: str
         """
-        str_amount = str(amount)
-
-        # special case when decimals is 0
-        if decimals == 0:
-            return str_amount
-
-        # Check if the string length is less than the decimals
-        if len(str_amount) <= decimals:
-            # Add leading zeros to the string
-            str_amount = '0' * (decimals - len(str_amount) + 1) + str_amount
-            
-        # Insert the decimal point at the correct position
-        str_amount = str_amount[:-decimals] + "." + str_amount[-decimals:]
-        
-        str_amount = str_amount.rstrip('0').rstrip('.') if '.' in str_amount else str_amount
-        return str_amount
+        return get_token_decimal_form(amount, decimals)
+
+    def get_token_decimal_forms(self, amounts: List[int], decimals: int | List[int]) -> List[str]:
+        """Convert many tokens from their unsigned integer form to their decimal form.
+
+        It gives exactly the same results as get_token_decimal_form called on each amount,
+        and it is faster when the amounts share the same decimals (for example to display
+        the balances of a token on a dashboard).
+
+        :param amounts: The integer amounts that you want to convert, it can also be a numpy array
+        :type amounts: List[int]
+        :example amounts: [2500000000000000000, 1000000000000]
+        :param decimals: The amount of decimals of the token, shared by all of the amounts, or a
+                         list with the decimals of each amount. You can use the [decimals](/docs/python-sdk/blockchain-apis/decimals)
+                         method in order to get the amount of decimals.
+        :type decimals: int | List[int]
+        :example decimals: 18
+        :return: The given amounts in a decimal form, in the same order.
+
+        Example response:
+        ```json
+        ["2.5", "0.000001"]
+        ```
+        :rtype: List[str]
+        """
+        return get_token_decimal_forms(amounts, decimals)
 
     def get_token_unsigned_form(self, amount: str, decimals: int) -> int:
         """Convert a token from his decimal form back to his unsigned integer form (this
@@ -726,21 +946,29 @@ class BlockchainAPIsSync:
         ```
         :rtype: int
         """
-        split = amount.split('.')
-        if len(split) >= 2:
-            integer_part, fractional_part = split
-        else:
-            integer_part, fractional_part = split[0], ""
-
-        # Check if the fractional part has less digits than the decimal places
-        if len(fractional_part) < decimals:
-            # Append zeros to the end of the fractional part
-            fractional_part += '0' * (decimals - len(fractional_part))
-        else:
-            # Trim the fractional part to the number of decimal places
-            fractional_part = fractional_part[:decimals]
-
-        # Combine the integer and fractional parts and convert to an integer
-        integer_token_amount = int(integer_part + fractional_part)
-
-        return integer_token_amount
+        return get_token_unsigned_form(amount, decimals)
+
+    def get_token_unsigned_forms(self, amounts: List[str], decimals: int | List[int]) -> List[int]:
+        """Convert many tokens from their decimal form back to their unsigned integer form (this
+        method does the reverse of get_token_decimal_forms)
+
+        It gives exactly the same results (and raises the same exceptions) as
+        get_token_unsigned_form called on each amount.
+
+        :param amounts: The amounts in str format that you want to convert, it can also be a numpy array
+        :type amounts: List[str]
+        :example amounts: ["2.5", "0.000001"]
+        :param decimals: The amount of decimals of the token, shared by all of the amounts, or a
+                         list with the decimals of each amount. You can use the [decimals](/docs/python-sdk/blockchain-apis/decimals)
+                         method in order to get the amount of decimals.
+        :type decimals: int | List[int]
+        :example decimals: 18
+        :return: The amounts converted to unsigned integers, in the same order.
+
+        Example response:
+        ```json
+        [2500000000000000000, 1000000000000]
+        ```
+        :rtype: List[int]
+        """
+        return get_token_unsigned_forms(amounts, decimals)
@@ -0,0 +1,80 @@
+from array import array
+from typing import Any, Dict, List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+Columns = Dict[str, Any]
+"""A struct-of-arrays result: for each field, the array of its values"""
+
+STR_COLUMN = "str"
+"""A column of strings: a numpy array of objects, or a list without numpy"""
+
+INT_COLUMN = "int"
+"""A column of small integers: a numpy int64 array, or an array("q") without numpy"""
+
+BIG_INT_COLUMN = "big_int"
+"""A column of integers that can be bigger than 64 bits (amounts of tokens), they keep their
+exact value: a numpy array of Python ints (object dtype), or a list without numpy"""
+
+FLOAT_COLUMN = "float"
+"""A column of floats, the missing values are NaN: a numpy float64 array, or an array("d") without numpy"""
+
+PAIR_COLUMNS = {"blockchain": STR_COLUMN, "exchange": STR_COLUMN, "token0": STR_COLUMN,
+                "token1": STR_COLUMN, "fee": INT_COLUMN}
+TOKEN_COLUMNS = {"blockchain": STR_COLUMN, "address": STR_COLUMN, "decimals": INT_COLUMN,
+                 "market_cap": FLOAT_COLUMN}
+RESERVE_COLUMNS = {"blockchain": STR_COLUMN, "exchange": STR_COLUMN, "token0": STR_COLUMN,
+                   "token1": STR_COLUMN, "reserve0": BIG_INT_COLUMN, "reserve1": BIG_INT_COLUMN}
+AMOUNT_COLUMNS = {"blockchain": STR_COLUMN, "exchange": STR_COLUMN, "tokenIn": STR_COLUMN,
+                  "tokenOut": STR_COLUMN, "amountIn": BIG_INT_COLUMN, "amountOut": BIG_INT_COLUMN}
+"""The columns of AmountOut and of AmountIn"""
+
+
+def _to_numpy_column(values: List[Any], column_type: str) -> Any:
+    if column_type == INT_COLUMN:
+        return numpy.fromiter(values, dtype=numpy.int64, count=len(values))
+    if column_type == FLOAT_COLUMN:
+        return numpy.fromiter((numpy.nan if value is None else value for value in values),
+                              dtype=numpy.float64, count=len(values))
+    # numpy.array would convert the strings to fixed-size unicode and the big
+    # integers to floats (or fail), we keep the Python objects
+    ret = numpy.empty(len(values), dtype=object)
+    ret[:] = values
+    return ret
+
+
+def _to_python_column(values: List[Any], column_type: str) -> Any:
+    if column_type == INT_COLUMN:
+        return array("q", values)
+    if column_type == FLOAT_COLUMN:
+        return array("d", (float("nan") if value is None else value for value in values))
+    return values
+
+
+def to_columns(rows: List[Dict[str, Any]], column_types: Dict[str, str], use_numpy: bool | None = None) -> Columns:
+    """Convert the json elements of a response to columns, without building the models.
+
+    For example, [{"token0": "0xA0b8...", "fee": 300}, {"token0": "0x8E87...", "fee": 500}]
+    with the types {"token0": STR_COLUMN, "fee": INT_COLUMN} gives:
+    {"token0": array(["0xA0b8...", "0x8E87..."], dtype=object), "fee": array([300, 500])}
+
+    :param rows: The json elements of the response
+    :type rows: List[Dict[str, Any]]
+    :param column_types: The type of each column, for example PAIR_COLUMNS
+    :type column_types: Dict[str, str]
+    :param use_numpy: If the columns are numpy arrays, defaults to True when numpy is installed
+    :type use_numpy: bool | None, optional
+    :return: For each field, the array of its values in the order of the rows
+    :rtype: Columns
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    to_column = _to_numpy_column if use_numpy else _to_python_column
+    return {
+        name: to_column([row[name] for row in rows], column_type)
+        for name, column_type in column_types.items()
+    }
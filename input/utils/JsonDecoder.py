@@ -0,0 +1,39 @@
+import json
+from typing import Any, Callable
+
+
+JsonLoads = Callable[[bytes], Any]
+"""A function that decodes the json content of a response"""
+
+EXACT_INTEGER_PATHS = frozenset({
+    "/v0/exchanges/pairs/reserves",
+    "/v0/exchanges/pairs/amountOut",
+    "/v0/exchanges/pairs/amountIn"
+})
+"""The endpoints that return amounts of tokens.
+
+The amounts can be bigger than 64 bits, orjson and ujson don't keep their exact value
+(orjson returns a float), so these responses are always decoded with the json module
+of the standard library.
+"""
+
+
+def get_default_json_loads() -> JsonLoads:
+    """Get the json decoder used by default by the Blockchain APIs instances.
+
+    It uses orjson or ujson if one of them is installed and the json module of the
+    standard library otherwise.
+
+    :return: The function that decodes the json content of a response
+    :rtype: JsonLoads
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        return json.loads
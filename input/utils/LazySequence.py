@@ -0,0 +1,58 @@
+from typing import Any, Callable, Dict, Generic, Iterator, List, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+class LazySequence(Sequence[T], Generic[T]):
+    """Read-only list of models that are built from the json response only when accessed.
+
+    For example, when a bot only looks at the first pairs of a page, the other pairs
+    are never built. Each model is built once, accessing it again gives the same object.
+
+    It can be used like a list (index, slice, len, iteration, comparison with a list).
+    """
+
+    __slots__ = ("_raw", "_build", "_items")
+
+    def __init__(self, raw: List[Dict[str, Any]], build: Callable[[Dict[str, Any]], T]):
+        """Create the view of the json elements
+
+        :param raw: The json elements, for example the "data" of a page of pairs
+        :type raw: List[Dict[str, Any]]
+        :param build: The function that builds the model of a json element
+        :type build: Callable[[Dict[str, Any]], T]
+        """
+        self._raw = raw
+        self._build = build
+        self._items: List[T | None] = [None] * len(raw)
+
+    def _get(self, index: int) -> T:
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._build(self._raw[index])
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        if index < 0 or index >= len(self._raw):
+            raise IndexError("LazySequence index out of range")
+        return self._get(index)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self._raw)):
+            yield self._get(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazySequence, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
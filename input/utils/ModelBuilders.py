@@ -0,0 +1,54 @@
+from typing import Any, Dict
+
+from ..models import Exchange
+from ..models import Pair
+from ..models import Token
+
+
+def to_exchange(d: Dict[str, Any]) -> Exchange:
+    """Build an Exchange from an element of the data of an exchanges page
+
+    :param d: The json element
+    :type d: Dict[str, Any]
+    :return: The exchange
+    :rtype: Exchange
+    """
+    return Exchange(
+        exchange=d["exchange"],
+        blockchain=d["blockchain"],
+        name=d["name"],
+        url=d["url"]
+    )
+
+
+def to_pair(d: Dict[str, Any]) -> Pair:
+    """Build a Pair from an element of the data of a pairs page
+
+    :param d: The json element
+    :type d: Dict[str, Any]
+    :return: The pair
+    :rtype: Pair
+    """
+    return Pair(
+        blockchain=d["blockchain"],
+        exchange=d["exchange"],
+        token0=d["token0"],
+        token1=d["token1"],
+        fee=d["fee"]
+    )
+
+
+def to_token(d: Dict[str, Any]) -> Token:
+    """Build a Token from an element of the data of a tokens page
+
+    :param d: The json element
+    :type d: Dict[str, Any]
+    :return: The token
+    :rtype: Token
+    """
+    return Token(
+        blockchain=d["blockchain"],
+        address=d["address"],
+        decimals=d["decimals"],
+        market_cap=d["market_cap"]
+    )
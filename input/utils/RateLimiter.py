@@ -0,0 +1,161 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """Token bucket that limits the amount of requests sent per second.
+
+    The bucket holds up to `burst` tokens and is refilled with `rate` tokens per second,
+    each request takes one token. When the bucket is empty, the request waits until its
+    token is refilled.
+
+    The tokens are reserved under a lock and the wait happens outside of it, this way a
+    single limiter is shared by coroutines and threads, and the requests are sent in the
+    order in which they asked for a token.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """Create a full bucket
+
+        :param rate: The maximum amount of requests per second
+        :type rate: float
+        :param burst: The amount of requests that can be sent at once after a pause,
+                      defaults to the rate (at least 1)
+        :type burst: int | None, optional
+        """
+        if rate <= 0:
+            raise ValueError(f"The rate must be positive, got: {rate}")
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._burst = burst if burst is not None else max(int(rate), 1)
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+
+        self.acquired = 0
+        """The amount of tokens that were taken"""
+        self.waited = 0
+        """The amount of requests that had to wait for their token"""
+        self.total_wait = 0.0
+        """The total time waited by the requests, in seconds"""
+        self.max_wait = 0.0
+        """The longest time waited by a request, in seconds"""
+
+    @property
+    def rate(self) -> float:
+        """The maximum amount of requests per second"""
+        return self._rate
+
+    def set_rate(self, rate: float, burst: int | None = None):
+        """Change the rate of the limiter, the tokens already in the bucket are kept
+
+        :param rate: The maximum amount of requests per second
+        :type rate: float
+        :param burst: The size of the bucket, defaults to the rate (at least 1)
+        :type burst: int | None, optional
+        """
+        if rate <= 0:
+            raise ValueError(f"The rate must be positive, got: {rate}")
+        with self._lock:
+            self._refill()
+            self._rate = rate
+            self._burst = burst if burst is not None else max(int(rate), 1)
+            self._tokens = min(self._tokens, self._burst)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token, the bucket can go below 0 for the requests that have to wait
+
+        :return: The amount of seconds to wait before the token is available
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = max(-self._tokens / self._rate, 0.0)
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self):
+        """Wait (by blocking the thread) until a request can be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a request can be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get the metrics of the waits
+
+        :return: The amount of requests, of requests that waited, and the total and
+                 maximum wait times in ms
+        :rtype: Dict[str, float]
+        """
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "waited": self.waited,
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+
+_rate_limiters: Dict[str | None, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key: str | None, rate: float) -> RateLimiter:
+    """Get the rate limiter of the given API key.
+
+    The limit of the API is per API key, so all of the instances (async or sync) that
+    use the same API key share the same limiter. When the rate of the existing limiter
+    is different, it is updated to the given rate.
+
+    :param api_key: The API key, None for the requests without API key
+    :type api_key: str | None
+    :param rate: The maximum amount of requests per second
+    :type rate: float
+    :return: The limiter shared by the instances that use the API key
+    :rtype: RateLimiter
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(api_key)
+        if limiter is None:
+            limiter = _rate_limiters[api_key] = RateLimiter(rate)
+    if limiter.rate != rate:
+        limiter.set_rate(rate)
+    return limiter
+
+
+def get_backoff_delay(attempt: int, base: float = 0.1, cap: float = 5.0) -> float:
+    """Get the time to wait before retrying a request that was rejected by the API
+    because of too many requests.
+
+    The delay grows exponentially with the attempts and is jittered (between 0 and the
+    exponential delay), this way the clients that were rejected together don't retry
+    at the same moment.
+
+    :param attempt: The amount of retries already made, starting from 0
+    :type attempt: int
+    :param base: The maximum delay of the first retry in seconds, defaults to 0.1
+    :type base: float, optional
+    :param cap: The maximum delay in seconds, defaults to 5.0
+    :type cap: float, optional
+    :return: The amount of seconds to wait
+    :rtype: float
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from .SingleFlight import SingleFlight, get_request_key
+
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "/v0/blockchains/": 3600,
+    "/v0/exchanges/": 3600,
+    "/v0/exchanges/info": 3600,
+    "/v0/tokens/info": 3600,
+    "/v0/tokens/decimals": 86400
+}
+"""The time to live in seconds of the responses of each endpoint that is cached by default.
+
+These endpoints return reference data that almost never changes, the endpoints with live
+data (reserves, amount_out, amount_in...) are never cached by default.
+"""
+
+
+class ResponseCache:
+    """In-memory cache of the json responses of the API.
+
+    It is opt-in, give it to BlockchainAPIs or to BlockchainAPIsSync to use it:
+    blockchain_apis = BlockchainAPIs(cache=ResponseCache())
+
+    Each endpoint has its own time to live, the endpoints without a time to live are
+    not cached. When the cache is full, the least recently used response is removed.
+    The errors of the API are never cached.
+
+    When the same request is made many times concurrently (for example the decimals of
+    the same token inside of a batch), only one request is sent to the API and the other
+    callers wait for its response.
+    """
+
+    def __init__(self, ttls: Dict[str, float] | None = None, max_size: int = 1024):
+        """Create an empty cache
+
+        :param ttls: The time to live in seconds of the responses of each path, for example
+                     {"/v0/tokens/decimals": 86400}, defaults to DEFAULT_TTLS
+        :type ttls: Dict[str, float] | None, optional
+        :param max_size: The maximum amount of responses that are kept, defaults to 1024
+        :type max_size: int, optional
+        """
+        self._ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._max_size = max_size
+        self._entries: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+        """The cached responses by request, with the time at which they expire"""
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+        self.hits = 0
+        """The amount of responses that were taken from the cache"""
+
+    @property
+    def misses(self) -> int:
+        """The amount of responses that were requested to the API"""
+        return self._single_flight.calls
+
+    @property
+    def deduplicated(self) -> int:
+        """The amount of responses that were shared with a concurrent identical request"""
+        return self._single_flight.deduplicated
+
+    def is_cached(self, path: str) -> bool:
+        """Verify if the responses of the given path are cached
+
+        :param path: The path of the request, for example "/v0/tokens/decimals"
+        :type path: str
+        :return: `True` if the path has a time to live, `False` otherwise
+        :rtype: bool
+        """
+        return path in self._ttls
+
+    def _lookup(self, key: Tuple) -> Tuple[bool, Any]:
+        """Get the response of the request from the cache
+
+        :return: If the response was found and the response
+        :rtype: Tuple[bool, Any]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def _store(self, key: Tuple, value: Any) -> Any:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttls[key[0]], value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def get(self, path: str, params: Dict[str, Any] | None, fetch: Callable[[], Any]) -> Any:
+        """Get the response of a request of the sync client, from the cache or from the API
+
+        :param path: The path of the request
+        :type path: str
+        :param params: The query parameters of the request
+        :type params: Dict[str, Any] | None
+        :param fetch: The function that requests the response to the API
+        :type fetch: Callable[[], Any]
+        :return: The json response
+        :rtype: Any
+        """
+        key = get_request_key(path, params)
+        found, value = self._lookup(key)
+        if found:
+            return value
+        return self._single_flight.do(key, lambda: self._store(key, fetch()))
+
+    async def get_async(self, path: str, params: Dict[str, Any] | None, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Get the response of a request of the async client, from the cache or from the API
+
+        :param path: The path of the request
+        :type path: str
+        :param params: The query parameters of the request
+        :type params: Dict[str, Any] | None
+        :param fetch: The coroutine function that requests the response to the API
+        :type fetch: Callable[[], Awaitable[Any]]
+        :return: The json response
+        :rtype: Any
+        """
+        key = get_request_key(path, params)
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        async def fetch_and_store() -> Any:
+            return self._store(key, await fetch())
+
+        return await self._single_flight.do_async(key, fetch_and_store)
+
+    def clear(self):
+        """Remove all of the responses from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters of the cache
+
+        :return: The hits, the misses, the deduplicated requests and the amount of cached responses
+        :rtype: Dict[str, int]
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "deduplicated": self.deduplicated,
+                "size": len(self._entries)
+            }
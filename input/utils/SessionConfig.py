@@ -0,0 +1,150 @@
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict
+
+from aiohttp import (ClientSession, ClientTimeout, TCPConnector, TraceConfig, TraceConnectionCreateEndParams,
+                     TraceConnectionQueuedEndParams, TraceConnectionQueuedStartParams,
+                     TraceConnectionReuseconnParams)
+
+
+DEFAULT_BASE_URL = "https://api.blockchainapis.io"
+"""The url of the Blockchain APIs server"""
+
+
+class PoolMetrics:
+    """Counters of the connections of a session, filled by the trace config of the session.
+
+    When many requests are made at the same time, the connections of the pool are
+    all used and the next requests wait (are queued) until a connection is free.
+    A lot of queued requests means that the connector limit is too low.
+    """
+
+    def __init__(self):
+        self.created = 0
+        """The amount of connections opened to the server"""
+        self.reused = 0
+        """The amount of requests that reused a connection kept alive"""
+        self.queued = 0
+        """The amount of requests that waited for a free connection"""
+        self.queue_wait = 0.0
+        """The total time waited by the queued requests, in seconds"""
+
+    async def _on_connection_create_end(self, _: ClientSession, __: SimpleNamespace, ___: TraceConnectionCreateEndParams):
+        self.created += 1
+
+    async def _on_connection_reuseconn(self, _: ClientSession, __: SimpleNamespace, ___: TraceConnectionReuseconnParams):
+        self.reused += 1
+
+    async def _on_connection_queued_start(self, _: ClientSession, context: SimpleNamespace, __: TraceConnectionQueuedStartParams):
+        context.queued_at = time.perf_counter()
+
+    async def _on_connection_queued_end(self, _: ClientSession, context: SimpleNamespace, __: TraceConnectionQueuedEndParams):
+        self.queued += 1
+        self.queue_wait += time.perf_counter() - context.queued_at
+
+    def get_trace_config(self) -> TraceConfig:
+        """Get the trace config that fills the metrics, it is given to the ClientSession
+
+        :return: The trace config
+        :rtype: TraceConfig
+        """
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+        return trace_config
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get the counters
+
+        :return: The created, reused and queued connections and the total queue wait in ms
+        :rtype: Dict[str, float]
+        """
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "queued": self.queued,
+            "queue_wait_ms": round(self.queue_wait * 1000, 3)
+        }
+
+
+def get_connector_stats(session: ClientSession) -> Dict[str, int]:
+    """Get a snapshot of the connection pool of a session
+
+    :param session: The session
+    :type session: ClientSession
+    :return: The maximum amount of connections (0 when there is no limit), and the
+             amount of connections in use and kept alive (idle) at the moment
+    :rtype: Dict[str, int]
+    """
+    connector = session.connector
+    if connector is None:
+        return {"limit": 0, "in_use": 0, "idle": 0}
+    # aiohttp doesn't give the amount of connections, we read its pool
+    acquired = getattr(connector, "_acquired", ())
+    idle = getattr(connector, "_conns", {})
+    return {
+        "limit": connector.limit,
+        "in_use": len(acquired),
+        "idle": sum(len(connections) for connections in idle.values())
+    }
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """The configuration of the HTTP session of BlockchainAPIs.
+
+    For example, to send the requests to a local stand-in server with more connections:
+    blockchain_apis = BlockchainAPIs(session_config=SessionConfig(base_url="http://127.0.0.1:8000", limit=200))
+    """
+
+    base_url: str = DEFAULT_BASE_URL
+    """The url of the server"""
+
+    limit: int = 100
+    """The maximum amount of connections open at the same time, 0 for no limit"""
+
+    limit_per_host: int = 0
+    """The maximum amount of connections open at the same time to the same host, 0 for no limit"""
+
+    use_dns_cache: bool = True
+    """If the result of the DNS resolution is kept"""
+
+    ttl_dns_cache: int | None = 10
+    """The amount of seconds for which the result of the DNS resolution is kept, None to keep it forever"""
+
+    keepalive_timeout: float = 15
+    """The amount of seconds for which an unused connection is kept alive"""
+
+    total_timeout: float | None = 300
+    """The maximum amount of seconds of a request (including the wait for a free connection), None for no timeout"""
+
+    connect_timeout: float | None = None
+    """The maximum amount of seconds to wait for a free connection and to open it, None for no timeout"""
+
+    read_timeout: float | None = None
+    """The maximum amount of seconds between two reads of the response, None for no timeout"""
+
+    def create_session(self, pool_metrics: PoolMetrics | None = None) -> ClientSession:
+        """Create a session with this configuration, it must be called inside of an event loop.
+
+        The session can be shared by many BlockchainAPIs instances (with their `session`
+        parameter), this way they use the same connection pool.
+
+        :param pool_metrics: The metrics filled by the session, defaults to None
+        :type pool_metrics: PoolMetrics | None, optional
+        :return: The new session, it must be closed by its owner
+        :rtype: ClientSession
+        """
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        timeout = ClientTimeout(total=self.total_timeout, connect=self.connect_timeout, sock_read=self.read_timeout)
+        trace_configs = [pool_metrics.get_trace_config()] if pool_metrics is not None else None
+        return ClientSession(self.base_url, connector=connector, timeout=timeout, trace_configs=trace_configs)
@@ -0,0 +1,154 @@
+import asyncio
+from functools import partial
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+def get_request_key(path: str, params: Dict[str, Any] | None) -> Tuple:
+    """Get the key that identifies a request, two requests with the same key get
+    the same response.
+
+    :param path: The path of the request, for example "/v0/tokens/decimals"
+    :type path: str
+    :param params: The query parameters of the request
+    :type params: Dict[str, Any] | None
+    :return: The path followed by the sorted parameters
+    :rtype: Tuple
+    """
+    if params is None:
+        return (path,)
+    return (path,) + tuple(sorted((key, str(value)) for key, value in params.items()))
+
+
+class _InFlightCall:
+    """A call of a sync function that is being made, the other threads that
+    want the same result wait for it instead of making the same call"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class _AsyncInFlightCall:
+    """A call of a coroutine function that is being made inside of its own task, the
+    other coroutines that want the same result wait for the task"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+        """The amount of coroutines that wait for the result, the owner included"""
+
+
+class SingleFlight:
+    """Share the result of identical calls that are made at the same time.
+
+    When a call is made with a key while another call with the same key is running,
+    it waits for the result of the running call instead of making its own. Once the
+    running call is done, the next call with the key is made again: nothing is kept.
+
+    For example, when many coroutines ask for the same amount_out quote at the same
+    moment, only one request is sent to the API.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple, _InFlightCall] = {}
+        self._async_in_flight: Dict[Tuple, _AsyncInFlightCall] = {}
+
+        self.calls = 0
+        """The amount of calls that were really made"""
+        self.deduplicated = 0
+        """The amount of calls that got the result of an identical running call"""
+
+    def do(self, key: Tuple, call: Callable[[], Any]) -> Any:
+        """Make the sync call, or wait for the result of the running call with the same key
+
+        :param key: The key of the call, for example from get_request_key
+        :type key: Tuple
+        :param call: The function to call
+        :type call: Callable[[], Any]
+        :return: The result of the call, if the call raises an exception, all of the
+                 callers get it
+        :rtype: Any
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            is_owner = in_flight is None
+            if is_owner:
+                in_flight = self._in_flight[key] = _InFlightCall()
+                self.calls += 1
+            else:
+                self.deduplicated += 1
+
+        if not is_owner:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        try:
+            in_flight.value = call()
+            return in_flight.value
+        except BaseException as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+
+    async def do_async(self, key: Tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Make the async call, or wait for the result of the running call with the same key
+
+        The call runs inside of its own task. A caller that is cancelled (for example by
+        asyncio.wait_for) stops waiting without cancelling the call of the others, the
+        call is only cancelled when no caller waits for it anymore.
+
+        :param key: The key of the call, for example from get_request_key
+        :type key: Tuple
+        :param call: The coroutine function to call
+        :type call: Callable[[], Awaitable[Any]]
+        :return: The result of the call, if the call raises an exception, all of the
+                 callers get it
+        :rtype: Any
+        """
+        with self._lock:
+            in_flight = self._async_in_flight.get(key)
+            if in_flight is None:
+                in_flight = self._async_in_flight[key] = _AsyncInFlightCall(asyncio.ensure_future(call()))
+                in_flight.task.add_done_callback(partial(self._on_async_done, key, in_flight))
+                self.calls += 1
+            else:
+                self.deduplicated += 1
+            in_flight.waiters += 1
+
+        try:
+            return await asyncio.shield(in_flight.task)
+        finally:
+            with self._lock:
+                in_flight.waiters -= 1
+                if in_flight.waiters == 0 and not in_flight.task.done():
+                    # Every caller was cancelled, nobody needs the result
+                    in_flight.task.cancel()
+                    self._forget_async(key, in_flight)
+
+    def _on_async_done(self, key: Tuple, in_flight: _AsyncInFlightCall, _: asyncio.Task):
+        with self._lock:
+            self._forget_async(key, in_flight)
+
+    def _forget_async(self, key: Tuple, in_flight: _AsyncInFlightCall):
+        """Remove the async call from the running calls, the next call with its key is made
+        again. The lock must be held.
+
+        :param key: The key of the call
+        :type key: Tuple
+        :param in_flight: The call, it is only removed if it is still the running call of the key
+        :type in_flight: _AsyncInFlightCall
+        """
+        if self._async_in_flight.get(key) is in_flight:
+            del self._async_in_flight[key]
@@ -0,0 +1,127 @@
+from itertools import repeat
+from numbers import Integral
+from typing import Any, List, Sequence
+
+
+def get_token_decimal_form(amount: int, decimals: int) -> str:
+    """Convert a token from his unsigned integer form to his decimal form.
+
+    For highest precision, the implementation is made using only str.
+
+    :param amount: The integer amount that you want to convert, for example 2500000000000000000
+    :type amount: int
+    :param decimals: The amount of decimals of the token, for example 18
+    :type decimals: int
+    :return: The given amount in a decimal form, for example "2.5"
+    :rtype: str
+    """
+    str_amount = str(amount)
+
+    # special case when decimals is 0
+    if decimals == 0:
+        return str_amount
+
+    # Check if the string length is less than the decimals
+    if len(str_amount) <= decimals:
+        # Add leading zeros to the string
+        str_amount = '0' * (decimals - len(str_amount) + 1) + str_amount
+
+    # Insert the decimal point at the correct position
+    str_amount = str_amount[:-decimals] + "." + str_amount[-decimals:]
+
+    str_amount = str_amount.rstrip('0').rstrip('.') if '.' in str_amount else str_amount
+    return str_amount
+
+
+def get_token_unsigned_form(amount: str, decimals: int) -> int:
+    """Convert a token from his decimal form back to his unsigned integer form (this
+    function does the reverse of get_token_decimal_form)
+
+    For the highest precision, the implementation only uses str
+
+    :param amount: The amount in str format that you want to convert, for example "2.5"
+    :type amount: str
+    :param decimals: The amount of decimals of the token, for example 18
+    :type decimals: int
+    :return: The amount converted to unsigned integer, for example 2500000000000000000
+    :rtype: int
+    """
+    split = amount.split('.')
+    if len(split) >= 2:
+        integer_part, fractional_part = split
+    else:
+        integer_part, fractional_part = split[0], ""
+
+    # Check if the fractional part has less digits than the decimal places
+    if len(fractional_part) < decimals:
+        # Append zeros to the end of the fractional part
+        fractional_part += '0' * (decimals - len(fractional_part))
+    else:
+        # Trim the fractional part to the number of decimal places
+        fractional_part = fractional_part[:decimals]
+
+    # Combine the integer and fractional parts and convert to an integer
+    integer_token_amount = int(integer_part + fractional_part)
+
+    return integer_token_amount
+
+
+def _to_list(values: Any) -> List[Any]:
+    # The numpy arrays give Python objects with tolist (Python ints instead of numpy.int64)
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def get_token_decimal_forms(amounts: Sequence[int], decimals: int | Sequence[int]) -> List[str]:
+    """Convert many tokens from their unsigned integer form to their decimal form.
+
+    It gives exactly the same results as get_token_decimal_form called on each amount.
+    When the decimals are shared by all of the amounts, it is faster: the amount is
+    split with divmod by 10**decimals (computed once) and the fractional part is padded
+    with zeros by adding 10**decimals.
+
+    :param amounts: The integer amounts, a sequence or a numpy array
+    :type amounts: Sequence[int]
+    :param decimals: The decimals shared by all of the amounts, or the decimals of each amount
+    :type decimals: int | Sequence[int]
+    :return: The decimal form of each amount, in the same order
+    :rtype: List[str]
+    """
+    amounts = _to_list(amounts)
+    if not isinstance(decimals, Integral):
+        decimals = _to_list(decimals)
+        if len(decimals) != len(amounts):
+            raise ValueError(f"Got {len(amounts)} amounts but {len(decimals)} decimals")
+        return [get_token_decimal_form(amount, d) for amount, d in zip(amounts, decimals)]
+
+    # For example numpy.int64
+    decimals = int(decimals)
+    if decimals < 0 or not set(map(type, amounts)) <= {int} or min(amounts, default=0) < 0:
+        return [get_token_decimal_form(amount, decimals) for amount in amounts]
+    power = 10 ** decimals
+    # When the remainder is not 0, the fractional part has a digit that is not 0,
+    # so rstrip never removes the decimal point
+    return [f"{q}.{str(r + power)[1:]}".rstrip("0") if r else str(q)
+            for q, r in map(divmod, amounts, repeat(power))]
+
+
+def get_token_unsigned_forms(amounts: Sequence[str], decimals: int | Sequence[int]) -> List[int]:
+    """Convert many tokens from their decimal form back to their unsigned integer form.
+
+    It calls get_token_unsigned_form on each amount, it raises the exception of the
+    first invalid amount.
+
+    :param amounts: The amounts in str format, a sequence or a numpy array
+    :type amounts: Sequence[str]
+    :param decimals: The decimals shared by all of the amounts, or the decimals of each amount
+    :type decimals: int | Sequence[int]
+    :return: The unsigned integer form of each amount, in the same order
+    :rtype: List[int]
+    """
+    amounts = _to_list(amounts)
+    if isinstance(decimals, Integral):
+        decimals = int(decimals)
+        return [get_token_unsigned_form(amount, decimals) for amount in amounts]
+    decimals = _to_list(decimals)
+    if len(decimals) != len(amounts):
+        raise ValueError(f"Got {len(amounts)} amounts but {len(decimals)} decimals")
+    return [get_token_unsigned_form(amount, d) for amount, d in zip(amounts, decimals)]
@@ -0,0 +1,49 @@
+"""
+Contains the tools used by the Blockchain APIs instance classes to make
+fewer requests to the API.
+
+For example, the ResponseCache keeps the responses of the endpoints that
+almost never change (blockchains, exchanges, token decimals...):
+```python
+blockchain_apis = BlockchainAPIs(cache=ResponseCache())
+```
+
+The SingleFlight sends only once the identical requests that are made at the same time
+and the RateLimiter keeps the amount of requests per second under the limit of the API key.
+The responses are decoded with the fastest installed json library (get_default_json_loads),
+and the LazySequence builds the models of a page only when they are accessed.
+With to_columns, the responses are converted to columns (struct-of-arrays) for analytics.
+TokenAmounts converts the amounts of tokens between their integer and decimal forms.
+The ModelBuilders build the models of the pages from their json elements.
+The SessionConfig configures the HTTP session (connection pool, timeouts...) and
+the PoolMetrics count the connections that it creates, reuses and waits for.
+"""
+
+from .ResponseCache import ResponseCache
+from .ResponseCache import DEFAULT_TTLS
+from .SingleFlight import SingleFlight
+from .SingleFlight import get_request_key
+from .RateLimiter import RateLimiter
+from .RateLimiter import get_backoff_delay
+from .RateLimiter import get_rate_limiter
+from .JsonDecoder import JsonLoads
+from .JsonDecoder import EXACT_INTEGER_PATHS
+from .JsonDecoder import get_default_json_loads
+from .LazySequence import LazySequence
+from .Columns import Columns
+from .Columns import AMOUNT_COLUMNS
+from .Columns import PAIR_COLUMNS
+from .Columns import RESERVE_COLUMNS
+from .Columns import TOKEN_COLUMNS
+from .Columns import to_columns
+from .TokenAmounts import get_token_decimal_form
+from .TokenAmounts import get_token_decimal_forms
+from .TokenAmounts import get_token_unsigned_form
+from .TokenAmounts import get_token_unsigned_forms
+from .ModelBuilders import to_exchange
+from .ModelBuilders import to_pair
+from .ModelBuilders import to_token
+from .SessionConfig import DEFAULT_BASE_URL
+from .SessionConfig import PoolMetrics
+from .SessionConfig import SessionConfig
+from .SessionConfig import get_connector_stats
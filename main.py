@@ -1,14 +1,192 @@
-from dataclasses import asdict
-import json
+from argparse import ArgumentParser, Namespace
+import sys
+from typing import TYPE_CHECKING, List, Tuple
 
-from src.parser.ProjectParser import ProjectParser
-from src.writer.Writer import Writer
+from src.writer.FsyncModes import FSYNC_MODES
 
-def main():
-    dest_writer = Writer("dest/")
-    parser = ProjectParser()
-    full_project = parser.parse_project("input/")
+# The parsers and the writer (with docstring_parser, ast and the dataclasses) are only
+# imported by the command that uses them, this way `--help` starts quickly
+if TYPE_CHECKING:
+    from src.dataclasses.Project import Project
+    from src.incremental.Manifest import Manifest
+    from src.parser.ProjectParser import ProjectParser
+    from src.writer.Writer import Writer
+
+COMMANDS = ("build", "check", "dump-ir")
+"""The subcommands of the command line, build is used when no subcommand is given
+"""
+
+def add_source_arguments(arg_parser: ArgumentParser):
+    """Add the arguments that choose how the source folder is parsed
+
+    :param arg_parser: The parser of a subcommand
+    :type arg_parser: ArgumentParser
+    """
+    arg_parser.add_argument("--source", default="input/", help="The folder of the Python package to document (default: input/)")
+    arg_parser.add_argument("--cache-dir",
+                            help="Keep the parsed files inside of this folder between runs, this way "
+                                 "the files that didn't change are not parsed again")
+    arg_parser.add_argument("--cache-size",
+                            type=int,
+                            default=64,
+                            help="The maximum size of the cache folder in MB, the least recently used "
+                                 "entries are removed above it (default: 64)")
+    arg_parser.add_argument("--jobs",
+                            type=int,
+                            default=1,
+                            help="The amount of processes used to parse the files (default: 1)")
+
+def parse_args(argv: List[str] | None = None) -> Namespace:
+    arg_parser = ArgumentParser(description="Generate a docusaurus documentation from a Sphinx Python project.")
+    subparsers = arg_parser.add_subparsers(dest="command", metavar="{build,check,dump-ir}")
+
+    build_parser = subparsers.add_parser("build",
+                                         help="Write the documentation (default when no command is given)",
+                                         description="Write the documentation of the source folder.")
+    add_source_arguments(build_parser)
+    build_parser.add_argument("--dest", default="dest/", help="The folder in which the documentation is written (default: dest/)")
+    build_parser.add_argument("--incremental",
+                              action="store_true",
+                              help="Allow the destination folder to exist, only parse the files that changed "
+                                   "and only write the pages whose content changed since the previous run")
+    build_parser.add_argument("--write-jobs",
+                              type=int,
+                              default=1,
+                              help="The amount of threads used to render and write the pages (default: 1)")
+    build_parser.add_argument("--fsync",
+                              choices=FSYNC_MODES,
+                              default="none",
+                              help="Flush the pages to the disk after each page (each), once at the end (end) "
+                                   "or let the operating system decide (none) (default: none)")
+    build_parser.add_argument("--watch",
+                              action="store_true",
+                              help="After the documentation is written, keep watching the source folder and "
+                                   "regenerate the pages of the files that change (implies --incremental)")
+    build_parser.add_argument("--profile",
+                              action="store_true",
+                              help="Print the time spent in each stage of the build (reading, ast.parse, "
+                                   "docstring_parser.parse, ast.unparse, rendering and writing) and the slowest files")
+    build_parser.add_argument("--profile-output",
+                              help="Run the build under cProfile and dump the pstats output to this file")
+    build_parser.add_argument("--dump-ir",
+                              help="Also write the parsed project (main classes, methods, models and exceptions) "
+                                   "to this JSONL file, one record per entity, or to the standard output with -")
+    build_parser.add_argument("--load-ir",
+                              help="Write the documentation from the project stored in this JSONL file "
+                                   "(written by --dump-ir) instead of parsing the source folder")
+
+    check_parser = subparsers.add_parser("check",
+                                         help="Parse the project and report the links to missing models and exceptions",
+                                         description="Parse the project without writing it and report the links to "
+                                                     "models and exceptions that don't exist. The exit code is 1 when "
+                                                     "a link is broken.")
+    add_source_arguments(check_parser)
+    check_parser.add_argument("--load-ir", help="Check the project stored in this JSONL file instead of parsing the source folder")
+
+    dump_ir_parser = subparsers.add_parser("dump-ir",
+                                           help="Write the parsed project as JSONL without writing the documentation",
+                                           description="Parse the project and write it as JSONL, one record per main "
+                                                       "class, method, module, model and exception.")
+    add_source_arguments(dump_ir_parser)
+    dump_ir_parser.add_argument("--output", default="-", help="The JSONL file, - for the standard output (default: -)")
+
+    if argv is None:
+        argv = sys.argv[1:]
+    # Keep the command line of the previous versions working: main.py --dest dest/
+    if len(argv) == 0 or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["build"] + argv
+    args = arg_parser.parse_args(argv)
+    if args.command == "build" and args.load_ir is not None and args.watch:
+        build_parser.error("--watch parses the source folder, it can't be used with --load-ir")
+    return args
+
+def parse_project(args: Namespace, manifest: "Manifest | None" = None) -> Tuple["ProjectParser", "Project"]:
+    """Parse the source folder, or load the project from --load-ir when it is given
+
+    :param args: The arguments of the command
+    :type args: Namespace
+    :param manifest: The manifest of the previous run, defaults to None
+    :type manifest: Manifest | None, optional
+    :return: The parser of the project and the project
+    :rtype: Tuple[ProjectParser, Project]
+    """
+    from src.incremental.ParseCache import ParseCache
+    from src.parser.ProjectParser import ProjectParser
+
+    cache = ParseCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache_dir is not None else None
+    parser = ProjectParser(cache, args.jobs)
+    if getattr(args, "load_ir", None) is not None:
+        from src.ir.ProjectIR import load_project_ir
+        return parser, load_project_ir(args.load_ir)
+    return parser, parser.parse_project(args.source, manifest)
+
+def build(args: Namespace) -> Tuple["ProjectParser", "Writer", "Manifest | None", "Project"]:
+    from src.incremental.Manifest import Manifest
+    from src.writer.Writer import Writer
+
+    manifest = Manifest.load(args.dest) if args.incremental or args.watch else None
+    dest_writer = Writer(args.dest, manifest, args.write_jobs, args.fsync)
+    parser, full_project = parse_project(args, manifest)
+    if args.dump_ir is not None:
+        from src.ir.ProjectIR import dump_project_ir
+        dump_project_ir(full_project, args.dump_ir)
     dest_writer.write(full_project)
+    if manifest is not None:
+        manifest.save(args.dest)
+    return parser, dest_writer, manifest, full_project
+
+def run_build(args: Namespace) -> int:
+    from src.profiling.Profiler import Profiler, set_profiler
+
+    profiler = None
+    if args.profile:
+        profiler = Profiler()
+        set_profiler(profiler)
+    if args.profile_output is not None:
+        import cProfile
+        c_profile = cProfile.Profile()
+        parser, dest_writer, manifest, full_project = c_profile.runcall(build, args)
+        c_profile.dump_stats(args.profile_output)
+    else:
+        parser, dest_writer, manifest, full_project = build(args)
+    if profiler is not None:
+        print(profiler.get_report())
+    if args.watch:
+        from src.watch.ProjectWatcher import ProjectWatcher
+        ProjectWatcher(args.source, args.dest, parser, dest_writer, manifest).watch(full_project)
+    return 0
+
+def run_check(args: Namespace) -> int:
+    from src.incremental.DependencyIndex import DependencyIndex
+
+    _, project = parse_project(args)
+    dangling_references = DependencyIndex(project).get_dangling_references()
+    for source, name in dangling_references:
+        print(f"Error: the page of {source.name} links to {name} which doesn't exist")
+    method_count = sum(len(main_class.methods) for main_class in project.main_classes)
+    print(f"Checked {len(project.main_classes)} main classes ({method_count} methods), {len(project.models)} models "
+          f"and {len(project.exceptions)} exceptions: {len(dangling_references)} broken link(s)")
+    return 1 if dangling_references else 0
+
+def run_dump_ir(args: Namespace) -> int:
+    from src.ir.ProjectIR import dump_project_ir
+
+    _, project = parse_project(args)
+    count = dump_project_ir(project, args.output)
+    if args.output != "-":
+        print(f"Wrote {count} records to {args.output}")
+    return 0
+
+def main():
+    args = parse_args()
+    match args.command:
+        case "build":
+            exit_code = run_build(args)
+        case "check":
+            exit_code = run_check(args)
+        case "dump-ir":
+            exit_code = run_dump_ir(args)
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
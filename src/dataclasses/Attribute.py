@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import Any, Dict
 
+from src.utils import intern_string
 
-@dataclass
+
+@dataclass(slots=True)
 class Attribute:
     """Represent the attribute of a class
     """
@@ -21,3 +24,16 @@ class Attribute:
     example: str | None = None
     """An example for the given attribute
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Attribute":
+        """Rebuild an Attribute from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the attribute
+        :type data: Dict[str, Any]
+        :return: The Attribute instance
+        :rtype: Attribute
+        """
+        return cls(**{**data,
+                      "name": intern_string(data.get("name")),
+                      "attribute_type": intern_string(data.get("attribute_type"))})
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 from src.dataclasses.Attribute import Attribute
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionModel:
     """The model that describe an expression
     """
@@ -46,3 +46,15 @@ class ExceptionModel:
     - status_code
     - detail
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExceptionModel":
+        """Rebuild an ExceptionModel from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the exception
+        :type data: Dict[str, Any]
+        :return: The ExceptionModel instance
+        :rtype: ExceptionModel
+        """
+        attributes = [Attribute.from_dict(attribute) for attribute in data.get("attributes", [])]
+        return cls(**{**data, "attributes": attributes})
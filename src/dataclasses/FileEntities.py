@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from src.dataclasses.ExceptionModel import ExceptionModel
+from src.dataclasses.Model import Model
+from src.dataclasses.main_class.MainClass import MainClass
+
+
+@dataclass(slots=True)
+class FileEntities:
+    """All of the classes documented inside of a single source file.
+
+    A file usually contains a single class, but it can contain many of them, for
+    example a main class with the exceptions that it raises.
+    """
+
+    main_classes: List[MainClass] = field(default_factory=list)
+    """The main classes of the file, in the order of the file
+    """
+
+    models: List[Model] = field(default_factory=list)
+    """The dataclass models of the file, in the order of the file
+    """
+
+    exceptions: List[ExceptionModel] = field(default_factory=list)
+    """The exceptions of the file, in the order of the file
+    """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileEntities":
+        """Rebuild a FileEntities from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the entities of the file
+        :type data: Dict[str, Any]
+        :return: The FileEntities instance
+        :rtype: FileEntities
+        """
+        return cls(
+            main_classes=[MainClass.from_dict(main_class) for main_class in data.get("main_classes", [])],
+            models=[Model.from_dict(model) for model in data.get("models", [])],
+            exceptions=[ExceptionModel.from_dict(exception) for exception in data.get("exceptions", [])]
+        )
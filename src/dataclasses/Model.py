@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 from src.dataclasses.Attribute import Attribute
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     name: str | None = None
     """The name of the model
@@ -32,3 +32,15 @@ class Model:
     """
 
     attributes: List[Attribute] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Model":
+        """Rebuild a Model from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the model
+        :type data: Dict[str, Any]
+        :return: The Model instance
+        :rtype: Model
+        """
+        attributes = [Attribute.from_dict(attribute) for attribute in data.get("attributes", [])]
+        return cls(**{**data, "attributes": attributes})
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInit:
     """Represent the description of an __init__.py file
     
@@ -17,3 +18,14 @@ class ModuleInit:
     long_description: str = None
     """All of the docstring of the __init__.py file
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModuleInit":
+        """Rebuild a ModuleInit from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the ModuleInit
+        :type data: Dict[str, Any]
+        :return: The ModuleInit instance
+        :rtype: ModuleInit
+        """
+        return cls(**data)
@@ -7,7 +7,7 @@ from src.dataclasses.main_class.MainClass import MainClass
 from src.dataclasses.Model import Model
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """dataclass that represent the entire Project
     """
@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 from src.dataclasses.main_class.MainClassMethod import MainClassMethod
 
 
-@dataclass()
+@dataclass(slots=True)
 class MainClass:
     """Represent the main class that is parsed
     """
@@ -24,3 +24,15 @@ class MainClass:
     methods: List[MainClassMethod] = field(default_factory=list)
     """The list of methods that are defined inside of the class
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MainClass":
+        """Rebuild a MainClass from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the main class
+        :type data: Dict[str, Any]
+        :return: The MainClass instance
+        :rtype: MainClass
+        """
+        methods = [MainClassMethod.from_dict(method) for method in data.get("methods", [])]
+        return cls(**{**data, "methods": methods})
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 from src.dataclasses.main_class.MethodException import MethodException
 from src.dataclasses.main_class.MethodParameter import MethodParameter
+from src.utils import intern_string
 
-@dataclass()
+@dataclass(slots=True)
 class MainClassMethod:
     """The main class will have multiple methods
     
@@ -74,3 +75,19 @@ class MainClassMethod:
     exceptions: List[MethodException] = field(default_factory=list)
     """The exception that the method can throw
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MainClassMethod":
+        """Rebuild a MainClassMethod from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the method
+        :type data: Dict[str, Any]
+        :return: The MainClassMethod instance
+        :rtype: MainClassMethod
+        """
+        parameters = [MethodParameter.from_dict(parameter) for parameter in data.get("parameters", [])]
+        exceptions = [MethodException.from_dict(exception) for exception in data.get("exceptions", [])]
+        return cls(**{**data,
+                      "parameters": parameters,
+                      "exceptions": exceptions,
+                      "return_type": intern_string(data.get("return_type"))})
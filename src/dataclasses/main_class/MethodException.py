@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from typing import Any, Dict
 
 
-@dataclass()
+@dataclass(slots=True)
 class MethodException:
     """Represent the exceptions that a method can throw
     """
@@ -13,3 +14,14 @@ class MethodException:
     description: str
     """The description of the exception
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MethodException":
+        """Rebuild a MethodException from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the MethodException
+        :type data: Dict[str, Any]
+        :return: The MethodException instance
+        :rtype: MethodException
+        """
+        return cls(**data)
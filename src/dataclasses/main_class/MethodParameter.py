@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import Any, Dict
 
+from src.utils import intern_string
 
-@dataclass()
+
+@dataclass(slots=True)
 class MethodParameter:
     """Each method from the MainClass have some parameter that the user
     have to specify (example: the blockchain, the exchanges...)
@@ -26,3 +29,16 @@ class MethodParameter:
     when we write our display, we don't care if it is an int or
     an str.
     """
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MethodParameter":
+        """Rebuild a MethodParameter from the dictionary created by `dataclasses.asdict`
+
+        :param data: The dictionary that represent the MethodParameter
+        :type data: Dict[str, Any]
+        :return: The MethodParameter instance
+        :rtype: MethodParameter
+        """
+        return cls(**{**data,
+                      "name": intern_string(data["name"]),
+                      "param_type": intern_string(data["param_type"])})
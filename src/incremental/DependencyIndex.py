@@ -0,0 +1,90 @@
+from typing import Any, Dict, List, Tuple
+
+from src.dataclasses.Project import Project
+from src.utils import get_referenced_types, is_documented_method
+
+
+class DependencyIndex:
+    """Index of the links between the pages of the documentation.
+
+    The pages reference the models and the exceptions by their name:
+    - The page of a method links to the models (and exceptions) of its return type and to
+      the exceptions that it can throw (inside of the `## Exceptions` section). An exception
+      that is not part of the project (for example ValueError) is written without a link
+    - The page of a model or of an exception links to the models used by its
+      `List[...]` attributes
+
+    For each referenced name, we keep the dataclasses whose pages contain the link
+    (MainClassMethod, Model or ExceptionModel). This way, when a model or an exception
+    changes or is renamed, we only have to regenerate the pages that depend on it.
+    """
+
+    def __init__(self, project: Project):
+        """Build the index of the given project
+
+        :param project: The parsed project
+        :type project: Project
+        """
+        self._model_names = {model.name for model in project.models}
+        self._exception_names = {exception.name for exception in project.exceptions}
+        self._dependents: Dict[str, List[Any]] = {}
+        self._references: List[Tuple[Any, str]] = []
+        """Each link that can be broken as: the dataclass of the page and the referenced name"""
+
+        for main_class in project.main_classes:
+            for method in main_class.methods:
+                if not is_documented_method(method.name):
+                    continue
+                if method.return_type is not None:
+                    for type_name in get_referenced_types(method.return_type):
+                        self._add_reference(method, type_name, True)
+                for exception in method.exceptions:
+                    # The page is written again when the exception is added or removed, but
+                    # the link can't be broken: it is only written when the exception exists
+                    self._add_reference(method, exception.exception, False)
+        for entity in project.models + project.exceptions:
+            for attribute in entity.attributes:
+                # Only the List attributes are written with a link to the model
+                if "List" in attribute.attribute_type:
+                    for type_name in get_referenced_types(attribute.attribute_type):
+                        self._add_reference(entity, type_name, True)
+
+    def _add_reference(self, source: Any, name: str, is_link: bool):
+        dependents = self._dependents.setdefault(name, [])
+        # The references of a source are added one after the other, so the source can
+        # only be already known as the last dependent
+        if len(dependents) == 0 or dependents[-1] is not source:
+            dependents.append(source)
+        if is_link:
+            self._references.append((source, name))
+
+    def dependents_of(self, name: str) -> List[Any]:
+        """Get the dataclasses whose pages link to the model or the exception
+        with the given name
+
+        :param name: The name of the model or of the exception
+        :type name: str
+        :return: The dataclasses (MainClassMethod, Model or ExceptionModel) that depend
+                 on it, in the order of the project
+        :rtype: List[Any]
+        """
+        return list(self._dependents.get(name, []))
+
+    def get_dangling_references(self, sources: List[Any] | None = None) -> List[Tuple[Any, str]]:
+        """Get the links to a model or to an exception that doesn't exist inside
+        of the project (for example after a model was renamed)
+
+        :param sources: If given, only the links of the pages generated from one of these
+                        dataclasses are checked, defaults to None
+        :type sources: List[Any] | None, optional
+        :return: For each broken link, the dataclass of the page and the missing name
+        :rtype: List[Tuple[Any, str]]
+        """
+        source_ids = None if sources is None else {id(source) for source in sources}
+        ret = []
+        for source, name in self._references:
+            if source_ids is not None and id(source) not in source_ids:
+                continue
+            if name not in self._exception_names and name not in self._model_names:
+                ret.append((source, name))
+        return ret
@@ -0,0 +1,154 @@
+from dataclasses import asdict
+import json
+import os
+from typing import Any, Dict, Iterable
+
+from src.dataclasses.ExceptionModel import ExceptionModel
+from src.dataclasses.FileEntities import FileEntities
+from src.dataclasses.Model import Model
+from src.dataclasses.ModuleInit import ModuleInit
+from src.dataclasses.main_class.MainClass import MainClass
+
+
+MANIFEST_FILE_NAME = ".sphinxusaurus-manifest.json"
+"""The name of the manifest file that is stored at the root of the destination folder
+"""
+
+MANIFEST_VERSION = 4
+"""The version of the manifest format.
+
+When the format of the manifest or of the parsed dataclasses changes, this version
+must be increased so that old manifests are ignored instead of being loaded.
+"""
+
+ENTITY_TYPES = {
+    "MainClass": MainClass,
+    "Model": Model,
+    "ExceptionModel": ExceptionModel,
+    "ModuleInit": ModuleInit,
+    "FileEntities": FileEntities
+}
+"""Map the name of a parsed dataclass to the dataclass itself, this way we can
+rebuild it from the manifest
+"""
+
+
+class Manifest:
+    """Keep track of the content of the source files and of the generated pages
+    between two runs.
+
+    For each source file, we store the digest of the file and the dataclass that
+    was parsed from it. This way, if the file didn't change, we don't have to
+    parse it again.
+
+    For each generated page, we store the digest of the content that was written.
+    This way, if the content of a page didn't change, we don't rewrite it.
+    """
+
+    def __init__(self, sources: Dict[str, Dict[str, Any]] | None = None, outputs: Dict[str, str] | None = None):
+        self.sources = sources if sources is not None else {}
+        """For each source file path, the digest of the file, the type of the
+        parsed dataclass and the parsed dataclass as a dictionary
+        """
+
+        self.outputs = outputs if outputs is not None else {}
+        """For each generated page (path relative to the destination folder), the
+        digest of the content that was written
+        """
+
+    @classmethod
+    def load(cls, dest_path: str) -> "Manifest":
+        """Load the manifest stored inside of the destination folder.
+
+        If there is no manifest, or if it can't be used (corrupted or written
+        by another version), an empty manifest is returned. With an empty
+        manifest, everything is parsed and written again.
+
+        :param dest_path: The destination folder of the documentation
+        :type dest_path: str
+        :return: The loaded manifest
+        :rtype: Manifest
+        """
+        manifest_path = os.path.join(dest_path, MANIFEST_FILE_NAME)
+        try:
+            with open(manifest_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls()
+        return cls(data.get("sources", {}), data.get("outputs", {}))
+
+    def save(self, dest_path: str):
+        """Save the manifest inside of the destination folder
+
+        :param dest_path: The destination folder of the documentation
+        :type dest_path: str
+        """
+        manifest_path = os.path.join(dest_path, MANIFEST_FILE_NAME)
+        data = {
+            "version": MANIFEST_VERSION,
+            "sources": self.sources,
+            "outputs": self.outputs
+        }
+        # Write to a temporary file first so that an interrupted run never leaves
+        # a half written manifest behind
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, manifest_path)
+
+    def get_entity(self, source_path: str, digest: str) -> Any | None:
+        """Get the dataclass that was parsed from the given source file if the
+        file didn't change since it was parsed
+
+        :param source_path: The path of the source file
+        :type source_path: str
+        :param digest: The current digest of the source file
+        :type digest: str
+        :return: The parsed dataclass, or None if the file changed or was never parsed
+        :rtype: Any | None
+        """
+        source = self.sources.get(source_path)
+        if source is None or source["digest"] != digest or source["type"] not in ENTITY_TYPES:
+            return None
+        return ENTITY_TYPES[source["type"]].from_dict(source["entity"])
+
+    def set_entity(self, source_path: str, digest: str, entity: Any):
+        """Store the dataclass that was parsed from the given source file
+
+        :param source_path: The path of the source file
+        :type source_path: str
+        :param digest: The digest of the source file
+        :type digest: str
+        :param entity: The dataclass parsed from the file (FileEntities or ModuleInit)
+        :type entity: Any
+        """
+        self.sources[source_path] = {
+            "digest": digest,
+            "type": type(entity).__name__,
+            "entity": asdict(entity)
+        }
+
+    def retain_sources(self, source_paths: Iterable[str]):
+        """Forget about the source files that are not in the given paths.
+
+        It is used to remove the files that were deleted since the last run.
+
+        :param source_paths: The paths of the source files that still exist
+        :type source_paths: Iterable[str]
+        """
+        to_keep = set(source_paths)
+        self.sources = {path: source for path, source in self.sources.items() if path in to_keep}
+
+    def is_output_unchanged(self, page_path: str, digest: str) -> bool:
+        """Verify if the given page was already written with the same content
+
+        :param page_path: The path of the page relative to the destination folder
+        :type page_path: str
+        :param digest: The digest of the new content of the page
+        :type digest: str
+        :return: `True` if the page was already written with the same content, `False` otherwise
+        :rtype: bool
+        """
+        return self.outputs.get(page_path) == digest
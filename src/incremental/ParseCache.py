@@ -0,0 +1,176 @@
+from dataclasses import asdict
+import json
+import os
+import zlib
+from typing import Any, Dict, Tuple
+
+from src.incremental.Manifest import ENTITY_TYPES
+from src.parser.FileParser import FileParser
+from src.utils import get_digest
+
+
+CACHE_VERSION = 5
+"""The version of the cache entries.
+
+When the parsed dataclasses or the parsers change, this version must be increased
+so that the entries written by the previous version are not used anymore.
+"""
+
+CACHE_ENTRY_EXTENSION = ".cache"
+"""The extension of the files that contain a cache entry
+"""
+
+
+class ParseCache:
+    """Persistent on-disk cache of the dataclasses returned by the parsers
+    (FileEntities and ModuleInit).
+
+    Each parsed file has its own entry inside of the cache folder. An entry is
+    identified by the path of the file and by the parser that was used, and it
+    contains the mtime, the size and the digest of the file when it was parsed.
+
+    - If the mtime and the size of the file didn't change, the entry is used
+      without reading the file.
+    - If they changed but the content is the same (for example after a git checkout),
+      the entry is used and updated with the new mtime and size.
+    - Otherwise the file is parsed again.
+
+    The entries are stored as zlib compressed json, the dataclasses are rebuilt with
+    their `from_dict` method like in the manifest. The cache folder can be shared (for
+    example between CI jobs): unlike a pickle, an entry written by someone else can't
+    run code when it is loaded. When the cache folder becomes bigger than `max_size`,
+    the least recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = 64 * 1024 * 1024):
+        """Create the cache
+
+        :param cache_dir: The folder in which the entries are stored, it is created if needed
+        :type cache_dir: str
+        :param max_size: The maximum size of the cache folder in bytes, defaults to 64MB
+        :type max_size: int, optional
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self.hits = 0
+        """The amount of files that were not parsed thanks to the cache"""
+        self.misses = 0
+        """The amount of files that had to be parsed"""
+        self._pending: Dict[str, Tuple[int, int, str]] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _get_entry_path(self, parser: FileParser, file_path: str) -> str:
+        key = f"{CACHE_VERSION}:{type(parser).__name__}:{os.path.abspath(file_path)}"
+        return os.path.join(self._cache_dir, get_digest(key.encode()) + CACHE_ENTRY_EXTENSION)
+
+    def _read_entry(self, entry_path: str) -> Tuple[int, int, str, Any] | None:
+        """Read the entry at the given path
+
+        :param entry_path: The path to the entry
+        :type entry_path: str
+        :return: The mtime, size and digest of the source file and the parsed dataclass, or
+                 None if the entry doesn't exist or can't be read
+        :rtype: Tuple[int, int, str, Any] | None
+        """
+        try:
+            with open(entry_path, "rb") as f:
+                entry = json.loads(zlib.decompress(f.read()))
+            return entry["mtime"], entry["size"], entry["digest"], ENTITY_TYPES[entry["type"]].from_dict(entry["entity"])
+        except Exception:
+            # A missing, corrupted or incompatible entry is simply a cache miss
+            return None
+
+    def _write_entry(self, entry_path: str, entry: Tuple[int, int, str, Any]):
+        mtime, size, digest, entity = entry
+        content = json.dumps({
+            "mtime": mtime,
+            "size": size,
+            "digest": digest,
+            "type": type(entity).__name__,
+            "entity": asdict(entity)
+        }, ensure_ascii=False)
+        # Write to a temporary file first so that concurrent runs sharing the same
+        # cache folder never read a half written entry
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(zlib.compress(content.encode()))
+        os.replace(tmp_path, entry_path)
+
+    def lookup(self, parser: FileParser, file_path: str, file_state: Tuple[int, int] | None = None) -> Any | None:
+        """Get the dataclass of the given file from the cache.
+
+        When the file is not in the cache (or changed since it was cached), the
+        file must be parsed and given back to `store`.
+
+        :param parser: The parser that is used for this file
+        :type parser: FileParser
+        :param file_path: The path to the file
+        :type file_path: str
+        :param file_state: The mtime and the size of the file if they are already known (for
+                           example from the FileIndex), the file is stat-ed otherwise, defaults to None
+        :type file_state: Tuple[int, int] | None, optional
+        :return: The cached dataclass, or None if the file has to be parsed
+        :rtype: Any | None
+        """
+        entry_path = self._get_entry_path(parser, file_path)
+        if file_state is None:
+            stat = os.stat(file_path)
+            file_state = (stat.st_mtime_ns, stat.st_size)
+        mtime, size = file_state
+        entry = self._read_entry(entry_path)
+        if entry is not None and entry[0] == mtime and entry[1] == size:
+            self.hits += 1
+            # Mark the entry as recently used for the eviction
+            os.utime(entry_path)
+            return entry[3]
+
+        with open(file_path, "rb") as f:
+            digest = get_digest(f.read())
+        if entry is not None and entry[2] == digest:
+            self.hits += 1
+            self._write_entry(entry_path, (mtime, size, digest, entry[3]))
+            return entry[3]
+
+        self.misses += 1
+        # Keep the state of the file before it is parsed, this way if it is modified while
+        # we parse it, the next run will see that it changed
+        self._pending[entry_path] = (mtime, size, digest)
+        return None
+
+    def store(self, parser: FileParser, file_path: str, entity: Any):
+        """Store the dataclass parsed from a file that was not found by `lookup`
+
+        :param parser: The parser that was used for this file
+        :type parser: FileParser
+        :param file_path: The path to the file
+        :type file_path: str
+        :param entity: The dataclass returned by the parser
+        :type entity: Any
+        """
+        entry_path = self._get_entry_path(parser, file_path)
+        mtime, size, digest = self._pending.pop(entry_path)
+        self._write_entry(entry_path, (mtime, size, digest, entity))
+
+    def prune(self):
+        """Remove the least recently used entries until the cache folder is smaller
+        than the maximum size
+        """
+        entries = []
+        total_size = 0
+        with os.scandir(self._cache_dir) as it:
+            for dir_entry in it:
+                if dir_entry.is_file() and dir_entry.name.endswith(CACHE_ENTRY_EXTENSION):
+                    stat = dir_entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, dir_entry.path))
+                    total_size += stat.st_size
+        if total_size <= self._max_size:
+            return
+        entries.sort()
+        for _, size, entry_path in entries:
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            if total_size <= self._max_size:
+                break
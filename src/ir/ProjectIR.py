@@ -0,0 +1,168 @@
+from dataclasses import asdict
+import json
+import sys
+from typing import Any, Dict, IO, Iterator
+
+from src.dataclasses.ExceptionModel import ExceptionModel
+from src.dataclasses.Model import Model
+from src.dataclasses.ModuleInit import ModuleInit
+from src.dataclasses.Project import Project
+from src.dataclasses.main_class.MainClass import MainClass
+from src.dataclasses.main_class.MainClassMethod import MainClassMethod
+
+
+IR_VERSION = 1
+"""The version of the JSONL format of the intermediate representation.
+
+When the format or the parsed dataclasses change, this version must be increased
+so that the tools that read the IR can detect a file written by another version.
+"""
+
+RECORD_KINDS = ("header", "main_class", "method", "init", "model", "exception")
+"""The kinds of the records of the IR, in the order in which they are written
+"""
+
+
+class IRVersionException(Exception):
+    """Raised when the IR was written by another version of the format (or is not an IR)
+    """
+
+
+def iter_project_records(project: Project) -> Iterator[Dict[str, Any]]:
+    """Get the records of the intermediate representation of the project, one per entity.
+
+    The first record is the header that contains the version of the format. Then we have:
+    - {"kind": "main_class", "entity": {...}} for each main class, without its methods
+    - {"kind": "method", "main_class": "BlockchainAPIs", "entity": {...}} for each method,
+      right after the record of its main class
+    - {"kind": "init", "module": "models", "entity": {...}} for each ModuleInit
+    - {"kind": "model", "entity": {...}} for each model
+    - {"kind": "exception", "entity": {...}} for each exception
+
+    The entities are the dictionaries created by `dataclasses.asdict`, they are rebuilt
+    with the `from_dict` class method of their dataclass.
+
+    :param project: The parsed project
+    :type project: Project
+    :return: The records, in the order of the project
+    :rtype: Iterator[Dict[str, Any]]
+    """
+    yield {"kind": "header", "version": IR_VERSION}
+    for main_class in project.main_classes:
+        main_class_dict = asdict(main_class)
+        methods = main_class_dict.pop("methods")
+        yield {"kind": "main_class", "entity": main_class_dict}
+        for method in methods:
+            yield {"kind": "method", "main_class": main_class.name, "entity": method}
+    for module_name, init in project.init_doc.items():
+        yield {"kind": "init", "module": module_name, "entity": asdict(init)}
+    for model in project.models:
+        yield {"kind": "model", "entity": asdict(model)}
+    for exception in project.exceptions:
+        yield {"kind": "exception", "entity": asdict(exception)}
+
+
+def write_project_ir(project: Project, f: IO[str]) -> int:
+    """Write the intermediate representation of the project as JSONL (one json record per line).
+
+    The records are written one by one, the whole IR is never held in memory as a
+    single string.
+
+    :param project: The parsed project
+    :type project: Project
+    :param f: The text file in which the IR is written
+    :type f: IO[str]
+    :return: The amount of records that were written
+    :rtype: int
+    """
+    count = 0
+    for record in iter_project_records(project):
+        f.write(json.dumps(record, ensure_ascii=False))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def dump_project_ir(project: Project, ir_path: str) -> int:
+    """Write the intermediate representation of the project inside of a file
+
+    :param project: The parsed project
+    :type project: Project
+    :param ir_path: The path of the JSONL file, or "-" to write it to the standard output
+    :type ir_path: str
+    :return: The amount of records that were written
+    :rtype: int
+    """
+    if ir_path == "-":
+        return write_project_ir(project, sys.stdout)
+    with open(ir_path, "w", encoding="utf-8") as f:
+        return write_project_ir(project, f)
+
+
+def iter_ir_records(f: IO[str]) -> Iterator[Dict[str, Any]]:
+    """Read the records of an intermediate representation one by one, without the header.
+
+    It is used by the tools that only need some of the entities (for example a search
+    indexer that only reads the methods), the dataclasses are not rebuilt.
+
+    :raises IRVersionException: When the first record is not the header of the current version
+
+    :param f: The text file that contains the IR
+    :type f: IO[str]
+    :return: The records of the entities, in the order in which they were written
+    :rtype: Iterator[Dict[str, Any]]
+    """
+    header_line = f.readline()
+    try:
+        header = json.loads(header_line)
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("kind") != "header" or header.get("version") != IR_VERSION:
+        raise IRVersionException(f"The file is not an IR of version {IR_VERSION}")
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_project_ir(f: IO[str]) -> Project:
+    """Rebuild the project from its intermediate representation, without parsing the sources
+
+    :raises IRVersionException: When the first record is not the header of the current version
+
+    :param f: The text file that contains the IR
+    :type f: IO[str]
+    :return: The project, equal to the one that was written
+    :rtype: Project
+    """
+    ret = Project()
+    for record in iter_ir_records(f):
+        entity = record["entity"]
+        match record["kind"]:
+            case "main_class":
+                ret.main_classes.append(MainClass.from_dict(entity))
+            case "method":
+                # The methods are written right after their main class
+                ret.main_classes[-1].methods.append(MainClassMethod.from_dict(entity))
+            case "init":
+                ret.init_doc[record["module"]] = ModuleInit.from_dict(entity)
+            case "model":
+                ret.models.append(Model.from_dict(entity))
+            case "exception":
+                ret.exceptions.append(ExceptionModel.from_dict(entity))
+    return ret
+
+
+def load_project_ir(ir_path: str) -> Project:
+    """Rebuild the project from the intermediate representation stored inside of a file
+
+    :raises IRVersionException: When the file is not an IR of the current version
+
+    :param ir_path: The path of the JSONL file, or "-" to read it from the standard input
+    :type ir_path: str
+    :return: The project
+    :rtype: Project
+    """
+    if ir_path == "-":
+        return read_project_ir(sys.stdin)
+    with open(ir_path, "r", encoding="utf-8") as f:
+        return read_project_ir(f)
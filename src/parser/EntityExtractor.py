@@ -0,0 +1,136 @@
+import ast
+from typing import List, Set, Tuple
+
+from src.dataclasses.FileEntities import FileEntities
+from src.parser.ExceptionParser import ExceptionParser
+from src.parser.FileIndex import EXCEPTION_ROLE, MAIN_ROLE, MODEL_ROLE
+from src.parser.FileParser import FileParser
+from src.parser.MainClassParser import MainClassParser
+from src.parser.ModelParser import ModelParser
+from src.parser.SignatureExtractor import SignatureExtractor
+
+
+MAIN_CLASS = "main_class"
+MODEL = "model"
+EXCEPTION = "exception"
+
+ROLE_KINDS = {MAIN_ROLE: MAIN_CLASS, MODEL_ROLE: MODEL, EXCEPTION_ROLE: EXCEPTION}
+"""The kind of the classes of a file, from the role of its folder (see FileIndex)
+"""
+
+EXCEPTION_BASE_NAMES = {"Exception", "BaseException"}
+"""The bases that make a class an exception, with the names that end with EXCEPTION_SUFFIXES
+"""
+
+EXCEPTION_SUFFIXES = ("Exception", "Error")
+"""The suffixes of the names of the exception classes, for example BlockchainAPIsException
+"""
+
+
+def _get_name(node: ast.expr) -> str | None:
+    """Get the name of a base of a class
+
+    For example:
+    - Exception and errors.Exception -> "Exception"
+    - Generic[T] -> "Generic"
+
+    :param node: The node of the base
+    :type node: ast.expr
+    :return: The name, or None if the node is not a name
+    :rtype: str | None
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Call):
+        return _get_name(node.func)
+    if isinstance(node, ast.Subscript):
+        return _get_name(node.value)
+    return None
+
+
+class _ClassClassifier(ast.NodeVisitor):
+    """Find the documented classes of a module and their kind in a single pass over its tree.
+
+    - A class with an exception as base (Exception, a name ending with "Exception" or
+      "Error", or an exception of the same file) is an exception
+    - The other classes have the kind of the folder of the file: a class of the models
+      folder is a model even when it is not a @dataclass (pydantic, NamedTuple...)
+
+    The private classes (starting with "_") and the classes defined inside of a class
+    or of a function are not documented.
+    """
+
+    def __init__(self, default_kind: str):
+        self._default_kind = default_kind
+        self.classes: List[Tuple[str, ast.ClassDef]] = []
+        """The kind and the node of each documented class, in the order of the file"""
+        self._exception_names: Set[str] = set(EXCEPTION_BASE_NAMES)
+
+    def generic_visit(self, node: ast.AST):
+        # Only the statements can define a class, the expressions are not visited
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                self.visit(child)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        if node.name.startswith("_"):
+            return
+        base_names = [_get_name(base) for base in node.bases]
+        if any(name is not None and (name in self._exception_names or name.endswith(EXCEPTION_SUFFIXES))
+               for name in base_names):
+            self._exception_names.add(node.name)
+            self.classes.append((EXCEPTION, node))
+        else:
+            self.classes.append((self._default_kind, node))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        pass
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        pass
+
+
+class EntityExtractor(FileParser):
+    """Parse every documented class of a file (main classes, models and exceptions).
+
+    The file is parsed once and its tree is walked once to classify the classes,
+    then each class is given to the `parse_class` method of the parser of its kind.
+    Unlike the other parsers, a file can contain any amount of classes of any kind.
+    """
+
+    def __init__(self, role: str = MAIN_ROLE):
+        """Create the extractor of the files of a folder
+
+        :param role: The role of the folder of the files (see FileIndex), it gives the kind
+                     of the classes that are not exceptions, defaults to MAIN_ROLE
+        :type role: str, optional
+        """
+        self._default_kind = ROLE_KINDS[role]
+        self._main_class_parser = MainClassParser()
+        self._model_parser = ModelParser()
+        self._exception_parser = ExceptionParser()
+
+    def parse_file(self, file_path: str) -> FileEntities:
+        """Parse the classes of the given file
+
+        :param file_path: The path to the file that we have to parse
+        :type file_path: str
+        :return: The main classes, the models and the exceptions of the file
+        :rtype: FileEntities
+        """
+        source, tree = self.get_source_and_tree(file_path)
+        signatures = SignatureExtractor(source)
+        classifier = _ClassClassifier(self._default_kind)
+        classifier.visit(tree)
+        ret = FileEntities()
+        for kind, node in classifier.classes:
+            match kind:
+                case "main_class":
+                    ret.main_classes.append(self._main_class_parser.parse_class(node, file_path, signatures))
+                case "model":
+                    ret.models.append(self._model_parser.parse_class(node, file_path, signatures))
+                case "exception":
+                    ret.exceptions.append(self._exception_parser.parse_class(node, file_path, signatures))
+        return ret
@@ -1,7 +1,8 @@
 import ast
-from src.dataclasses.Attribute import Attribute
 from src.dataclasses.ExceptionModel import ExceptionModel
 from src.parser.FileParser import FileParser
+from src.parser.SignatureExtractor import SignatureExtractor
+from src.profiling.Profiler import get_profiler
 from src.utils import get_short_description
 
 
@@ -9,19 +10,36 @@ class ExceptionParser(FileParser):
     """Parse exceptions from the file
     """
 
-    def parse_file(self, file_path: str) -> ExceptionModel:
-        tree = self.get_tree(file_path)
-        class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
-        ret = ExceptionModel()
-        for node in class_nodes:
-            ret.name = node.name
-            ret.definition = ast.unparse(node).split(':')[0] + ':'
-            ret.is_abstract = "ABC)" in ret.definition
-            exception_docstring = ast.get_docstring(node)
-            if exception_docstring:
-                ret.short_description = get_short_description(exception_docstring)
-                ret.long_description = exception_docstring
+    def parse_class(self, node: ast.ClassDef, path: str, signatures: SignatureExtractor) -> ExceptionModel:
+        """Transform the node of an exception class to an ExceptionModel
 
-            self.add_attributes_from_class_to_list(ret.attributes, node.body)
+        :param node: The node of the class
+        :type node: ast.ClassDef
+        :param path: The path to the file of the node, used by the profiler
+        :type path: str
+        :param signatures: The extractor of the definitions of the file of the node
+        :type signatures: SignatureExtractor
+        :return: The ExceptionModel
+        :rtype: ExceptionModel
+        """
+        ret = ExceptionModel()
+        ret.name = node.name
+        with get_profiler().span("definition", path):
+            ret.definition = signatures.get_definition(node)
+        ret.is_abstract = "ABC)" in ret.definition
+        exception_docstring = ast.get_docstring(node)
+        if exception_docstring:
+            ret.short_description = get_short_description(exception_docstring)
+            ret.long_description = exception_docstring
 
+        self.add_attributes_from_class_to_list(ret.attributes, node.body)
         return ret
+
+    def parse_file(self, file_path: str) -> ExceptionModel:
+        source, tree = self.get_source_and_tree(file_path)
+        class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+        if not class_nodes:
+            return ExceptionModel()
+        # A file of the exceptions folder contains a single exception, see EntityExtractor
+        # for the files that contain many classes
+        return self.parse_class(class_nodes[-1], file_path, SignatureExtractor(source))
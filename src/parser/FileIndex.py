@@ -0,0 +1,194 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+
+MAIN_ROLE = "main"
+MODEL_ROLE = "model"
+EXCEPTION_ROLE = "exception"
+INIT_ROLE = "init"
+
+DOCUMENTED_FOLDERS = {"models": MODEL_ROLE, "exceptions": EXCEPTION_ROLE}
+"""The folders of the package that are documented with the role of their files, in the
+order in which they are added to the Project.
+
+The other folders of the package (for example utils) are not documented.
+"""
+
+INIT_FILE_NAME = "__init__.py"
+
+
+@dataclass(slots=True)
+class FileIndexEntry:
+    """A source file of the package that has to be parsed
+    """
+
+    path: str
+    """The path of the file, for example input/models/Pair.py
+    """
+
+    role: str
+    """The role of the file: "main", "model", "exception" or "init"
+    """
+
+    mtime_ns: int
+    """The modification time of the file when the package was scanned
+    """
+
+    size: int
+    """The size of the file when the package was scanned
+    """
+
+
+def _is_skipped_folder(name: str) -> bool:
+    return name.startswith(".") or name == "__pycache__"
+
+
+class FileIndex:
+    """The ordered list of the source files of the package with their role.
+
+    The package is walked once with os.scandir: the type of each entry is known without
+    a stat (on most platforms) and only the Python files are stat-ed, once. Their mtime
+    and size are kept inside of the index, this way the watcher and the cache can know
+    if a file changed without another stat.
+
+    The files are in the order of the Project: the files at the root of the package (main
+    classes), then the files of the models folder and of the exceptions folder. Inside of
+    a folder, the files are sorted by name. The subpackages of these folders are walked
+    recursively (sorted by name) after the files of their parent.
+    Only the __init__.py files of the models and exceptions folders are documented.
+
+    The mtime of each walked folder is also kept: a file can only be added, removed or
+    renamed when the mtime of its folder changes. This way `refresh` only stats the
+    known files as long as the folders didn't change.
+    """
+
+    def __init__(self, entries: List[FileIndexEntry], folder_location: str, folders: Dict[str, int]):
+        self.entries = entries
+        """The files, in the order of the Project"""
+        self.folder_location = folder_location
+        """The location of the folder of the package"""
+        self.folders = folders
+        """The mtime of each walked folder, by path"""
+
+    @classmethod
+    def scan(cls, folder_location: str) -> "FileIndex":
+        """Walk the package and index its source files
+
+        :param folder_location: The location of the folder of the package
+        :type folder_location: str
+        :return: The index of the files of the package
+        :rtype: FileIndex
+        """
+        entries: List[FileIndexEntry] = []
+        folders: Dict[str, int] = {}
+        # The folders are not documented when they are found, they are added after the
+        # files of the root in the order of DOCUMENTED_FOLDERS
+        documented_folders: Dict[str, str] = {}
+        cls._scan_folder(folder_location, MAIN_ROLE, False, entries, folders, documented_folders)
+        for folder_name, role in DOCUMENTED_FOLDERS.items():
+            if folder_name in documented_folders:
+                cls._scan_folder(documented_folders[folder_name], role, True, entries, folders, None)
+        return cls(entries, folder_location, folders)
+
+    @staticmethod
+    def _scan_folder(folder_path: str, role: str, is_module_root: bool, entries: List[FileIndexEntry],
+                     folders: Dict[str, int], documented_folders: Dict[str, str] | None):
+        """Index the Python files of a folder and of its subfolders
+
+        :param folder_path: The path of the folder
+        :type folder_path: str
+        :param role: The role of the files of the folder
+        :type role: str
+        :param is_module_root: If the __init__.py file of the folder documents the module
+        :type is_module_root: bool
+        :param entries: The list in which the files are added
+        :type entries: List[FileIndexEntry]
+        :param folders: The dictionary in which the mtime of the walked folders is added
+        :type folders: Dict[str, int]
+        :param documented_folders: For the root of the package, the documented folders
+                                   that are found, by name. None for the other folders,
+                                   whose subfolders are walked recursively
+        :type documented_folders: Dict[str, str] | None
+        """
+        subfolders = []
+        # The mtime is taken before the folder is listed, this way a file added while we
+        # list it is found by the next scan
+        folders[folder_path] = os.stat(folder_path).st_mtime_ns
+        with os.scandir(folder_path) as it:
+            # The order of scandir depends on the file system, the entries are sorted by
+            # name so that the sidebar positions are the same on every machine
+            dir_entries = sorted(it, key=lambda dir_entry: dir_entry.name)
+        for dir_entry in dir_entries:
+            name = dir_entry.name
+            if dir_entry.is_dir():
+                if documented_folders is not None:
+                    if name in DOCUMENTED_FOLDERS:
+                        documented_folders[name] = dir_entry.path
+                elif not _is_skipped_folder(name):
+                    subfolders.append(dir_entry.path)
+                continue
+            if not name.endswith(".py") or not dir_entry.is_file():
+                continue
+            if name == INIT_FILE_NAME:
+                if not is_module_root:
+                    # The __init__.py of the root and of the subpackages are not documented
+                    continue
+                file_role = INIT_ROLE
+            else:
+                file_role = role
+            try:
+                stat = dir_entry.stat()
+            except FileNotFoundError:
+                # The file was removed while we were walking the folder
+                continue
+            entries.append(FileIndexEntry(dir_entry.path, file_role, stat.st_mtime_ns, stat.st_size))
+        for subfolder in subfolders:
+            FileIndex._scan_folder(subfolder, role, False, entries, folders, None)
+
+    def refresh(self) -> "FileIndex":
+        """Get the index of the files of the package now.
+
+        When no walked folder changed, the files can't have been added, removed or renamed:
+        only the known files are stat-ed. Otherwise the package is scanned again.
+
+        :return: The new index of the files of the package
+        :rtype: FileIndex
+        """
+        try:
+            for folder_path, mtime_ns in self.folders.items():
+                if os.stat(folder_path).st_mtime_ns != mtime_ns:
+                    return FileIndex.scan(self.folder_location)
+            entries = []
+            for entry in self.entries:
+                stat = os.stat(entry.path)
+                if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+                    entries.append(entry)
+                else:
+                    entries.append(FileIndexEntry(entry.path, entry.role, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            # A folder or a file was removed
+            return FileIndex.scan(self.folder_location)
+        return FileIndex(entries, self.folder_location, self.folders)
+
+    def __iter__(self) -> Iterator[FileIndexEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_paths(self) -> List[str]:
+        """Get the paths of the files
+
+        :return: The paths, in the order of the Project
+        :rtype: List[str]
+        """
+        return [entry.path for entry in self.entries]
+
+    def get_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Get the state of the files when the package was scanned
+
+        :return: For each file path, its mtime and size
+        :rtype: Dict[str, Tuple[int, int]]
+        """
+        return {entry.path: (entry.mtime_ns, entry.size) for entry in self.entries}
@@ -3,6 +3,8 @@ import ast
 from typing import Any, List, Tuple
 
 from src.dataclasses.Attribute import Attribute
+from src.profiling.Profiler import get_profiler
+from src.utils import intern_string
 
 
 class FileParser(ABC):
@@ -22,7 +24,7 @@ class FileParser(ABC):
         for definition, description in attributes_desc:
             attribute = Attribute()
             attribute.name = definition.target.id
-            attribute.attribute_type = ast.unparse(definition.annotation)
+            attribute.attribute_type = intern_string(ast.unparse(definition.annotation))
             doc_lines = description.value.value.split("\n\n    Example:")
             if len(doc_lines) == 1:
                 # This split is for exceptions
@@ -64,9 +66,23 @@ class FileParser(ABC):
                 ret.append((body[i], body[i + 1]))
         return ret
 
+    def get_source_and_tree(self, path: str) -> Tuple[str, ast.Module]:
+        """Read the file at the given path and parse it
+
+        :param path: The path to the file
+        :type path: str
+        :return: The content of the file and its tree
+        :rtype: Tuple[str, ast.Module]
+        """
+        profiler = get_profiler()
+        with profiler.span("read", path):
+            with open(path, "r") as source:
+                content = source.read()
+        with profiler.span("ast.parse", path):
+            return content, ast.parse(content)
+
     def get_tree(self, path: str) -> ast.Module:
-        with open(path, "r") as source:
-            return ast.parse(source.read())
+        return self.get_source_and_tree(path)[1]
 
     @abstractmethod
     def parse_file(self, file_path: str) -> Any:
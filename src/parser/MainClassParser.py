@@ -8,6 +8,9 @@ from src.dataclasses.main_class.MainClassMethod import MainClassMethod
 from src.dataclasses.main_class.MethodException import MethodException
 from src.dataclasses.main_class.MethodParameter import MethodParameter
 from src.parser.FileParser import FileParser
+from src.parser.SignatureExtractor import SignatureExtractor
+from src.profiling.Profiler import get_profiler
+from src.utils import intern_string
 
 
 class MainClassParser(FileParser):
@@ -33,20 +36,27 @@ class MainClassParser(FileParser):
                 ret[meta_desc.args[1]] = meta_desc.description
         return ret
 
-    def _parse_function(self, node: ast.stmt) -> MainClassMethod:
+    def _parse_function(self, node: ast.stmt, path: str, signatures: SignatureExtractor) -> MainClassMethod:
         """Transform an ast node to a MainClassMethod
 
         :param node: The node that we use
         :type node: ast.stmt
+        :param path: The path to the file of the node, used by the profiler
+        :type path: str
+        :param signatures: The extractor of the definitions of the file of the node
+        :type signatures: SignatureExtractor
         :return: The MainClassMethod
         :rtype: MainClassMethod
         """
+        profiler = get_profiler()
         ret = MainClassMethod()
         ret.name = node.name
-        ret.definition = ast.unparse(node).split('\n', 1)[0]
+        with profiler.span("definition", path):
+            ret.definition = signatures.get_definition(node)
         func_dostring = ast.get_docstring(node)
         if func_dostring:
-            docstring_obj = docstring_parser.parse(func_dostring)
+            with profiler.span("docstring_parser.parse", path):
+                docstring_obj = docstring_parser.parse(func_dostring)
             ret.short_description = docstring_obj.short_description
             if docstring_obj.long_description:
                 ret.long_description = docstring_obj.long_description
@@ -57,9 +67,9 @@ class MainClassParser(FileParser):
                 
                 ret.parameters.append(
                     MethodParameter(
-                        param.arg_name,
+                        intern_string(param.arg_name),
                         param.description,
-                        param.type_name,
+                        intern_string(param.type_name),
                         None if param.arg_name not in param_to_example else param_to_example[param.arg_name]
                         # TODO: Allow us to know if it is an optional or mandatory parameter
                     )
@@ -71,7 +81,7 @@ class MainClassParser(FileParser):
                 if len(ret_with_example) >= 2:
                     ret.example_response = ret_with_example[1]
             if docstring_obj.returns is not None:
-                ret.return_type = docstring_obj.returns.type_name
+                ret.return_type = intern_string(docstring_obj.returns.type_name)
             for exception in docstring_obj.raises:
                 ret.exceptions.append(
                     MethodException(
@@ -81,6 +91,32 @@ class MainClassParser(FileParser):
                 )
         return ret
 
+    def parse_class(self, node: ast.ClassDef, path: str, signatures: SignatureExtractor) -> MainClass:
+        """Transform the node of a main class to a MainClass
+
+        :param node: The node of the class
+        :type node: ast.ClassDef
+        :param path: The path to the file of the node, used by the profiler
+        :type path: str
+        :param signatures: The extractor of the definitions of the file of the node
+        :type signatures: SignatureExtractor
+        :return: The MainClass
+        :rtype: MainClass
+        """
+        ret = MainClass()
+        ret.name = node.name
+        class_docstring = ast.get_docstring(node)
+        if class_docstring:
+            ret.long_description = class_docstring
+            docstring_lines = class_docstring.split("\n", 1)
+            ret.short_description = docstring_lines[0]
+        for sub_node in node.body:
+            if isinstance(sub_node, ast.AsyncFunctionDef) or isinstance(sub_node, ast.FunctionDef):
+                # Remove private functions but keeps __init__
+                if not sub_node.name.startswith("_") or sub_node.name.startswith("__"):
+                    ret.methods.append(self._parse_function(sub_node, path, signatures))
+        return ret
+
     def parse_file(self, path: str) -> MainClass:
         """Parse the given file at path and transform it into a MainClass
         instance that we can then use to write the documentation
@@ -90,20 +126,10 @@ class MainClassParser(FileParser):
         :return: The class parsed
         :rtype: MainClass
         """
-        tree = self.get_tree(path)
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef):
-                ret = MainClass()
-                ret.name = node.name
-                class_docstring = ast.get_docstring(node)
-                if class_docstring:
-                    ret.long_description = class_docstring
-                    docstring_lines = class_docstring.split("\n", 1)
-                    ret.short_description = docstring_lines[0]
-                for sub_node in node.body:
-                    if isinstance(sub_node, ast.AsyncFunctionDef) or isinstance(sub_node, ast.FunctionDef):
-                        # Remove private functions but keeps __init__
-                        if not sub_node.name.startswith("_") or sub_node.name.startswith("__"):
-                            ret.methods.append(self._parse_function(sub_node))
-
-        return ret
+        source, tree = self.get_source_and_tree(path)
+        class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+        if not class_nodes:
+            return MainClass()
+        # A main file contains a single main class, see EntityExtractor for the files
+        # that contain many classes
+        return self.parse_class(class_nodes[-1], path, SignatureExtractor(source))
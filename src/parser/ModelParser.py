@@ -1,7 +1,6 @@
 import ast
-from typing import List, Tuple
-from src.dataclasses.Attribute import Attribute
 from src.parser.FileParser import FileParser
+from src.parser.SignatureExtractor import SignatureExtractor
 from src.dataclasses.Model import Model
 from src.utils import get_short_description
 
@@ -9,17 +8,33 @@ class ModelParser(FileParser):
     """Parse a file that is inside of the "models" folder
     """
 
-    def parse_file(self, file_path: str) -> Model:
-        tree = self.get_tree(file_path)
-        class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
-        ret = Model()
-        for node in class_nodes:
-            ret.name = node.name
-            ret.class_definition = f"class {node.name}"
-            class_docstring = ast.get_docstring(node)
-            if class_docstring:
-                ret.short_description = get_short_description(class_docstring)
-                ret.long_description = class_docstring
-            self.add_attributes_from_class_to_list(ret.attributes, node.body)
+    def parse_class(self, node: ast.ClassDef, path: str, signatures: SignatureExtractor) -> Model:
+        """Transform the node of a model class to a Model
 
+        :param node: The node of the class
+        :type node: ast.ClassDef
+        :param path: The path to the file of the node, used by the profiler
+        :type path: str
+        :param signatures: The extractor of the definitions of the file of the node
+        :type signatures: SignatureExtractor
+        :return: The Model
+        :rtype: Model
+        """
+        ret = Model()
+        ret.name = node.name
+        ret.class_definition = f"class {node.name}"
+        class_docstring = ast.get_docstring(node)
+        if class_docstring:
+            ret.short_description = get_short_description(class_docstring)
+            ret.long_description = class_docstring
+        self.add_attributes_from_class_to_list(ret.attributes, node.body)
         return ret
+
+    def parse_file(self, file_path: str) -> Model:
+        source, tree = self.get_source_and_tree(file_path)
+        class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+        if not class_nodes:
+            return Model()
+        # A file of the models folder contains a single model, see EntityExtractor
+        # for the files that contain many classes
+        return self.parse_class(class_nodes[-1], file_path, SignatureExtractor(source))
@@ -1,52 +1,235 @@
-from os import listdir
-from os.path import isfile, join
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from os.path import basename, dirname
+from typing import Any, Dict, List, Tuple
 
 from src.dataclasses.Project import Project
-from src.parser.ExceptionParser import ExceptionParser
+from src.incremental.Manifest import Manifest
+from src.incremental.ParseCache import ParseCache
+from src.parser.EntityExtractor import EntityExtractor
+from src.parser.FileIndex import EXCEPTION_ROLE, INIT_ROLE, MAIN_ROLE, MODEL_ROLE, FileIndex
+from src.parser.FileParser import FileParser
 from src.parser.InitParser import InitParser
-from src.parser.MainClassParser import MainClassParser
-from src.parser.ModelParser import ModelParser
+from src.profiling.Profiler import Profiler, get_profiler, set_profiler
+from src.utils import get_file_digest
+
+
+def _parse_in_worker(parser: FileParser, file_path: str, profile: bool) -> Tuple[Any, List[Tuple[str, str, float]]]:
+    """Parse a file inside of a worker process of the pool.
+
+    It is a module level function because the function given to the
+    pool must be picklable.
+
+    :param parser: The parser that we use for this file
+    :type parser: FileParser
+    :param file_path: The path to the file that we have to parse
+    :type file_path: str
+    :param profile: If the spans of the parser must be recorded
+    :type profile: bool
+    :return: The dataclass returned by the parser and the spans recorded while parsing it,
+             they are sent back to the profiler of the main process
+    :rtype: Tuple[Any, List[Tuple[str, str, float]]]
+    """
+    if not profile:
+        return parser.parse_file(file_path), []
+    profiler = Profiler()
+    set_profiler(profiler)
+    return parser.parse_file(file_path), profiler.spans
 
 
 class ProjectParser:
-    def __init__(self):
-        self._main_class_parser = MainClassParser()
+    def __init__(self, cache: ParseCache | None = None, jobs: int = 1):
+        """Create the parser of the project
+
+        :param cache: The persistent cache of the parsed files. If it is given, the files
+                      that didn't change since they were cached are not parsed, defaults to None
+        :type cache: ParseCache | None, optional
+        :param jobs: The amount of processes used to parse the files. With 1, the files
+                     are parsed inside of the current process, defaults to 1
+        :type jobs: int, optional
+        """
+        self._cache = cache
+        self._jobs = jobs
         self._module_init_parser = InitParser()
-        self._model_parser = ModelParser()
-        self._exception_parser = ExceptionParser()
-    
-    def parse_project(self, folder_location: str) -> Project:
+        self._entity_extractors = {role: EntityExtractor(role) for role in (MAIN_ROLE, MODEL_ROLE, EXCEPTION_ROLE)}
+        """The extractor of the files of each folder role"""
+        self._manifest: Manifest | None = None
+        self._digests: Dict[str, str] = {}
+        self._file_states: Dict[str, Tuple[int, int]] = {}
+        """The mtime and the size of the files found by the last scan of the package"""
+        self._locations: Dict[str, Tuple[str, FileParser, Any]] = {}
+        """For each parsed file, in the order of the project: its role, its parser and its
+        dataclass (FileEntities or ModuleInit)"""
+
+    def _list_files(self, file_index: FileIndex) -> List[Tuple[str, FileParser, str]]:
+        """List the files that we have to parse in the order in which they are
+        added to the Project.
+
+        :param file_index: The index of the files of the package
+        :type file_index: FileIndex
+        :return: For each file, its role ("main", "model", "exception" or "init"), the parser
+                 that we use for it and its path
+        :rtype: List[Tuple[str, FileParser, str]]
+        """
+        return [(entry.role, self._module_init_parser if entry.role == INIT_ROLE else self._entity_extractors[entry.role], entry.path)
+                for entry in file_index]
+
+    def _load_file(self, parser: FileParser, file_path: str) -> Any | None:
+        """Get the dataclass of the given file from the manifest or from the
+        persistent cache without parsing it
+
+        :param parser: The parser that we use for this file
+        :type parser: FileParser
+        :param file_path: The path to the file
+        :type file_path: str
+        :return: The dataclass of the file, or None if the file has to be parsed
+        :rtype: Any | None
+        """
+        ret = None
+        if self._manifest is not None:
+            digest = get_file_digest(file_path)
+            self._digests[file_path] = digest
+            ret = self._manifest.get_entity(file_path, digest)
+        if ret is None and self._cache is not None:
+            ret = self._cache.lookup(parser, file_path, self._file_states.get(file_path))
+            if ret is not None and self._manifest is not None:
+                self._manifest.set_entity(file_path, self._digests[file_path], ret)
+        return ret
+
+    def _store_file(self, parser: FileParser, file_path: str, entity: Any):
+        """Store the dataclass of a file that was parsed inside of the manifest
+        and of the persistent cache
+
+        :param parser: The parser that was used for this file
+        :type parser: FileParser
+        :param file_path: The path to the file
+        :type file_path: str
+        :param entity: The dataclass returned by the parser
+        :type entity: Any
+        """
+        if self._manifest is not None:
+            self._manifest.set_entity(file_path, self._digests[file_path], entity)
+        if self._cache is not None:
+            self._cache.store(parser, file_path, entity)
+
+    def _parse_files(self, files: List[Tuple[str, FileParser, str]]) -> List[Any]:
+        """Parse the given files.
+
+        The files that are found inside of the manifest or of the cache are not parsed. The
+        other ones are parsed inside of a process pool when we have more than one job.
+
+        :param files: The files returned by `_list_files`
+        :type files: List[Tuple[str, FileParser, str]]
+        :return: The dataclass of each file, in the same order as the given files
+        :rtype: List[Any]
+        """
+        profiler = get_profiler()
+        if self._manifest is None and self._cache is None:
+            ret = [None] * len(files)
+        else:
+            ret = []
+            for _, parser, file_path in files:
+                with profiler.span("load", file_path):
+                    ret.append(self._load_file(parser, file_path))
+        to_parse = [i for i, entity in enumerate(ret) if entity is None]
+        parsers = [files[i][1] for i in to_parse]
+        paths = [files[i][2] for i in to_parse]
+        if self._jobs > 1 and len(to_parse) > 1:
+            with ProcessPoolExecutor(max_workers=min(self._jobs, len(to_parse))) as executor:
+                # map returns the results in the order of the given files, which keeps
+                # the order of the Project (used for the sidebar positions) deterministic
+                chunksize = max(1, len(to_parse) // (self._jobs * 4))
+                profile = [profiler.enabled] * len(to_parse)
+                parsed = []
+                for entity, spans in executor.map(_parse_in_worker, parsers, paths, profile, chunksize=chunksize):
+                    parsed.append(entity)
+                    profiler.extend(spans)
+        else:
+            parsed = [parser.parse_file(file_path) for parser, file_path in zip(parsers, paths)]
+
+        for i, entity in zip(to_parse, parsed):
+            ret[i] = entity
+            self._store_file(files[i][1], files[i][2], entity)
+        return ret
+
+    def parse_project(self, folder_location: str, manifest: Manifest | None = None, file_index: FileIndex | None = None) -> Project:
         """Parse the given folder that contains our module to a
         Project that contains extracted documentation
 
         :param folder_location: The location of the folder that we have to parse
         :type folder_location: str
+        :param manifest: The manifest of the previous run. If it is given, only the files
+                         that changed since the previous run are parsed and the manifest
+                         is updated with the new files, defaults to None
+        :type manifest: Manifest | None, optional
+        :param file_index: The index of the files of the package if it was just scanned (for
+                           example by the watcher), the package is scanned otherwise, defaults to None
+        :type file_index: FileIndex | None, optional
         :return: The Project which has extracted docstrings
         :rtype: Project
         """
+        self._manifest = manifest
+        self._digests = {}
+        self._locations = {}
         ret = Project()
-        main_files_paths = [join(folder_location, f) for f in listdir(folder_location) if isfile(join(folder_location, f))]
-        for main_file in main_files_paths:
-            # Prevent parsing of __init__.py because we don't use it.
-            if "__init__.py" not in main_file:
-                ret.main_classes.append(self._main_class_parser.parse_file(main_file))
-
-        models_folder = join(folder_location, "models")
-        models_files = [f for f in listdir(models_folder) if isfile(join(models_folder, f))]
-        for model_file in models_files:
-            curr_model_path = join(models_folder, model_file)
-            if model_file == "__init__.py":
-                ret.init_doc["models"] = self._module_init_parser.parse_file(curr_model_path)
-            else:
-                ret.models.append(self._model_parser.parse_file(curr_model_path))
-
-        exceptions_folder = join(folder_location, "exceptions")
-        exceptions_files = [f for f in listdir(exceptions_folder) if isfile(join(exceptions_folder, f))]
-        for exception_file in exceptions_files:
-            curr_exception_path = join(exceptions_folder, exception_file)
-            if exception_file == "__init__.py":
-                ret.init_doc["exceptions"] = self._module_init_parser.parse_file(curr_exception_path)
+        if file_index is None:
+            file_index = FileIndex.scan(folder_location)
+        self._file_states = file_index.get_snapshot()
+        files = self._list_files(file_index)
+        entities = self._parse_files(files)
+        for (role, parser, file_path), entity in zip(files, entities):
+            self._locations[file_path] = (role, parser, entity)
+            if role == "init":
+                # The key is the name of the module: models or exceptions
+                ret.init_doc[basename(dirname(file_path))] = entity
             else:
-                ret.exceptions.append(self._exception_parser.parse_file(curr_exception_path))
+                # A file can contain many classes, of any kind
+                ret.main_classes.extend(entity.main_classes)
+                ret.models.extend(entity.models)
+                ret.exceptions.extend(entity.exceptions)
+
+        if manifest is not None:
+            # Forget about the files that were deleted since the previous run
+            manifest.retain_sources([file_path for _, _, file_path in files])
+        if self._cache is not None:
+            self._cache.prune()
+        return ret
+
+    def reparse_file(self, project: Project, file_path: str) -> List[Tuple[Any, Any]]:
+        """Parse again a single file of the project that was returned by the last call
+        to `parse_project` and replace its dataclasses inside of the project.
+
+        :param project: The project returned by the last call to `parse_project`
+        :type project: Project
+        :param file_path: The path of the file that changed, it must be one of the files
+                          parsed by `parse_project`
+        :type file_path: str
+        :return: Each previous dataclass of the file with the new one at the same position
+                 (MainClass, Model, ExceptionModel or ModuleInit). When a class was added or
+                 removed, the missing dataclass is None
+        :rtype: List[Tuple[Any, Any]]
+        """
+        role, parser, old_entity = self._locations[file_path]
+        self._digests = {}
+        # The file changed since the package was scanned
+        self._file_states.pop(file_path, None)
+        new_entity = self._parse_files([(role, parser, file_path)])[0]
+        self._locations[file_path] = (role, parser, new_entity)
+        if role == "init":
+            project.init_doc[basename(dirname(file_path))] = new_entity
+            return [(old_entity, new_entity)]
 
+        ret = []
+        for field_name in ("main_classes", "models", "exceptions"):
+            # The classes of the file are after the classes of the previous files
+            start = 0
+            for other_path, (other_role, _, other_entity) in self._locations.items():
+                if other_path == file_path:
+                    break
+                if other_role != "init":
+                    start += len(getattr(other_entity, field_name))
+            old_entities = getattr(old_entity, field_name)
+            new_entities = getattr(new_entity, field_name)
+            getattr(project, field_name)[start:start + len(old_entities)] = new_entities
+            ret.extend(zip_longest(old_entities, new_entities))
         return ret
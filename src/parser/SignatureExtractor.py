@@ -0,0 +1,122 @@
+import ast
+import copy
+from typing import List, Tuple
+
+
+class SignatureExtractor:
+    """Extract the definition of the functions and of the classes of a file.
+
+    The definition is the header of the function or of the class, for example:
+    async def amount_out(self, blockchain: str, exchange: str | None = None) -> List[AmountOut]:
+
+    It is sliced from the original source, this way we keep the formatting of the
+    signature and the cost only depends on the size of the signature (the body
+    with its big docstrings is never read or unparsed).
+    """
+
+    def __init__(self, source: str):
+        """Create the extractor of the given file
+
+        :param source: The content of the file
+        :type source: str
+        """
+        self._lines = source.splitlines(keepends=True)
+
+    def _get_signature_nodes(self, node: ast.stmt) -> List[ast.AST]:
+        """Get the nodes that are part of the definition of the function or of the class
+
+        :param node: The function or the class
+        :type node: ast.stmt
+        :return: The arguments, annotations, default values and return type of a function
+                 or the bases and keywords of a class
+        :rtype: List[ast.AST]
+        """
+        if isinstance(node, ast.ClassDef):
+            ret = node.bases + node.keywords
+        else:
+            args = node.args
+            ret = args.posonlyargs + args.args + args.kwonlyargs + args.defaults
+            ret += [arg for arg in (args.vararg, args.kwarg, node.returns) if arg is not None]
+            ret += [default for default in args.kw_defaults if default is not None]
+        # The type parameters only exist since Python 3.12
+        return ret + getattr(node, "type_params", [])
+
+    def _get_column(self, lineno: int, col_offset: int) -> int:
+        # col_offset is an offset in bytes of the UTF-8 encoded line
+        return len(self._lines[lineno - 1].encode()[:col_offset].decode())
+
+    def _find_colon(self, lineno: int, column: int) -> Tuple[int, int]:
+        """Find the ":" that ends the definition, starting at the given position.
+
+        Only brackets, commas, "*", "/", spaces and comments can be between the last
+        node of the definition and the ":", so the first ":" that is not inside of
+        a comment ends the definition.
+
+        :param lineno: The line at which we start, starting from 1
+        :type lineno: int
+        :param column: The column at which we start
+        :type column: int
+        :return: The line and the column of the ":"
+        :rtype: Tuple[int, int]
+        """
+        while lineno <= len(self._lines):
+            line = self._lines[lineno - 1]
+            for i in range(column, len(line)):
+                if line[i] == "#":
+                    break
+                if line[i] == ":":
+                    return lineno, i
+            lineno += 1
+            column = 0
+        raise ValueError("The end of the definition was not found")
+
+    def _slice_definition(self, node: ast.stmt) -> str:
+        """Slice the definition of the node from the source
+
+        :param node: The function or the class
+        :type node: ast.stmt
+        :return: The definition, ending with ":"
+        :rtype: str
+        """
+        signature_nodes = self._get_signature_nodes(node)
+        if len(signature_nodes) > 0:
+            last_node = max(signature_nodes, key=lambda n: (n.end_lineno, n.end_col_offset))
+            end_lineno, end_column = last_node.end_lineno, self._get_column(last_node.end_lineno, last_node.end_col_offset)
+        else:
+            end_lineno, end_column = node.lineno, self._get_column(node.lineno, node.col_offset)
+        colon_lineno, colon_column = self._find_colon(end_lineno, end_column)
+
+        start_column = self._get_column(node.lineno, node.col_offset)
+        if colon_lineno == node.lineno:
+            return self._lines[node.lineno - 1][start_column:colon_column + 1]
+        lines = [self._lines[node.lineno - 1][start_column:]]
+        lines.extend(self._lines[node.lineno:colon_lineno - 1])
+        lines.append(self._lines[colon_lineno - 1][:colon_column + 1])
+        return "".join(lines)
+
+    def _unparse_definition(self, node: ast.stmt) -> str:
+        """Unparse the definition of the node without its body
+
+        :param node: The function or the class
+        :type node: ast.stmt
+        :return: The definition, ending with ":"
+        :rtype: str
+        """
+        header = copy.copy(node)
+        header.body = [ast.Pass()]
+        header.decorator_list = []
+        return ast.unparse(header).split("\n", 1)[0]
+
+    def get_definition(self, node: ast.stmt) -> str:
+        """Get the definition of the given function or class
+
+        :param node: The function or the class, it must come from the source of the extractor
+        :type node: ast.stmt
+        :return: The definition, for example: "class PairNotFoundException(BlockchainAPIsException):"
+        :rtype: str
+        """
+        try:
+            return self._slice_definition(node)
+        except (IndexError, ValueError, UnicodeDecodeError):
+            # The source doesn't match the node, we build the definition from the node
+            return self._unparse_definition(node)
@@ -0,0 +1,114 @@
+from contextlib import contextmanager, nullcontext
+import time
+from typing import ContextManager, Dict, Iterable, Iterator, List, Tuple
+
+
+class Profiler:
+    """Collect the duration of each stage of the build.
+
+    A span is the duration of one stage (for example "ast.parse" or "write")
+    for one file (a source file or a generated page). The spans are then summed
+    by stage and by file inside of the report.
+
+    The profiler is only created when profiling is enabled, otherwise the
+    `NullProfiler` is used and the spans cost nothing.
+    """
+
+    enabled = True
+    """If the spans are recorded"""
+
+    def __init__(self):
+        self.spans: List[Tuple[str, str, float]] = []
+        """Each span as: the stage, the file and the duration in seconds"""
+
+    @contextmanager
+    def span(self, stage: str, file_path: str) -> Iterator[None]:
+        """Measure the duration of the code inside of the with block
+
+        :param stage: The name of the stage, for example "ast.parse"
+        :type stage: str
+        :param file_path: The source file or the page on which the stage runs
+        :type file_path: str
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # list.append is atomic, the writer threads can share the profiler
+            self.spans.append((stage, file_path, time.perf_counter() - start))
+
+    def extend(self, spans: Iterable[Tuple[str, str, float]]):
+        """Add the spans recorded by another profiler (for example inside of a worker process)
+
+        :param spans: The spans to add
+        :type spans: Iterable[Tuple[str, str, float]]
+        """
+        self.spans.extend(spans)
+
+    def get_report(self, top: int = 10) -> str:
+        """Get the per-stage and per-file breakdown of the recorded spans
+
+        :param top: The amount of files shown in the per-file breakdown, defaults to 10
+        :type top: int, optional
+        :return: The report, ready to be printed
+        :rtype: str
+        """
+        stages: Dict[str, List[float]] = {}
+        files: Dict[str, Dict[str, float]] = {}
+        for stage, file_path, duration in self.spans:
+            stage_total = stages.setdefault(stage, [0, 0.0])
+            stage_total[0] += 1
+            stage_total[1] += duration
+            file_stages = files.setdefault(file_path, {})
+            file_stages[stage] = file_stages.get(stage, 0.0) + duration
+
+        lines = [f"{'Stage':<30}{'Calls':>10}{'Total (ms)':>14}{'Mean (ms)':>14}"]
+        for stage, (calls, total) in sorted(stages.items(), key=lambda item: item[1][1], reverse=True):
+            lines.append(f"{stage:<30}{calls:>10}{total * 1000:>14.2f}{total * 1000 / calls:>14.3f}")
+
+        lines.append("")
+        lines.append(f"Slowest files (top {top}):")
+        slowest = sorted(files.items(), key=lambda item: sum(item[1].values()), reverse=True)[:top]
+        for file_path, file_stages in slowest:
+            breakdown = ", ".join(f"{stage}: {duration * 1000:.2f}ms"
+                                  for stage, duration in sorted(file_stages.items(), key=lambda item: item[1], reverse=True))
+            lines.append(f"{file_path}: {sum(file_stages.values()) * 1000:.2f}ms ({breakdown})")
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """The profiler that is used when profiling is disabled, it records nothing
+    """
+
+    enabled = False
+    """If the spans are recorded"""
+
+    _null_span = nullcontext()
+
+    def span(self, stage: str, file_path: str) -> ContextManager[None]:
+        return self._null_span
+
+    def extend(self, spans: Iterable[Tuple[str, str, float]]):
+        pass
+
+
+_profiler: Profiler | NullProfiler = NullProfiler()
+
+
+def get_profiler() -> Profiler | NullProfiler:
+    """Get the profiler of the current process
+
+    :return: The profiler, a `NullProfiler` if profiling is disabled
+    :rtype: Profiler | NullProfiler
+    """
+    return _profiler
+
+
+def set_profiler(profiler: Profiler | NullProfiler):
+    """Set the profiler of the current process
+
+    :param profiler: The profiler that records the spans from now on
+    :type profiler: Profiler | NullProfiler
+    """
+    global _profiler
+    _profiler = profiler
@@ -1,4 +1,7 @@
+import hashlib
 import re
+import sys
+from typing import Iterable, List
 
 def get_short_description(long_description: str) -> str:
     """Get the short description from a long description.
@@ -38,3 +41,131 @@ def is_native_type(obj: str) -> bool:
     :rtype: bool
     """
     return obj == "int" or obj == "str"
+
+TYPE_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+"""Match each name inside of a type, for example "List" and "Pair" in "List[Pair]"
+"""
+
+UNLINKED_TYPE_NAMES = {"List", "Dict", "Tuple", "Optional", "Union", "Any", "AsyncIterator",
+                       "Iterator", "Iterable", "None", "Exception", "bool", "float", "bytes"}
+"""The names that are written without a link because they are not part of our package
+"""
+
+def is_linked_type(name: str) -> bool:
+    """Verify if the given name inside of a type is written with a link to its page.
+
+    For example:
+    - "Pair" -> True
+    - "List" -> False
+    - "int" -> False
+
+    :param name: The name, for example "Pair"
+    :type name: str
+    :return: `True` if the name is a model or an exception of our package, `False` otherwise
+    :rtype: bool
+    """
+    return not is_native_type(name) and name not in UNLINKED_TYPE_NAMES
+
+def get_referenced_types(type_annotation: str) -> List[str]:
+    """Get the names of the models and exceptions that are linked when we write the given type.
+
+    For example:
+    - "List[Pair]" -> ["Pair"]
+    - "List[List[Reserve] | Exception]" -> ["Reserve"]
+    - "int" -> []
+
+    :param type_annotation: The type, as written inside of the source code
+    :type type_annotation: str
+    :return: The names of the models and exceptions referenced by the type
+    :rtype: List[str]
+    """
+    return [name for name in TYPE_NAME_PATTERN.findall(type_annotation) if is_linked_type(name)]
+
+ITERATED_TYPE_PATTERN = re.compile(r"AsyncIterator\[\s*([A-Za-z_][A-Za-z0-9_]*)\s*\]")
+"""Match an async iterator type and capture the type of its elements
+"""
+
+def get_iterated_type(type_annotation: str | None) -> str | None:
+    """Get the type of the elements given by an async iterator.
+
+    For example:
+    - "AsyncIterator[Pair]" -> "Pair"
+    - "List[Pair]" -> None
+
+    :param type_annotation: The type, as written inside of the source code
+    :type type_annotation: str | None
+    :return: The type of the elements if the type is an async iterator, `None` otherwise
+    :rtype: str | None
+    """
+    if type_annotation is None:
+        return None
+    match = ITERATED_TYPE_PATTERN.fullmatch(type_annotation.strip())
+    return match.group(1) if match is not None else None
+
+def intern_string(value: str | None) -> str | None:
+    """Intern a string that is repeated many times inside of the parsed project.
+
+    The types (for example "str", "int" or "List[Token]") and the names of the parameters
+    (for example "blockchain") are the same for thousands of attributes and parameters.
+    Once interned, all of them share the same string object instead of each one having
+    its own copy.
+
+    :param value: The string, for example the type of an attribute
+    :type value: str | None
+    :return: The interned string, or `None` if the value is `None`
+    :rtype: str | None
+    """
+    return sys.intern(value) if value is not None else None
+
+def is_documented_method(method_name: str) -> bool:
+    """Verify if a page is written for the method with the given name.
+
+    The private methods (like __aenter__ and __aexit__) are not documented,
+    except __init__.
+
+    :param method_name: The name of the method
+    :type method_name: str
+    :return: `True` if the method has its own page, `False` otherwise
+    :rtype: bool
+    """
+    return not method_name.startswith("_") or method_name == "__init__"
+
+def get_digest(content: bytes) -> str:
+    """Get the hexadecimal sha256 digest of the given content.
+
+    We use it to know if a source file or a generated page changed
+    between two runs.
+
+    :param content: The content that we have to hash
+    :type content: bytes
+    :return: The hexadecimal digest of the content
+    :rtype: str
+    """
+    return hashlib.sha256(content).hexdigest()
+
+def get_fragments_digest(fragments: Iterable[str]) -> str:
+    """Get the hexadecimal sha256 digest of the content made of the given fragments.
+
+    It is the same digest as the one of the concatenated fragments, without
+    having to concatenate them.
+
+    :param fragments: The fragments of the content
+    :type fragments: Iterable[str]
+    :return: The hexadecimal digest of the content
+    :rtype: str
+    """
+    ret = hashlib.sha256()
+    for fragment in fragments:
+        ret.update(fragment.encode())
+    return ret.hexdigest()
+
+def get_file_digest(path: str) -> str:
+    """Get the hexadecimal sha256 digest of the file at the given path
+
+    :param path: The path to the file that we have to hash
+    :type path: str
+    :return: The hexadecimal digest of the content of the file
+    :rtype: str
+    """
+    with open(path, "rb") as f:
+        return get_digest(f.read())
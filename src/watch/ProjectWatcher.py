@@ -0,0 +1,235 @@
+import time
+import traceback
+from typing import Any, Dict, List, Tuple
+
+from src.dataclasses.ExceptionModel import ExceptionModel
+from src.dataclasses.Model import Model
+from src.dataclasses.Project import Project
+from src.dataclasses.main_class.MainClass import MainClass
+from src.incremental.DependencyIndex import DependencyIndex
+from src.incremental.Manifest import Manifest
+from src.parser.FileIndex import FileIndex
+from src.parser.ProjectParser import ProjectParser
+from src.writer.Writer import SPECIAL_EXCEPTION_NAMES, Writer
+
+
+class ProjectWatcher:
+    """Watch the source folder and regenerate the documentation each time
+    a file changes.
+
+    The parsed Project is kept in memory. When a file is modified, only this file
+    is parsed again and only the pages generated from what changed inside of it
+    are written (for example a single method page when the docstring of a method
+    is modified).
+
+    When a file is added or removed, the whole project is parsed again, which stays
+    fast because the unchanged files are taken from the manifest.
+
+    The changes are detected by polling the mtime and the size of the files, this
+    way it works on every platform without any additional dependency. The package is
+    only walked again when one of its folders changed, otherwise only the known files
+    are stat-ed (see FileIndex.refresh).
+
+    A file is only marked as processed once its pages are written. When a file can't
+    be parsed (it may be saved while it is not valid yet), the pages of the other files
+    that changed are still written and the file is parsed again at the next change.
+    """
+
+    def __init__(self,
+                 folder_location: str,
+                 dest_path: str,
+                 parser: ProjectParser,
+                 writer: Writer,
+                 manifest: Manifest,
+                 interval: float = 0.05):
+        """Create the watcher
+
+        :param folder_location: The location of the folder that we parse
+        :type folder_location: str
+        :param dest_path: The folder in which the documentation is written
+        :type dest_path: str
+        :param parser: The parser of the project
+        :type parser: ProjectParser
+        :param writer: The writer of the documentation, it must use the given manifest
+        :type writer: Writer
+        :param manifest: The manifest shared by the parser and the writer
+        :type manifest: Manifest
+        :param interval: The amount of seconds between two checks of the files, defaults to 0.05
+        :type interval: float, optional
+        """
+        self._folder_location = folder_location
+        self._dest_path = dest_path
+        self._parser = parser
+        self._writer = writer
+        self._manifest = manifest
+        self._interval = interval
+        self._file_index: FileIndex | None = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        """The state of the files whose pages are written"""
+        self._failed_snapshot: Dict[str, Tuple[int, int]] | None = None
+        """The state of the files when the last update failed, it is not tried again
+        until a file changes"""
+        self._full_write_pending = False
+        """If the pages of the files that were parsed again could not be written"""
+
+    def _take_snapshot(self) -> Tuple[FileIndex, Dict[str, Tuple[int, int]]]:
+        """Get the mtime and the size of each file of the project
+
+        :return: The index of the files of the project (given back to the parser when the
+                 whole project is parsed again) and for each file path, its mtime and size
+        :rtype: Tuple[FileIndex, Dict[str, Tuple[int, int]]]
+        """
+        if self._file_index is None:
+            self._file_index = FileIndex.scan(self._folder_location)
+        else:
+            self._file_index = self._file_index.refresh()
+        return self._file_index, self._file_index.get_snapshot()
+
+    def _get_changed_sources(self, old_entity: Any, new_entity: Any, index: DependencyIndex) -> List[Any] | None:
+        """Get the dataclasses whose pages must be written again after a file changed
+
+        :param old_entity: The dataclass before the file changed, None if it was added
+        :type old_entity: Any
+        :param new_entity: The dataclass after the file changed, None if it was removed
+        :type new_entity: Any
+        :param index: The dependency index of the project after the change
+        :type index: DependencyIndex
+        :return: The dataclasses whose pages have to be written, or None if every page
+                 has to be checked again (for example when a method was renamed)
+        :rtype: List[Any] | None
+        """
+        if type(old_entity) is not type(new_entity):
+            # A class was added, removed or changed of kind, the sidebar positions may have changed
+            return None
+        if isinstance(new_entity, MainClass):
+            if old_entity.name != new_entity.name:
+                return None
+            if [method.name for method in old_entity.methods] != [method.name for method in new_entity.methods]:
+                # The sidebar position of the methods may have changed
+                return None
+            ret = []
+            if (old_entity.short_description, old_entity.long_description) != (new_entity.short_description, new_entity.long_description):
+                ret.append(new_entity)
+            for old_method, new_method in zip(old_entity.methods, new_entity.methods):
+                if old_method != new_method:
+                    ret.append(new_method)
+            return ret
+        if old_entity == new_entity:
+            return []
+        if isinstance(new_entity, (Model, ExceptionModel)):
+            if isinstance(new_entity, ExceptionModel) and old_entity.name != new_entity.name \
+                    and {old_entity.name, new_entity.name} & SPECIAL_EXCEPTION_NAMES:
+                # The sidebar position of the other exceptions depends on these names
+                return None
+            # The pages that link to the model are checked again. When it is renamed, the
+            # pages that link to the previous name are also checked and the page of the
+            # previous name is removed
+            ret = [new_entity]
+            for name in dict.fromkeys([old_entity.name, new_entity.name]):
+                ret.extend(index.dependents_of(name))
+            return ret
+        return [new_entity]
+
+    def _warn_dangling_references(self, index: DependencyIndex, sources: List[Any] | None):
+        """Print the links to a model or an exception that doesn't exist anymore
+
+        :param index: The dependency index of the project
+        :type index: DependencyIndex
+        :param sources: The dataclasses whose pages were written, or None if every page was written
+        :type sources: List[Any] | None
+        """
+        for source, name in index.get_dangling_references(sources):
+            print(f"Warning: the page of {source.name} links to {name} which doesn't exist")
+
+    def _update(self, project: Project, file_index: FileIndex, snapshot: Dict[str, Tuple[int, int]]) -> Tuple[Project, List[str]]:
+        """Update the project and the documentation after the files changed.
+
+        The state of the files inside of `self._snapshot` is only updated once their pages
+        are written. A file that can't be parsed keeps its previous state.
+
+        :param project: The project before the change
+        :type project: Project
+        :param file_index: The index of the files after the change
+        :type file_index: FileIndex
+        :param snapshot: The new snapshot of the files
+        :type snapshot: Dict[str, Tuple[int, int]]
+        :return: The updated project and the pages that were written
+        :rtype: Tuple[Project, List[str]]
+        """
+        if snapshot.keys() != self._snapshot.keys():
+            # A file was added or removed
+            project = self._parser.parse_project(self._folder_location, self._manifest, file_index)
+            self._warn_dangling_references(DependencyIndex(project), None)
+            written_pages = self._writer.write(project)
+            self._full_write_pending = False
+            self._snapshot = snapshot
+            return project, written_pages
+
+        changes = []
+        parsed_paths = []
+        for file_path, state in snapshot.items():
+            if self._snapshot[file_path] == state:
+                continue
+            try:
+                changes.extend(self._parser.reparse_file(project, file_path))
+            except Exception:
+                # The file may be saved while it is not valid yet, the other files are
+                # still written and this one is parsed again at its next change
+                traceback.print_exc()
+            else:
+                parsed_paths.append(file_path)
+        # The index is built once all of the files are parsed again, this way the
+        # dependents are the dataclasses that are inside of the updated project
+        index = DependencyIndex(project)
+        sources = None
+        if not self._full_write_pending:
+            sources = []
+            for old_entity, new_entity in changes:
+                changed_sources = self._get_changed_sources(old_entity, new_entity, index)
+                if changed_sources is None:
+                    sources = None
+                    break
+                sources.extend(changed_sources)
+        written_pages = []
+        # When sources is empty, only the formatting of the files changed
+        if sources is None or len(sources) > 0:
+            self._warn_dangling_references(index, sources)
+            # The files are already parsed again inside of the project, if the pages
+            # can't be written, all of them are written by the next update
+            self._full_write_pending = True
+            written_pages = self._writer.write(project, sources)
+            self._full_write_pending = False
+        for file_path in parsed_paths:
+            self._snapshot[file_path] = snapshot[file_path]
+        return project, written_pages
+
+    def watch(self, project: Project):
+        """Watch the source folder until the program is interrupted (Ctrl+C)
+
+        :param project: The project that was parsed and written before watching
+        :type project: Project
+        """
+        _, self._snapshot = self._take_snapshot()
+        print(f"Watching {self._folder_location} for changes, press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(self._interval)
+                file_index, snapshot = self._take_snapshot()
+                if snapshot == self._snapshot or snapshot == self._failed_snapshot:
+                    continue
+                start = time.perf_counter()
+                try:
+                    project, written_pages = self._update(project, file_index, snapshot)
+                except Exception:
+                    # The file may be saved while it is not valid yet, we keep watching
+                    # and try again on the next change
+                    traceback.print_exc()
+                    self._failed_snapshot = snapshot
+                else:
+                    self._manifest.save(self._dest_path)
+                    duration = (time.perf_counter() - start) * 1000
+                    print(f"Updated {len(written_pages)} page(s) in {duration:.1f}ms: {', '.join(written_pages)}")
+                    # The files that could not be parsed are tried again at the next change
+                    self._failed_snapshot = None if snapshot == self._snapshot else snapshot
+        except KeyboardInterrupt:
+            pass
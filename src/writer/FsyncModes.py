@@ -0,0 +1,6 @@
+FSYNC_MODES = ("none", "each", "end")
+"""The possible values for the fsync parameter of the Writer.
+
+It is kept in its own module, this way the command line can offer these choices
+without importing the Writer.
+"""
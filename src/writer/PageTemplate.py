@@ -0,0 +1,39 @@
+from string import Formatter
+from typing import Any, Iterator, List, Tuple
+
+
+class PageTemplate:
+    """A template of a part of a page, compiled once.
+
+    The template uses the `str.format` syntax with named fields only, for example:
+    "title: {title}\\n"
+
+    The template is split into its literal parts and its fields when it is created.
+    Rendering it then yields the literal parts and the values one after another
+    instead of building a new string, this way big values (like the example responses)
+    are never copied before being written to the page.
+    """
+
+    def __init__(self, template: str):
+        """Compile the template
+
+        :param template: The template, with named fields like "{title}"
+        :type template: str
+        """
+        self._parts: List[Tuple[str, str | None]] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if format_spec or conversion:
+                raise ValueError(f"Format specs and conversions are not supported in templates: {template}")
+            self._parts.append((literal, field_name))
+
+    def render(self, **values: Any) -> Iterator[str]:
+        """Render the template with the given values
+
+        :return: The fragments of the rendered template
+        :rtype: Iterator[str]
+        """
+        for literal, field_name in self._parts:
+            if literal:
+                yield literal
+            if field_name is not None:
+                yield str(values[field_name])
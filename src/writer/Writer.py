@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
 import sys
-from typing import List
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Set, Tuple
 from src.dataclasses.Attribute import Attribute
 from src.dataclasses.ExceptionModel import ExceptionModel
 from src.dataclasses.Model import Model
@@ -9,29 +11,291 @@ from src.dataclasses.ModuleInit import ModuleInit
 from src.dataclasses.Project import Project
 from src.dataclasses.main_class.MainClass import MainClass
 from src.dataclasses.main_class.MainClassMethod import MainClassMethod
-from src.utils import camel_to_dash_case, is_native_type
+from src.incremental.Manifest import Manifest
+from src.profiling.Profiler import get_profiler
+from src.utils import TYPE_NAME_PATTERN, camel_to_dash_case, get_fragments_digest, get_iterated_type, is_documented_method, is_linked_type
+from src.writer.FsyncModes import FSYNC_MODES
+from src.writer.PageTemplate import PageTemplate
+
+
+SPECIAL_EXCEPTION_NAMES = {"UnauthorizedException", "TooManyRequestsException"}
+"""The exceptions that are written at the end of the exceptions list, the sidebar
+position of the other exceptions depends on them
+"""
+
+
+METADATA_TEMPLATE = PageTemplate("""---
+title: {title}
+description: {description}
+sidebar_position: {sidebar_position}
+""")
+
+SIDEBAR_CLASS_NAME_TEMPLATE = PageTemplate("sidebar_class_name: {sidebar_class_name}\n")
+
+METHOD_HEADER_TEMPLATE = PageTemplate("""
+import CodeBlock from '@theme/CodeBlock';
+
+```py
+{definition}
+```
+""")
+
+USAGE_HEADER_TEMPLATE = PageTemplate("""```py
+import asyncio
+
+from {main_class_name} import {main_class_name}
+
+async def print_{method_name}():
+    # Create the {main_class_name} instance
+    # You can additionaly add an API key if you want
+    {instance_name} = {main_class_name}()
+    # {short_description}
+    {method_name} = await {instance_name}.{method_name}(""")
+
+USAGE_FOOTER_TEMPLATE = PageTemplate("""    print({method_name})
+    # We need to close our instance once we are done with BlockchainAPIs
+    await {main_class_name}.close()
+
+asyncio.run(print_{method_name}())
+```
+""")
+
+ITERATOR_USAGE_HEADER_TEMPLATE = PageTemplate("""```py
+import asyncio
+
+from {main_class_name} import {main_class_name}
+
+async def print_{method_name}():
+    # Create the {main_class_name} instance
+    # You can additionaly add an API key if you want
+    {instance_name} = {main_class_name}()
+    # {short_description}
+    async for {item_name} in {instance_name}.{method_name}(""")
+
+ITERATOR_USAGE_FOOTER_TEMPLATE = PageTemplate("""        print({item_name})
+    # We need to close our instance once we are done with BlockchainAPIs
+    await {main_class_name}.close()
+
+asyncio.run(print_{method_name}())
+```
+""")
+
+PARAMETER_DETAIL_TEMPLATE = PageTemplate("""
+- type: `{param_type}`
+- example: `{example}`
+
+""")
+
+ATTRIBUTE_DETAIL_TEMPLATE = PageTemplate("""- type: `{attribute_type}`
+- example: `{example}`
+
+""")
+
+MODEL_HEADER_TEMPLATE = PageTemplate("""
+import CodeBlock from '@theme/CodeBlock';
+
+```py
+@dataclass(slots=True, frozen=True)
+{class_definition}
+""")
+
+EXCEPTION_HEADER_TEMPLATE = PageTemplate("""
+```py
+{definition}
+```
+
+""")
+
+
+def _fsync_file(path: str):
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_folder(path: str):
+    """Flush the entries of a folder (the files created inside of it) to the disk
+
+    :param path: The path of the folder
+    :type path: str
+    """
+    # A folder can't be opened on Windows, its entries are flushed with the files
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 class Writer:
 
-    def __init__(self, dest_path: str):
+    def __init__(self, dest_path: str, manifest: Manifest | None = None, jobs: int = 1, fsync: str = "none"):
+        """Create the writer of the documentation
+
+        :param dest_path: The folder in which the documentation is written
+        :type dest_path: str
+        :param manifest: The manifest of the previous run. If it is given, the writer runs in
+                         incremental mode: the destination folder can already exist and only
+                         the pages whose content changed are written, defaults to None
+        :type manifest: Manifest | None, optional
+        :param jobs: The amount of threads that render and write the pages, defaults to 1
+        :type jobs: int, optional
+        :param fsync: When the written pages are flushed to the disk:
+                      - "none": we let the operating system decide
+                      - "each": each page is flushed after being written
+                      - "end": the pages written by `write` and their folders are flushed
+                        once, at the end of `write`
+                      defaults to "none"
+        :type fsync: str, optional
+        """
+        if fsync not in FSYNC_MODES:
+            raise ValueError(f"Invalid fsync mode: {fsync}, expected one of: {', '.join(FSYNC_MODES)}")
         self._dest_path = dest_path
+        self._manifest = manifest
+        self._jobs = jobs
+        self._fsync = fsync
+        self._pages: Dict[str, Tuple[Callable[[], Iterable[str]], Any]] = {}
+        self._changed_pages: List[str] = []
+        self._exception_names: Set[str] = set()
         self._verify_folder()
 
     def _verify_folder(self):
-        if os.path.exists(self._dest_path):
+        if os.path.exists(self._dest_path) and self._manifest is None:
             print(f"Destination path: {self._dest_path} exists, can't run the program")
             sys.exit(1)
 
     def _create_folder_in_dest(self, folder: str):
-        os.mkdir(os.path.join(self._dest_path, folder))
+        os.makedirs(os.path.join(self._dest_path, folder), exist_ok=self._manifest is not None)
 
     def _create_dest_folder(self):
-        os.mkdir(self._dest_path)
+        os.makedirs(self._dest_path, exist_ok=self._manifest is not None)
         self._create_folder_in_dest("models")
         self._create_folder_in_dest("exceptions")
 
-    def _get_metadata(self, title: str, description: str, sidebar_position: int, sidebar_class_name: str | None = None) -> str:
+    def _add_page(self, page_path: str, render: Callable[[], Iterable[str]], source: Any):
+        """Register a page that will be rendered and written by `_emit_pages`.
+
+        When two pages have the same path (for example two methods with the same
+        name), the last one wins like if they were written one after another.
+
+        :param page_path: The path of the page relative to the destination folder
+        :type page_path: str
+        :param render: The function that returns the fragments of the content of the page
+        :type render: Callable[[], Iterable[str]]
+        :param source: The parsed dataclass from which the page is generated (MainClass,
+                       MainClassMethod, Model, ExceptionModel or ModuleInit)
+        :type source: Any
+        """
+        self._pages[page_path] = (render, source)
+
+    def _write_page(self, page_path: str, fragments: Iterable[str]):
+        """Write the given content to the page.
+
+        The fragments are streamed to the file one after another, the content of the
+        page is never built as a single string.
+
+        In incremental mode, the page is only written if its content changed
+        since the previous run.
+
+        :param page_path: The path of the page relative to the destination folder
+        :type page_path: str
+        :param fragments: The fragments of the content of the page
+        :type fragments: Iterable[str]
+        """
+        full_path = os.path.join(self._dest_path, page_path)
+        if self._manifest is not None:
+            # We need the digest before writing, so we keep the fragments
+            fragments = list(fragments)
+            digest = get_fragments_digest(fragments)
+            if self._manifest.is_output_unchanged(page_path, digest) and os.path.isfile(full_path):
+                return
+            self._manifest.outputs[page_path] = digest
+        self._changed_pages.append(page_path)
+        with open(full_path, "w+") as f:
+            f.writelines(fragments)
+            if self._fsync == "each":
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _emit_page(self, page_path: str, render: Callable[[], Iterable[str]]):
+        profiler = get_profiler()
+        if not profiler.enabled:
+            self._write_page(page_path, render())
+            return
+        # The fragments are rendered before being written, this way the time spent to
+        # render the page is not counted as time spent to write it
+        with profiler.span("render", page_path):
+            fragments = list(render())
+        with profiler.span("write", page_path):
+            self._write_page(page_path, fragments)
+
+    def _emit_pages(self, sources: Collection[Any] | None = None):
+        """Render and write the registered pages.
+
+        With more than one job, the pages are rendered and written concurrently by a
+        pool of threads, which hides the latency of each write on slow file systems.
+
+        :param sources: If given, only the pages generated from one of these dataclasses
+                        are rendered and written, defaults to None
+        :type sources: Collection[Any] | None, optional
+        """
+        pages = [(page_path, render) for page_path, (render, _) in self._pages.items()]
+        if sources is not None:
+            source_ids = {id(source) for source in sources}
+            pages = [(page_path, render) for page_path, (render, source) in self._pages.items() if id(source) in source_ids]
+        if self._jobs > 1:
+            with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+                futures = [executor.submit(self._emit_page, page_path, render) for page_path, render in pages]
+                for future in futures:
+                    # Raise the first exception that happened inside of a thread
+                    future.result()
+        else:
+            for page_path, render in pages:
+                self._emit_page(page_path, render)
+
+        if self._fsync == "end":
+            self._sync_pages()
+
+    def _sync_pages(self):
+        """Flush the pages written by this run to the disk, then the folders in which
+        they were created.
+
+        Only the pages whose content changed are flushed (not the pages that were skipped
+        in incremental mode, and not the other files of the machine like os.sync would).
+        With more than one job, the pages are flushed by a pool of threads.
+        """
+        page_paths = [os.path.join(self._dest_path, page_path) for page_path in self._changed_pages]
+        if len(page_paths) == 0:
+            return
+        # The folders of the main classes are created inside of the destination folder
+        folders = {os.path.dirname(page_path) for page_path in page_paths} | {self._dest_path}
+        if self._jobs > 1:
+            with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+                list(executor.map(_fsync_file, page_paths))
+        else:
+            for page_path in page_paths:
+                _fsync_file(page_path)
+        for folder in folders:
+            _fsync_folder(folder)
+
+    def _remove_stale_pages(self):
+        """Remove the pages that were written during the previous run but that
+        don't exist anymore (for example a method or a model that was removed).
+
+        The folders that become empty are also removed.
+        """
+        stale_pages = [page_path for page_path in self._manifest.outputs if page_path not in self._pages]
+        for page_path in stale_pages:
+            del self._manifest.outputs[page_path]
+            full_path = os.path.join(self._dest_path, page_path)
+            if os.path.isfile(full_path):
+                os.remove(full_path)
+            folder = os.path.dirname(full_path)
+            if os.path.isdir(folder) and len(os.listdir(folder)) == 0:
+                os.rmdir(folder)
+
+    def _get_metadata(self, title: str, description: str, sidebar_position: int, sidebar_class_name: str | None = None) -> Iterator[str]:
         """Create the metadata header for the given file
 
         :param title: The title of the file
@@ -43,33 +307,34 @@ class Writer:
         :param sidebar_class_name: If we are in a description of th main file, we put the
                                    class name here. If not, then we create a normal header
         :type sidebar_class_name: str | None
-        :return: The metadata that we wrote
-        :rtype: str
+        :return: The fragments of the metadata that we wrote
+        :rtype: Iterator[str]
         """
-        ret = "---\n"
-        ret += f"title: {title}\n"
-        ret += f"description: {description}\n"
-        ret += f"sidebar_position: {sidebar_position}\n"
+        yield from METADATA_TEMPLATE.render(title=title, description=description, sidebar_position=sidebar_position)
         if sidebar_class_name is not None:
-            ret += f"sidebar_class_name: {sidebar_class_name}\n"
-        ret += "---\n"
-        
-        return ret
-
-    def _create_module_main_file(self, folder_name: str, class_name: str, short_description: str, folder_sidebar_position: int, long_description: str):
-        to_write = self._get_metadata(class_name, short_description, folder_sidebar_position, f"sidebar-{folder_name}")
-        to_write += "\n"
-
-        to_write += long_description
-
-        with open(os.path.join(self._dest_path, folder_name, f"{folder_name}.md"), "w+") as f:
-            f.write(to_write)
+            yield from SIDEBAR_CLASS_NAME_TEMPLATE.render(sidebar_class_name=sidebar_class_name)
+        yield "---\n"
+
+    def _render_module_main_file(self, folder_name: str, class_name: str, short_description: str, folder_sidebar_position: int, long_description: str) -> Iterator[str]:
+        yield from self._get_metadata(class_name, short_description, folder_sidebar_position, f"sidebar-{folder_name}")
+        yield "\n"
+        yield long_description
+
+    def _create_module_main_file(self, folder_name: str, class_name: str, short_description: str, folder_sidebar_position: int, long_description: str, source: Any):
+        self._add_page(os.path.join(folder_name, f"{folder_name}.md"),
+                       partial(self._render_module_main_file,
+                               folder_name,
+                               class_name,
+                               short_description,
+                               folder_sidebar_position,
+                               long_description),
+                       source)
 
     def _write_main_file(self, folder: str, project: Project, sidebar_position: int):
         main_file_desc: ModuleInit = project.init_doc[folder]
-        self._create_module_main_file(folder, folder, main_file_desc.short_description.replace("\n", " "), sidebar_position, main_file_desc.long_description)
+        self._create_module_main_file(folder, folder, main_file_desc.short_description.replace("\n", " "), sidebar_position, main_file_desc.long_description, main_file_desc)
 
-    def _get_usage(self, method: MainClassMethod, main_class_name: str) -> str:
+    def _get_usage(self, method: MainClassMethod, main_class_name: str) -> Iterator[str]:
         """Get the usage of a method. Example return value:
 
         ```py
@@ -98,107 +363,111 @@ class Writer:
 
         :param method: The method that we have to use
         :type method: MainClassMethod
-        :return: The usage string
-        :rtype: str
+        :return: The fragments of the usage
+        :rtype: Iterator[str]
         """
         instance_name = camel_to_dash_case(main_class_name).replace("-", "_")
-        ret = f'''```py
-import asyncio
-
-from {main_class_name} import {main_class_name}
-
-async def print_{method.name}():
-    # Create the {main_class_name} instance
-    # You can additionaly add an API key if you want
-    {instance_name} = {main_class_name}()
-    # {method.short_description}
-    {method.name} = await {instance_name}.{method.name}('''
+        # The methods that return an AsyncIterator are used with "async for"
+        item_type = get_iterated_type(method.return_type)
+        if item_type is not None:
+            item_name = camel_to_dash_case(item_type).replace("-", "_")
+            header_template, footer_template, end = ITERATOR_USAGE_HEADER_TEMPLATE, ITERATOR_USAGE_FOOTER_TEMPLATE, "):\n"
+        else:
+            item_name = method.name
+            header_template, footer_template, end = USAGE_HEADER_TEMPLATE, USAGE_FOOTER_TEMPLATE, ")\n"
+        yield from header_template.render(main_class_name=main_class_name,
+                                          instance_name=instance_name,
+                                          method_name=method.name,
+                                          item_name=item_name,
+                                          short_description=method.short_description)
         if len(method.parameters) > 0:
-            ret += "\n"
+            yield "\n"
             for param in method.parameters:
                 example = f'"{param.example}"' if param.param_type == "str" else param.example
-                ret += f"        {param.name}={example}\n"
+                yield f"        {param.name}={example}\n"
 
-            ret += f'    )\n'
+            yield '    ' + end
         else:
-            ret += ")\n"
-        ret += f'''    print({method.name})
-    # We need to close our instance once we are done with BlockchainAPIs
-    await {main_class_name}.close()
+            yield end
+        yield from footer_template.render(main_class_name=main_class_name, method_name=method.name, item_name=item_name)
 
-asyncio.run(print_{method.name}())
-```
-'''
-
-        return ret
-
-    def _write_object(self, object_to_write: str) -> str:
-        to_write = '<CodeBlock language="python">\n'
-        if "List" in object_to_write:
-            list_object = object_to_write.replace("List[", "")
-            list_object = list_object.replace("]", "")
-            # We don't need a link because it is a native Python type
-            if is_native_type(list_object):
-                link_to_return_type = list_object
-            else:
-                link_to_return_type = f'<a href="/docs/python-sdk/models/{camel_to_dash_case(list_object)}">{list_object}</a>'
-            to_write += f'    List[{link_to_return_type}]\n'
-        elif is_native_type(object_to_write):
-            to_write += f'    {object_to_write}\n'
-        else:
-            to_write += f'    <a href="/docs/python-sdk/models/{camel_to_dash_case(object_to_write)}">{object_to_write}</a>'
-            to_write += "\n"
-        
-        to_write += '</CodeBlock>\n\n'
-        return to_write
+    def _get_type_link(self, type_name: str) -> str:
+        """Get the text of a name inside of a type, with a link to its page if it
+        is one of our models or exceptions
 
-    def _write_method(self, folder_name: str, method: MainClassMethod, main_class_name: str, sidebar_position: int):
-        to_write = self._get_metadata(method.name, method.short_description, sidebar_position)
-        to_write += "\n"
-        to_write += "import CodeBlock from '@theme/CodeBlock';\n\n"
-        to_write += "```py\n"
-        to_write += method.definition
-        to_write += "\n```\n"
-        to_write += method.long_description
+        :param type_name: The name, for example "Pair"
+        :type type_name: str
+        :return: The name with its link, for example: <a href="/docs/python-sdk/models/pair">Pair</a>
+        :rtype: str
+        """
+        # We don't need a link for the native Python types
+        if not is_linked_type(type_name):
+            return type_name
+        folder = "exceptions" if type_name in self._exception_names else "models"
+        return f'<a href="/docs/python-sdk/{folder}/{camel_to_dash_case(type_name)}">{type_name}</a>'
+
+    def _write_object(self, object_to_write: str) -> Iterator[str]:
+        """Write the given type, each model or exception inside of the type has a
+        link to its page. For example:
+        List[List[Reserve] | Exception]
+
+        :param object_to_write: The type to write
+        :type object_to_write: str
+        :return: The fragments of the type
+        :rtype: Iterator[str]
+        """
+        yield '<CodeBlock language="python">\n'
+        yield "    "
+        yield TYPE_NAME_PATTERN.sub(lambda match: self._get_type_link(match.group(0)), object_to_write)
+        yield "\n"
+        yield '</CodeBlock>\n\n'
+
+    def _render_method(self, method: MainClassMethod, main_class_name: str, sidebar_position: int) -> Iterator[str]:
+        yield from self._get_metadata(method.name, method.short_description, sidebar_position)
+        yield from METHOD_HEADER_TEMPLATE.render(definition=method.definition)
+        yield method.long_description
         if len(method.parameters) > 0:
-            to_write += "\n\n## Parameters\n\n"
+            yield "\n\n## Parameters\n\n"
             for parameter in method.parameters:
-                to_write += f" - [{parameter.name}](#{parameter.name}): {parameter.description}\n"
+                yield f" - [{parameter.name}](#{parameter.name}): {parameter.description}\n"
         if method.return_type is not None:
-            to_write += "\n## Returns\n\n"
-            to_write += self._write_object(method.return_type)
-            to_write += method.return_description
+            yield "\n## Returns\n\n"
+            yield from self._write_object(method.return_type)
+            yield method.return_description
         else:
-            to_write += "\n"
+            yield "\n"
 
         if method.example_response is not None:
-            to_write += "## Example\n\n"
-            to_write += "### Usage\n\n"
-            to_write += self._get_usage(method, main_class_name)
-            to_write += "\n"
-            to_write += "### Example response\n\n"
-            to_write += method.example_response
+            yield "## Example\n\n"
+            yield "### Usage\n\n"
+            yield from self._get_usage(method, main_class_name)
+            yield "\n"
+            yield "### Example response\n\n"
+            yield method.example_response
             if len(method.exceptions) > 0:
-                to_write += "\n## Exceptions\n\n"
+                yield "\n## Exceptions\n\n"
                 for exception in method.exceptions:
-                    to_write += f'- [{exception.exception}](/docs/python-sdk/exceptions/{camel_to_dash_case(exception.exception)}): {exception.description}\n'
+                    if exception.exception in self._exception_names:
+                        yield f'- [{exception.exception}](/docs/python-sdk/exceptions/{camel_to_dash_case(exception.exception)}): {exception.description}\n'
+                    else:
+                        # The builtin exceptions (ValueError...) don't have a page
+                        yield f'- {exception.exception}: {exception.description}\n'
         if len(method.parameters) > 0:
-            to_write += "\n## Parameters detailed"
-            to_write += "\n"
+            yield "\n## Parameters detailed"
+            yield "\n"
             for parameter in method.parameters:
-                to_write += f"### {parameter.name}\n\n"
-                to_write += parameter.description
-                to_write += "\n"
-                to_write += f'- type: `{parameter.param_type}`\n'
-                to_write += f'- example: `{parameter.example}`\n'
-                to_write += "\n"
+                yield f"### {parameter.name}\n\n"
+                yield parameter.description
+                yield from PARAMETER_DETAIL_TEMPLATE.render(param_type=parameter.param_type, example=parameter.example)
 
+    def _write_method(self, folder_name: str, method: MainClassMethod, main_class_name: str, sidebar_position: int):
         if method.name == "__init__":
             filename = "init"
         else:
             filename = method.name.replace('_', '-')
-        with open(os.path.join(self._dest_path, folder_name, f"{filename}.mdx"), "w+") as f:
-            f.write(to_write)
+        self._add_page(os.path.join(folder_name, f"{filename}.mdx"),
+                       partial(self._render_method, method, main_class_name, sidebar_position),
+                       method)
 
     def _write_main_class(self, main_class: MainClass, folder_sidebar_position: int):
         folder_name = camel_to_dash_case(main_class.name)
@@ -207,69 +476,71 @@ asyncio.run(print_{method.name}())
                                       main_class.name,
                                       main_class.short_description,
                                       folder_sidebar_position,
-                                      main_class.long_description)
+                                      main_class.long_description,
+                                      main_class)
         sidebar_position = 1
         for method in main_class.methods:
             # remove __aexit__ and __aenter__
-            if not method.name.startswith("_") or method.name == "__init__":
+            if is_documented_method(method.name):
                 self._write_method(folder_name, method, main_class.name, sidebar_position)
                 sidebar_position += 1
 
-    def _add_attributes(self, attributes: List[Attribute]) -> str:
-        ret = ""
+    def _add_attributes(self, attributes: List[Attribute]) -> Iterator[str]:
         for attribute in attributes:
-            ret += f"### {attribute.name}\n\n"
-            ret += attribute.attribute_description
-            ret += "\n"
+            yield f"### {attribute.name}\n\n"
+            yield attribute.attribute_description
+            yield "\n"
             if "List" in attribute.attribute_type:
-                ret += "#### Type\n\n"
-                ret += self._write_object(attribute.attribute_type)
-                ret += "\n"
-                ret += "#### Example\n\n"
-                ret += "```json"
-                ret += attribute.example
-                ret += "```\n\n"
+                yield "#### Type\n\n"
+                yield from self._write_object(attribute.attribute_type)
+                yield "\n"
+                yield "#### Example\n\n"
+                yield "```json"
+                yield attribute.example
+                yield "```\n\n"
             else:
-                ret += f'- type: `{attribute.attribute_type}`\n'
-                ret += f'- example: `{attribute.example}`\n\n'
+                yield from ATTRIBUTE_DETAIL_TEMPLATE.render(attribute_type=attribute.attribute_type, example=attribute.example)
 
-        return ret
+    def _render_model(self, model: Model, sidebar_index: int) -> Iterator[str]:
+        yield from self._get_metadata(model.name, model.short_description, sidebar_index)
+        yield from MODEL_HEADER_TEMPLATE.render(class_definition=model.class_definition)
+        for attribute in model.attributes:
+            yield f"    {attribute.name}: {attribute.attribute_type}\n"
+        yield "```\n\n"
+        yield model.long_description
+        yield "\n## Attributes\n\n"
+        yield from self._add_attributes(model.attributes)
 
     def _write_model(self, model: Model, sidebar_index: int):
         file_name = camel_to_dash_case(model.name)
-        to_write = self._get_metadata(model.name, model.short_description, sidebar_index)
-        to_write += "\n"
-        to_write += "import CodeBlock from '@theme/CodeBlock';\n\n"
-        to_write += "```py\n"
-        to_write += "@dataclass(slots=True, frozen=True)\n"
-        to_write += model.class_definition
-        to_write += "\n"
-        for attribute in model.attributes:
-            to_write += f"    {attribute.name}: {attribute.attribute_type}\n"
-        to_write += "```\n\n"
-        to_write += model.long_description
-        to_write += "\n## Attributes\n\n"
-        to_write += self._add_attributes(model.attributes)
+        self._add_page(os.path.join("models", file_name + ".mdx"), partial(self._render_model, model, sidebar_index), model)
 
-        with open(os.path.join(self._dest_path, "models", file_name + ".mdx"), "w+") as f:
-            f.write(to_write)
+    def _render_exception(self, exception: ExceptionModel, sidebar_index: int) -> Iterator[str]:
+        yield from self._get_metadata(exception.name, exception.short_description, sidebar_index)
+        yield from EXCEPTION_HEADER_TEMPLATE.render(definition=exception.definition)
+        yield exception.long_description
+        yield "\n\n## Params\n\n"
+        yield from self._add_attributes(exception.attributes)
 
     def _write_exception(self, exception: ExceptionModel, sidebar_index: int):
         file_name = camel_to_dash_case(exception.name)
-        to_write = self._get_metadata(exception.name, exception.short_description, sidebar_index)
-        to_write += "\n"
-        to_write += "```py\n"
-        to_write += exception.definition
-        to_write += "\n```\n\n"
-        to_write += exception.long_description
-        to_write += "\n\n"
-        to_write += "## Params\n\n"
-        to_write += self._add_attributes(exception.attributes)
-
-        with open(os.path.join(self._dest_path, "exceptions", file_name + ".md"), "w+") as f:
-            f.write(to_write)
-
-    def write(self, project: Project):
+        self._add_page(os.path.join("exceptions", file_name + ".md"), partial(self._render_exception, exception, sidebar_index), exception)
+
+    def write(self, project: Project, sources: Collection[Any] | None = None) -> List[str]:
+        """Write the documentation of the given project
+
+        :param project: The parsed project
+        :type project: Project
+        :param sources: If given, only the pages generated from one of these dataclasses (MainClass,
+                        MainClassMethod, Model, ExceptionModel or ModuleInit) are rendered and written.
+                        It is used to only regenerate the pages of a file that changed, defaults to None
+        :type sources: Collection[Any] | None, optional
+        :return: The paths (relative to the destination folder) of the pages that were written
+        :rtype: List[str]
+        """
+        self._pages = {}
+        self._changed_pages = []
+        self._exception_names = {exception.name for exception in project.exceptions}
         self._create_dest_folder()
         folder_sidebar_position = 1
         for main_class in project.main_classes:
@@ -297,3 +568,9 @@ asyncio.run(print_{method.name}())
             else:
                 exception_sidebar_index += 1
             self._write_exception(exception, curr_index)
+
+        self._emit_pages(sources)
+
+        if self._manifest is not None:
+            self._remove_stale_pages()
+        return self._changed_pages